@@ -1,23 +1,56 @@
 #utils.py
 
-import time
 import functools
+import logging
+import time
+
+from Utils.metrics import REGISTRY
+
+logger = logging.getLogger("gensumai")
+
+
+def _labels(func, args) -> dict:
+    """model/task/fn labels taken from the adapter the method is bound to."""
+    owner = args[0] if args else None
+    model = (
+        getattr(owner, "model_name", None)
+        or getattr(owner, "_model_name", None)
+        or ""
+    )
+    task = getattr(owner, "task", None) or type(owner).__name__
+    return {"model": str(model), "task": task, "fn": func.__name__}
+
 
 def log_action(func):
-    """Decorator: log function calls."""
+    """Decorator: count calls (and errors); debug-log argument sizes, never contents."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"[LOG] Calling {func.__name__} with args={args[1:]}, kwargs={kwargs}")
-        return func(*args, **kwargs)
+        if not REGISTRY.enabled:
+            return func(*args, **kwargs)
+        labels = _labels(func, args)
+        REGISTRY.counter("gensumai_calls_total", "Model calls", labels).inc()
+        if logger.isEnabledFor(logging.DEBUG):
+            sizes = [len(a) if hasattr(a, "__len__") else type(a).__name__ for a in args[1:]]
+            logger.debug("%s.%s sizes=%s kwargs=%s", labels["task"], func.__name__, sizes, sorted(kwargs))
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            REGISTRY.counter("gensumai_call_errors_total", "Model calls that raised", labels).inc()
+            raise
     return wrapper
 
+
 def measure_time(func):
-    """Decorator: measure runtime of functions."""
+    """Decorator: record runtime into the gensumai_call_seconds histogram."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        elapsed = time.time() - start
-        print(f"[TIME] {func.__name__} took {elapsed:.2f}s")
-        return result
+        if not REGISTRY.enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            REGISTRY.histogram(
+                "gensumai_call_seconds", "Model call latency", _labels(func, args)
+            ).observe((time.perf_counter_ns() - start) / 1e9)
     return wrapper
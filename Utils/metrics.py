@@ -0,0 +1,203 @@
+#metrics.py
+
+import bisect
+import json
+import os
+import threading
+
+
+# Default latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Default batch-size buckets
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def _label_str(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+
+
+class Counter:
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str = "", labels=None):
+        self.name = name
+        self.help_text = help_text
+        self.labels = dict(labels or {})
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self):
+        return self._value
+
+    def snapshot(self):
+        return self._value
+
+    def prometheus_lines(self):
+        yield f"{self.name}{_label_str(self.labels)} {self._value}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down (queue depth, resident bytes...)."""
+
+    kind = "gauge"
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus style), safe to observe from any thread."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str = "", buckets=LATENCY_BUCKETS, labels=None):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.labels = dict(labels or {})
+        self._counts = [0] * (len(self.buckets) + 1)   # last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            cumulative, total = [], 0
+            for c in self._counts:
+                total += c
+                cumulative.append(total)
+            return {
+                "buckets": dict(zip([*map(str, self.buckets), "+Inf"], cumulative)),
+                "sum": self._sum,
+                "count": self._count,
+            }
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-th quantile (0-1) by interpolating inside its bucket."""
+        with self._lock:
+            counts, total = list(self._counts), self._count
+        if not total:
+            return 0.0
+        rank, seen = q * total, 0
+        for i, c in enumerate(counts):
+            if c and seen + c >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / c
+            seen += c
+        return self.buckets[-1]
+
+    def _label_str(self, extra=None) -> str:
+        return _label_str(dict(self.labels, **(extra or {})))
+
+    def prometheus_lines(self):
+        snap = self.snapshot()
+        for le, count in snap["buckets"].items():
+            yield f"{self.name}_bucket{self._label_str({'le': le})} {count}"
+        yield f"{self.name}_sum{self._label_str()} {snap['sum']}"
+        yield f"{self.name}_count{self._label_str()} {snap['count']}"
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics keyed by name and labels.
+
+    counter()/gauge()/histogram() return the existing series for a
+    (name, labels) pair or create it, so call sites need no setup.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._series = {}   # (name, sorted label items) → metric
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, labels, **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._series.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._series.get(key)
+                if metric is None:
+                    metric = cls(name, help_text, labels=labels, **kwargs)
+                    self._series[key] = metric
+        if type(metric) is not cls:
+            raise TypeError(f"metric '{name}' is a {metric.kind}, not a {cls.kind}")
+        return metric
+
+    def counter(self, name: str, help_text: str = "", labels=None) -> Counter:
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str = "", labels=None) -> Gauge:
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str = "", labels=None,
+                  buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, labels, buckets=buckets)
+
+    def series(self, name: str = None):
+        with self._lock:
+            items = list(self._series.values())
+        return [m for m in items if name is None or m.name == name]
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    # ------------------ Export ------------------
+    def snapshot(self) -> dict:
+        """JSON-friendly {name: {type, help, series: [{labels, value}]}}."""
+        out = {}
+        for m in self.series():
+            entry = out.setdefault(m.name, {"type": m.kind, "help": m.help_text, "series": []})
+            entry["series"].append({"labels": m.labels, "value": m.snapshot()})
+        return out
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format."""
+        groups = {}
+        for m in self.series():
+            groups.setdefault(m.name, []).append(m)
+        lines = []
+        for name, metrics in sorted(groups.items()):
+            lines.append(f"# HELP {name} {metrics[0].help_text}")
+            lines.append(f"# TYPE {name} {metrics[0].kind}")
+            for m in metrics:
+                lines.extend(m.prometheus_lines())
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str):
+        _write_atomic(path, json.dumps(self.snapshot(), indent=2))
+
+    def write_prometheus(self, path: str):
+        _write_atomic(path, self.prometheus())
+
+
+def _write_atomic(path: str, text: str):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+# Shared registry; GENSUMAI_METRICS=0 turns the decorators into pass-throughs
+REGISTRY = MetricsRegistry(enabled=os.environ.get("GENSUMAI_METRICS", "1") != "0")
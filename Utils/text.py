@@ -0,0 +1,44 @@
+#text.py
+
+import re
+
+
+# Sentence end (optionally followed by a closing quote/bracket), whitespace,
+# then something that can start a sentence
+_BOUNDARY = re.compile(
+    r"(?:(?<=[.!?…])|(?<=[.!?…][\"'”’)\]]))\s+(?=[\"'“‘(\[]?[A-Z0-9À-ÖØ-Þ])"
+)
+
+# Tokens ending in "." that usually do not end a sentence
+ABBREVIATIONS = {
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr.", "st.", "vs.", "etc.",
+    "e.g.", "i.e.", "inc.", "ltd.", "co.", "no.", "fig.", "approx.", "u.s.", "u.k.",
+}
+
+PARAGRAPH_BREAK = re.compile(r"(\n[ \t]*\n\s*)")
+
+
+def _is_abbreviation(piece: str) -> bool:
+    last = piece.rsplit(None, 1)[-1].lower() if piece.strip() else ""
+    # Listed abbreviations and single initials ("J.")
+    return last in ABBREVIATIONS or bool(re.fullmatch(r"[a-z]\.", last))
+
+
+def split_sentences(text: str):
+    """Split one line of prose into sentences (whitespace between them is dropped)."""
+    pieces = [p for p in _BOUNDARY.split(text.strip()) if p]
+    sentences = []
+    for piece in pieces:
+        if sentences and _is_abbreviation(sentences[-1]):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
+
+
+def split_words(sentence: str, max_words: int):
+    """Break an over-long sentence into runs of at most max_words words."""
+    words = sentence.split()
+    if len(words) <= max_words:
+        return [sentence]
+    return [" ".join(words[i:i + max_words]) for i in range(0, len(words), max_words)]
@@ -0,0 +1,70 @@
+# autotune.py
+"""
+Pick torch thread settings for this machine by running the benchmark
+workload (tiny models, see suite.py) once per candidate thread count.
+"""
+
+from benchmarks.suite import bench_in_child, environment, prepare
+from model.cpu_config import cpu_count
+from model.tasks import TASKS
+
+
+OBJECTIVES = {
+    "throughput": ("throughput_items_s", max),
+    "latency": ("latency_p50_ms", min),
+}
+
+
+def candidate_threads(max_threads: int = None):
+    """1, 2, 4, ... up to the CPU count (always including the CPU count)."""
+    top = max_threads or cpu_count()
+    counts, n = [], 1
+    while n < top:
+        counts.append(n)
+        n *= 2
+    counts.append(top)
+    return counts
+
+
+def autotune(tasks=None, candidates=None, objective: str = "throughput", samples: int = 16,
+             repeats: int = 2, batch_size: int = 8, workdir: str = None,
+             interop: int = 1, on_result=None) -> dict:
+    """
+    Benchmark every task at each candidate intra-op thread count.
+
+    Returns "best_alone", the best count per task when it runs by itself,
+    and "models", the best count per task within an even split of the
+    cores; "models" is what gets saved, so all tasks can run at once
+    without oversubscription. "sweeps" holds every measurement.
+    """
+    metric, pick = OBJECTIVES[objective]
+    tasks = list(tasks or TASKS)
+    candidates = list(candidates or candidate_threads())
+    dirs, texts, images = prepare(workdir, samples)
+    share = max(1, cpu_count() // len(tasks))
+
+    sweeps, best_alone, models = {}, {}, {}
+    for task in tasks:
+        inputs = images if task == "image" else texts
+        rows = []
+        for threads in candidates:
+            r = bench_in_child(
+                task, dirs[task], inputs, None, repeats, batch_size,
+                threads=threads, interop=interop,
+            )
+            rows.append({"threads": threads, **r})
+            if on_result:
+                on_result(task, threads, r)
+        sweeps[task] = rows
+        best_alone[task] = pick(rows, key=lambda r: r[metric])["threads"]
+        within = [r for r in rows if r["threads"] <= share] or rows[:1]
+        models[task] = pick(within, key=lambda r: r[metric])["threads"]
+
+    return {
+        "meta": dict(environment(samples, repeats, batch_size), objective=objective),
+        "intra_op": max(best_alone.values()),
+        "inter_op": interop,
+        "models": models,
+        "best_alone": best_alone,
+        "sweeps": sweeps,
+    }
@@ -0,0 +1,153 @@
+# import_time.py
+"""
+Startup import budget. Each entry point is imported in a fresh interpreter
+under `python -X importtime`. The check fails if the import pulls in a
+heavy library (torch, transformers, ...), fails to import, or takes
+longer than the budget. A missing GUI toolkit is replaced by a stub so
+the GUI's own imports are still checked.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 400 --runs 5 gui.app
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry points that must start without loading any model code
+DEFAULT_TARGETS = ("model", "model.tasks", "cli", "server", "gui.app")
+
+# Libraries that may only be imported when a model is loaded
+HEAVY_MODULES = ("torch", "transformers", "tokenizers", "optimum", "onnxruntime")
+
+# Optional GUI toolkits: stubbed when not installed (a display-less server need not have them)
+GUI_MODULES = ("customtkinter", "tkinter")
+
+DEFAULT_BUDGET_MS = 500.0
+
+# Module stand-in: any attribute is a do-nothing class, so `ctk.CTkFrame` can be
+# subclassed and `ctk.set_appearance_mode(...)` called at import time
+_STUB = """
+import sys, types
+class _Stub(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cls = type(name, (), {"__init__": lambda self, *a, **k: None,
+                              "__getattr__": lambda self, n: (lambda *a, **k: None)})
+        setattr(self, name, cls)
+        return cls
+for _name in %r:
+    sys.modules[_name] = _Stub(_name)
+"""
+
+
+class ImportFailed(RuntimeError):
+    """The target raised while importing; `missing` names the module not found, if any."""
+
+    def __init__(self, message: str, missing: str = None):
+        super().__init__(message)
+        self.missing = missing
+
+
+def import_profile(target: str, stubs=()):
+    """
+    Import target in a fresh interpreter (with stub modules for stubs);
+    return (cumulative ms, imported module names).
+    """
+    code = (_STUB % (tuple(stubs),) if stubs else "") + f"import {target}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed"
+        match = re.search(r"No module named '([\w.]+)'", last)
+        raise ImportFailed(last, match.group(1).split(".")[0] if match else None)
+
+    total_us, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue   # header row
+        name = name.rstrip()
+        modules.add(name.strip())
+        if not name.startswith("  "):   # top-level import
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def check(targets=DEFAULT_TARGETS, budget_ms: float = DEFAULT_BUDGET_MS, runs: int = 3):
+    """Return one result dict per target; result["ok"] is False on a violation."""
+    results = []
+    for target in targets:
+        top = target.split(".")[0]
+        if importlib.util.find_spec(top) is None:
+            results.append({"target": target, "ok": False, "error": "not found", "heavy": []})
+            continue
+        stubs = []
+        try:
+            while True:
+                try:
+                    import_profile(target, stubs)   # warm the bytecode cache
+                    break
+                except ImportFailed as e:
+                    # Only a missing GUI toolkit is replaced; anything else is a failure
+                    if e.missing not in GUI_MODULES or e.missing in stubs:
+                        raise
+                    stubs.append(e.missing)
+            timings, modules = [], set()
+            for _ in range(runs):
+                ms, modules = import_profile(target, stubs)
+                timings.append(ms)
+        except ImportFailed as e:
+            # e.g. an eager `import torch` on a machine without torch
+            heavy = [e.missing] if e.missing in HEAVY_MODULES else []
+            results.append({"target": target, "ok": False, "error": str(e), "heavy": heavy})
+            continue
+        heavy = sorted(m for m in HEAVY_MODULES if m in modules)
+        ms = statistics.median(timings)
+        results.append({
+            "target": target,
+            "ms": round(ms, 1),
+            "heavy": heavy,
+            "stubbed": stubs,
+            "ok": not heavy and ms <= budget_ms,
+        })
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_TARGETS))
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="max median import time per target")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for r in check(args.targets, args.budget_ms, args.runs):
+        extra = f"  heavy imports: {', '.join(r['heavy'])}" if r["heavy"] else ""
+        if "error" in r:
+            print(f"FAIL {r['target']}: {r['error']}{extra}")
+            failed += 1
+            continue
+        status = "ok  " if r["ok"] else "FAIL"
+        if r["stubbed"]:
+            extra += f"  (stubbed: {', '.join(r['stubbed'])})"
+        print(f"{status} {r['target']}: {r['ms']:.0f} ms (budget {args.budget_ms:.0f}){extra}")
+        failed += not r["ok"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# precision.py
+"""Compare latency, memory and output drift of the precision modes per model."""
+
+import gc
+import io
+import time
+from difflib import SequenceMatcher
+
+from model.tasks import load_model, run_batch
+from Utils.stats import percentile, rss_bytes
+
+
+def torch_module(adapter):
+    """The underlying torch model of any adapter."""
+    if hasattr(adapter, "model"):
+        return adapter.model
+    if hasattr(adapter, "pipeline"):
+        return adapter.pipeline.model
+    return adapter._ensure_pipeline().model
+
+
+def state_dict_bytes(module) -> int:
+    """Serialized weight size; counts packed int8 weights correctly."""
+    import torch
+
+    buf = io.BytesIO()
+    torch.save(module.state_dict(), buf)
+    return buf.tell()
+
+
+def similarity(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def compare_precisions(task: str, samples, precisions=("fp32", "int8"), params: dict = None,
+                       lang: str = "French", loader=load_model):
+    """
+    Load the task model once per precision, run every sample one at a time
+    and compare against the first precision in the list.
+
+    Returns one row per precision with load time, weight size, RSS growth,
+    latency percentiles and drift (mean text similarity and exact-match rate
+    versus the baseline outputs).
+    """
+    samples = list(samples)
+    params = dict(params or {})
+    if task == "generation":
+        params["do_sample"] = False   # drift only makes sense for deterministic output
+    rows, baseline = [], None
+
+    for precision in precisions:
+        gc.collect()
+        rss_before = rss_bytes()
+        start = time.perf_counter()
+        adapter = loader(task, lang, precision)
+        load_s = time.perf_counter() - start
+        rss_after = rss_bytes()
+
+        run_batch(adapter, task, samples[:1], params, batch_size=1)   # warm-up
+        outputs, latencies = [], []
+        for sample in samples:
+            t0 = time.perf_counter()
+            outputs.extend(run_batch(adapter, task, [sample], params, batch_size=1))
+            latencies.append(1000 * (time.perf_counter() - t0))
+
+        row = {
+            "precision": getattr(adapter, "precision", precision),
+            "requested": precision,
+            "load_s": round(load_s, 3),
+            "weights_mb": round(state_dict_bytes(torch_module(adapter)) / 2**20, 1),
+            "rss_delta_mb": round((rss_after - rss_before) / 2**20, 1),
+            "latency_p50_ms": round(percentile(latencies, 50), 1),
+            "latency_p95_ms": round(percentile(latencies, 95), 1),
+        }
+        if baseline is None:
+            baseline = outputs
+            row.update(similarity=1.0, exact_match=1.0)
+        else:
+            sims = [similarity(a, b) for a, b in zip(baseline, outputs)]
+            row["similarity"] = round(sum(sims) / len(sims), 4) if sims else 0.0
+            row["exact_match"] = round(
+                sum(a == b for a, b in zip(baseline, outputs)) / len(outputs), 4
+            ) if outputs else 0.0
+        rows.append(row)
+
+        del adapter
+        gc.collect()
+    return rows
+
+
+def format_table(rows) -> str:
+    cols = ["precision", "load_s", "weights_mb", "rss_delta_mb",
+            "latency_p50_ms", "latency_p95_ms", "similarity", "exact_match"]
+    widths = [max(len(c), *(len(str(r[c])) for r in rows)) for c in cols]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(cols, widths))]
+    for r in rows:
+        lines.append("  ".join(str(r[c]).ljust(w) for c, w in zip(cols, widths)))
+    return "\n".join(lines)
@@ -0,0 +1,188 @@
+# suite.py
+"""
+Offline benchmark suite: cold load, warm single-request latency, batched
+throughput and peak RSS for every task, on tiny random-weight models.
+
+Each task runs in a fresh (spawned) process so load time and peak RSS are
+not polluted by the other tasks. Results are plain JSON, and compare()
+flags metrics that regressed past a threshold versus a stored baseline.
+"""
+
+import contextlib
+import datetime
+import multiprocessing
+import os
+import platform
+import tempfile
+import time
+
+from model.summary_model import PRESETS
+from model.tasks import TASKS, load_model, run_batch, run_one
+from Utils.stats import percentile
+
+
+# Generation settings per task (deterministic so runs are comparable).
+# TextGenerator's max_length counts the prompt, and sample prompts reach ~200 tokens.
+TASK_PARAMS = {
+    "generation": {"max_length": 256, "do_sample": False},
+    "summarization": {"max_length": 64, "min_length": 10},
+    "translation": {},
+    "image": {},
+}
+
+# metric → True if lower is better
+METRICS = {
+    "cold_load_s": True,
+    "latency_p50_ms": True,
+    "latency_p95_ms": True,
+    "throughput_items_s": False,
+    "peak_rss_mb": True,
+}
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def bench_task(task: str, model_dir: str, inputs, params: dict = None,
+               repeats: int = 3, batch_size: int = 8, single: int = 8) -> dict:
+    """Measure one task in the current process."""
+    params = dict(TASK_PARAMS.get(task, {}) if params is None else params)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        adapter = load_model(task, model_name=model_dir)
+        cold_load = time.perf_counter() - start
+
+        run_one(adapter, task, inputs[0], params)   # warm-up
+        latencies = []
+        for _ in range(repeats):
+            for item in inputs[:single]:
+                t0 = time.perf_counter()
+                run_one(adapter, task, item, params)
+                latencies.append(1000 * (time.perf_counter() - t0))
+
+        t0 = time.perf_counter()
+        run_batch(adapter, task, inputs, params, batch_size=batch_size)
+        batch_s = time.perf_counter() - t0
+
+    return {
+        "cold_load_s": round(cold_load, 4),
+        "latency_p50_ms": round(percentile(latencies, 50), 2),
+        "latency_p95_ms": round(percentile(latencies, 95), 2),
+        "throughput_items_s": round(len(inputs) / batch_s, 2) if batch_s else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "items": len(inputs),
+        "batch_size": batch_size,
+        "params": params,
+    }
+
+
+def _bench_in_child(args, threads=None, interop=None):
+    os.environ["HF_HUB_OFFLINE"] = "1"
+    os.environ["TRANSFORMERS_OFFLINE"] = "1"
+    if threads or interop:
+        from model import cpu_config
+
+        cpu_config.configure(intra_op=threads, inter_op=interop)
+        cpu_config.apply()
+    return bench_task(*args)
+
+
+def prepare(workdir: str = None, samples: int = 16):
+    """Build the tiny models (once per workdir); return (model dirs, texts, image paths)."""
+    from benchmarks.tiny_models import build_all, sample_images, sample_texts
+
+    workdir = workdir or os.path.join(tempfile.gettempdir(), "gensumai-bench")
+    dirs = build_all(os.path.join(workdir, "models"))
+    return dirs, sample_texts(samples), sample_images(os.path.join(workdir, "images"), samples)
+
+
+def bench_in_child(task, model_dir, inputs, params=None, repeats=3, batch_size=8,
+                   threads=None, interop=None) -> dict:
+    """bench_task() in a fresh spawned process (optionally with torch thread counts)."""
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(
+            _bench_in_child,
+            ((task, model_dir, inputs, params, repeats, batch_size), threads, interop),
+        )
+
+
+def run_suite(tasks=None, samples: int = 16, repeats: int = 3, batch_size: int = 8,
+              workdir: str = None, param_sets: dict = None) -> dict:
+    """
+    Build the tiny models (once per workdir) and benchmark each task.
+
+    param_sets maps a result name to (task, params) to benchmark extra
+    parameter variants, e.g. {"summarization[fast]": ("summarization", {...})}.
+    """
+    dirs, texts, images = prepare(workdir, samples)
+    runs = {t: (t, None) for t in (tasks or TASKS)}
+    runs.update(param_sets or {})
+
+    results = {}
+    for name, (task, params) in runs.items():
+        inputs = images if task == "image" else texts
+        results[name] = bench_in_child(task, dirs[task], inputs, params, repeats, batch_size)
+    return {"meta": environment(samples, repeats, batch_size), "results": results}
+
+
+def preset_param_sets() -> dict:
+    """One benchmark run per summarization preset ("summarization[fast]", ...)."""
+    return {
+        f"summarization[{preset}]": ("summarization", dict(TASK_PARAMS["summarization"], preset=preset))
+        for preset in PRESETS
+    }
+
+
+def environment(samples, repeats, batch_size) -> dict:
+    meta = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "samples": samples,
+        "repeats": repeats,
+        "batch_size": batch_size,
+    }
+    for mod in ("torch", "transformers"):
+        try:
+            meta[mod] = __import__(mod).__version__
+        except Exception:
+            pass
+    return meta
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.10):
+    """Return metrics worse than baseline by more than threshold (a fraction)."""
+    regressions = []
+    for name, cur in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric, lower_is_better in METRICS.items():
+            if metric not in cur or not base.get(metric):
+                continue
+            change = (cur[metric] - base[metric]) / base[metric]
+            worse = change > threshold if lower_is_better else change < -threshold
+            if worse:
+                regressions.append({
+                    "task": name, "metric": metric,
+                    "baseline": base[metric], "current": cur[metric],
+                    "change": round(change, 4),
+                })
+    return regressions
+
+
+def format_results(report: dict) -> str:
+    cols = list(METRICS)
+    rows = [(name, *(str(r.get(c, "")) for c in cols)) for name, r in report["results"].items()]
+    header = ("task", *cols)
+    widths = [max(len(h), *(len(r[i]) for r in rows)) for i, h in enumerate(header)]
+    lines = ["  ".join(h.ljust(w) for h, w in zip(header, widths))]
+    lines += ["  ".join(v.ljust(w) for v, w in zip(r, widths)) for r in rows]
+    return "\n".join(lines)
@@ -0,0 +1,139 @@
+# tiny_models.py
+"""
+Tiny random-weight checkpoints with the same architectures as the real
+models (BART, GPT-2, Marian, ViT), written to a local directory so the
+benchmark suite runs offline. Only speed is meaningful, not output quality.
+"""
+
+import os
+import random
+
+
+VOCAB_WORDS = 480
+SPECIAL_TOKENS = ["<pad>", "<s>", "</s>", "<unk>"]
+PAD_ID, BOS_ID, EOS_ID, UNK_ID = range(4)
+IMAGE_SIZE = 64
+NUM_LABELS = 10
+# Bump when the checkpoints change so stale workdirs are rebuilt
+BUILD_STAMP = "tiny-models-v2"
+
+
+def _words():
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < VOCAB_WORDS:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(2, 8))))
+    return sorted(words)
+
+
+def build_tokenizer():
+    """Word-level fast tokenizer over a fixed synthetic vocabulary."""
+    from tokenizers import Tokenizer, models, pre_tokenizers, decoders, processors
+    from transformers import PreTrainedTokenizerFast
+
+    vocab = {tok: i for i, tok in enumerate(SPECIAL_TOKENS)}
+    for w in _words() + [".", ","]:
+        vocab[w] = len(vocab)
+    tok = Tokenizer(models.WordLevel(vocab=vocab, unk_token="<unk>"))
+    tok.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+    tok.decoder = decoders.WordPiece(prefix="##")   # joins tokens with spaces
+    tok.post_processor = processors.TemplateProcessing(
+        single="<s> $A </s>", special_tokens=[("<s>", BOS_ID), ("</s>", EOS_ID)]
+    )
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tok, pad_token="<pad>", bos_token="<s>",
+        eos_token="</s>", unk_token="<unk>", model_max_length=1024,
+        # No token_type_ids: generate() on BART/GPT-2 rejects them
+        model_input_names=["input_ids", "attention_mask"],
+    )
+
+
+def sample_texts(n: int, min_words: int = 20, max_words: int = 200, seed: int = 0):
+    """Deterministic synthetic sentences drawn from the tiny vocabulary."""
+    rng = random.Random(seed)
+    words = _words()
+    texts = []
+    for _ in range(n):
+        count = rng.randint(min_words, max_words)
+        body = [rng.choice(words) for _ in range(count)]
+        for i in range(12, count, 12):
+            body[i] += "."
+        texts.append(" ".join(body))
+    return texts
+
+
+def sample_images(directory: str, n: int, seed: int = 0):
+    """Write n random-noise JPEGs (larger than the model input, to exercise resizing)."""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(n):
+        img = Image.frombytes("RGB", (320, 240), rng.randbytes(320 * 240 * 3))
+        path = os.path.join(directory, f"sample_{i:03d}.jpg")
+        img.save(path, quality=85)
+        paths.append(path)
+    return paths
+
+
+def _seq2seq_kwargs(vocab_size):
+    return dict(
+        vocab_size=vocab_size, d_model=64, encoder_layers=2, decoder_layers=2,
+        encoder_attention_heads=4, decoder_attention_heads=4,
+        encoder_ffn_dim=128, decoder_ffn_dim=128, max_position_embeddings=1024,
+        pad_token_id=PAD_ID, bos_token_id=BOS_ID, eos_token_id=EOS_ID,
+    )
+
+
+def build_all(root: str, seed: int = 0) -> dict:
+    """
+    Save tiny checkpoints under root and return {task: model_dir}.
+    Directories from a build with the current BUILD_STAMP are reused.
+    """
+    import torch
+    from transformers import (
+        BartConfig, BartForConditionalGeneration,
+        GPT2Config, GPT2LMHeadModel,
+        MarianConfig, MarianMTModel,
+        ViTConfig, ViTForImageClassification, ViTImageProcessor,
+    )
+
+    torch.manual_seed(seed)
+    dirs = {t: os.path.join(root, t) for t in ("summarization", "generation", "translation", "image")}
+    stamp = os.path.join(root, BUILD_STAMP)
+    if os.path.isfile(stamp) and all(
+        os.path.isfile(os.path.join(d, "config.json")) for d in dirs.values()
+    ):
+        return dirs
+
+    tokenizer = build_tokenizer()
+    vocab_size = len(tokenizer)
+
+    bart = BartForConditionalGeneration(BartConfig(
+        **_seq2seq_kwargs(vocab_size), decoder_start_token_id=EOS_ID, forced_eos_token_id=EOS_ID,
+    ))
+    gpt2 = GPT2LMHeadModel(GPT2Config(
+        vocab_size=vocab_size, n_positions=1024, n_embd=64, n_layer=2, n_head=4,
+        bos_token_id=BOS_ID, eos_token_id=EOS_ID,
+    ))
+    marian = MarianMTModel(MarianConfig(
+        **_seq2seq_kwargs(vocab_size), decoder_start_token_id=PAD_ID,
+        decoder_vocab_size=vocab_size, share_encoder_decoder_embeddings=True,
+    ))
+    vit = ViTForImageClassification(ViTConfig(
+        image_size=IMAGE_SIZE, patch_size=16, hidden_size=64, num_hidden_layers=2,
+        num_attention_heads=4, intermediate_size=128, num_labels=NUM_LABELS,
+        id2label={i: f"class_{i}" for i in range(NUM_LABELS)},
+        label2id={f"class_{i}": i for i in range(NUM_LABELS)},
+    ))
+    processor = ViTImageProcessor(size={"height": IMAGE_SIZE, "width": IMAGE_SIZE})
+
+    for task, model in (("summarization", bart), ("generation", gpt2), ("translation", marian)):
+        model.save_pretrained(dirs[task])
+        tokenizer.save_pretrained(dirs[task])
+    vit.save_pretrained(dirs["image"])
+    processor.save_pretrained(dirs["image"])
+    open(stamp, "w").close()
+    return dirs
@@ -0,0 +1,404 @@
+# cli.py
+"""
+Headless entry point: run the model adapters over an input file without the
+GUI (no customtkinter / display needed).
+
+    python3 cli.py run --task summarization --input reports.txt --output out.jsonl
+    python3 cli.py run --task translation --lang German --input data.csv --column text
+    python3 cli.py precision --task summarization --input samples.txt --precisions fp32,int8
+    python3 cli.py bench --output bench.json --baseline baseline.json
+    python3 cli.py autotune --save
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+
+from model import cpu_config
+from model.batching import DEFAULT_BATCH_SIZE
+from model.onnx_backend import BACKENDS
+from model.precision import PRECISIONS
+from model.process_model import EXECUTION_MODES
+from model.scheduler import JobScheduler, Priority
+from model.summary_model import DEFAULT_PRESET, PRESETS
+from model.tasks import TASKS, load_model, run_batch
+from Utils.metrics import REGISTRY
+from Utils.stats import percentile
+
+
+# ------------------ Input / output ------------------
+def read_inputs(path: str, fmt: str = None, field: str = "text", column: str = "text"):
+    """Read inputs from plain text lines, JSONL (one field) or CSV (one column)."""
+    if fmt is None:
+        ext = os.path.splitext(path)[1].lower()
+        fmt = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}.get(ext, "txt")
+
+    f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            if column not in (reader.fieldnames or []):
+                raise ValueError(f"CSV has no column '{column}' (found: {reader.fieldnames})")
+            return [row[column].strip() for row in reader if (row[column] or "").strip()]
+        if fmt == "jsonl":
+            items = []
+            for n, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                value = record.get(field) if isinstance(record, dict) else record
+                if not isinstance(value, str):
+                    raise ValueError(f"line {n}: field '{field}' is missing or not a string")
+                if value.strip():
+                    items.append(value.strip())
+            return items
+        return [line.strip() for line in f if line.strip()]
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def task_params(args) -> dict:
+    if args.task == "generation":
+        return {"max_length": args.max_length, "do_sample": not args.greedy}
+    if args.task == "summarization":
+        return {"max_length": args.max_length, "min_length": args.min_length,
+                "preset": args.preset, "adaptive": not args.fixed_length}
+    return {}
+
+
+def model_options(args) -> dict:
+    """Constructor options for load_model (assisted decoding for generation)."""
+    if args.task == "generation" and args.draft_model:
+        return {"draft_model": args.draft_model, "num_assistant_tokens": args.assistant_tokens}
+    return {}
+
+
+# ------------------ run ------------------
+def cmd_run(args) -> int:
+    items = read_inputs(args.input, args.format, args.field, args.column)
+    params = task_params(args)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    adapters = []
+
+    def _job(adapter, chunk):
+        if adapter not in adapters:
+            adapters.append(adapter)
+        start = time.perf_counter()
+        outputs = run_batch(
+            adapter, args.task, chunk, params,
+            batch_size=args.batch_size, max_tokens=args.max_tokens,
+        )
+        return outputs, time.perf_counter() - start
+
+    configure_cpu(args)
+    scheduler = JobScheduler()
+    scheduler.register(
+        args.task,
+        factory=lambda: load_model(
+            args.task, args.lang, args.precision, args.backend, execution=args.execution,
+            options=model_options(args),
+        ),
+        concurrency=args.workers,
+        worker_init=(
+            cpu_config.worker_init(args.task, threads=args.threads)
+            if args.execution == "thread" else None
+        ),
+    )
+
+    chunk_size = args.batch_size * args.chunk_batches
+    latencies, errors, done = [], 0, 0
+    first_result = None
+    start = time.perf_counter()
+
+    # Model code may print progress; keep stdout clean for JSONL
+    with contextlib.redirect_stdout(sys.stderr):
+        pending = deque()
+        offsets = iter(range(0, len(items), chunk_size))
+        try:
+            while True:
+                # Keep every worker busy plus one chunk queued behind each
+                while len(pending) < 2 * args.workers:
+                    offset = next(offsets, None)
+                    if offset is None:
+                        break
+                    chunk = items[offset:offset + chunk_size]
+                    pending.append((offset, chunk, scheduler.submit(
+                        args.task, _job, chunk, priority=Priority.BATCH
+                    )))
+                if not pending:
+                    break
+
+                # Write chunks in input order as they complete
+                offset, chunk, future = pending.popleft()
+                try:
+                    outputs, elapsed = future.result()
+                    records = [
+                        {"index": offset + i, "input": x, "output": y}
+                        for i, (x, y) in enumerate(zip(chunk, outputs))
+                    ]
+                    latencies.append(elapsed)
+                except Exception as e:
+                    records = [
+                        {"index": offset + i, "input": x, "error": str(e)}
+                        for i, x in enumerate(chunk)
+                    ]
+                    errors += len(chunk)
+                for record in records:
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                done += len(chunk)
+                if first_result is None:
+                    first_result = time.perf_counter() - start
+                if args.progress:
+                    rate = done / (time.perf_counter() - start)
+                    print(f"[{done}/{len(items)}] {rate:.1f} items/s", file=sys.stderr)
+        finally:
+            scheduler.shutdown(wait=False)
+            if out is not sys.stdout:
+                out.close()
+
+    elapsed = time.perf_counter() - start
+    ms = [1000 * x for x in latencies]
+    print(
+        f"task={args.task} items={len(items)} errors={errors} workers={args.workers} "
+        f"batch_size={args.batch_size}\n"
+        f"elapsed={elapsed:.2f}s throughput={len(items) / elapsed if elapsed else 0:.2f} items/s "
+        f"first_result={first_result or 0:.2f}s\n"
+        f"chunk latency ms: p50={percentile(ms, 50):.0f} p90={percentile(ms, 90):.0f} "
+        f"p99={percentile(ms, 99):.0f} max={max(ms, default=0):.0f}",
+        file=sys.stderr,
+    )
+    if args.task == "generation" and args.draft_model:
+        for adapter in adapters:
+            total = adapter.generation_stats()["total"]
+            print(
+                f"assisted decoding ({args.draft_model}, {args.assistant_tokens} tokens/step): "
+                f"acceptance={total.get('acceptance_rate', 0):.1%} "
+                f"tokens/s={total.get('tokens_per_s', 0):.1f}",
+                file=sys.stderr,
+            )
+    if args.metrics:
+        write_metrics(args.metrics)
+    return 1 if errors else 0
+
+
+def write_metrics(path: str):
+    """Prometheus text for *.prom / *.txt, JSON snapshot otherwise."""
+    if os.path.splitext(path)[1].lower() in (".prom", ".txt"):
+        REGISTRY.write_prometheus(path)
+    else:
+        REGISTRY.write_json(path)
+
+
+# ------------------ precision ------------------
+def cmd_precision(args) -> int:
+    from benchmarks.precision import compare_precisions, format_table
+
+    samples = read_inputs(args.input, args.format, args.field, args.column)[:args.limit]
+    precisions = [p.strip() for p in args.precisions.split(",") if p.strip()]
+    with contextlib.redirect_stdout(sys.stderr):
+        rows = compare_precisions(
+            args.task, samples, precisions, task_params(args), lang=args.lang
+        )
+    if args.json:
+        print(json.dumps({"task": args.task, "samples": len(samples), "results": rows}, indent=2))
+    else:
+        print(f"task={args.task} samples={len(samples)} (drift vs {rows[0]['precision']})")
+        print(format_table(rows))
+    return 0
+
+
+# ------------------ bench ------------------
+def cmd_bench(args) -> int:
+    from benchmarks.suite import compare, format_results, preset_param_sets, run_suite
+
+    tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+    unknown = [t for t in tasks if t not in TASKS]
+    if unknown:
+        print(f"unknown task(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_suite(
+            tasks, samples=args.samples, repeats=args.repeats,
+            batch_size=args.batch_size, workdir=args.workdir,
+            param_sets=preset_param_sets() if "summarization" in tasks else None,
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(format_results(report))
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        regressions = compare(report, json.load(f), args.threshold)
+    for r in regressions:
+        print(
+            f"REGRESSION {r['task']} {r['metric']}: {r['baseline']} -> {r['current']} "
+            f"({r['change']:+.1%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+# ------------------ autotune ------------------
+def cmd_autotune(args) -> int:
+    from benchmarks.autotune import autotune, candidate_threads
+
+    tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+    unknown = [t for t in tasks if t not in TASKS]
+    if unknown:
+        print(f"unknown task(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    def _progress(task, threads, r):
+        print(
+            f"{task} threads={threads}: {r['throughput_items_s']} items/s, "
+            f"p50 {r['latency_p50_ms']} ms",
+            file=sys.stderr,
+        )
+
+    with contextlib.redirect_stdout(sys.stderr):
+        result = autotune(
+            tasks, candidate_threads(args.max_threads), args.objective,
+            samples=args.samples, repeats=args.repeats, batch_size=args.batch_size,
+            workdir=args.workdir, on_result=_progress,
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    if args.save:
+        cpu_config.save_file(
+            {k: result[k] for k in ("intra_op", "inter_op", "models")}, args.save
+        )
+        print(f"saved to {args.save}", file=sys.stderr)
+    print(f"intra_op={result['intra_op']} inter_op={result['inter_op']}")
+    for task in tasks:
+        print(
+            f"{task}: best alone {result['best_alone'][task]} threads, "
+            f"alongside the other tasks {result['models'][task]}"
+        )
+    return 0
+
+
+def configure_cpu(args):
+    """Saved autotune settings, overridden by --threads/--interop-threads/--cpus."""
+    cpu_config.load_file()
+    cpu_config.configure(inter_op=args.interop_threads)
+    if args.threads:
+        cpu_config.configure(models={args.task: args.threads})
+    if args.cpus:
+        cpu_config.set_affinity(cpu_config.parse_cpus(args.cpus))
+
+
+def add_cpu_args(p):
+    p.add_argument("--threads", type=int, help="torch intra-op threads per model worker")
+    p.add_argument("--interop-threads", type=int, help="torch inter-op threads")
+    p.add_argument("--cpus", help="pin the process to these CPUs, e.g. 0-3,6")
+
+
+# ------------------ Argument parsing ------------------
+def add_common_args(p):
+    p.add_argument("--task", required=True, choices=sorted(TASKS))
+    p.add_argument("--input", required=True, help="input file, or - for stdin")
+    p.add_argument("--format", choices=["txt", "jsonl", "csv"],
+                   help="input format (default: from the file extension)")
+    p.add_argument("--field", default="text", help="JSONL field holding the input")
+    p.add_argument("--column", default="text", help="CSV column holding the input")
+    p.add_argument("--lang", default="French", help="translation target language")
+    p.add_argument("--max-length", type=int, default=150)
+    p.add_argument("--min-length", type=int, default=40)
+    p.add_argument("--greedy", action="store_true", help="generation: disable sampling")
+    p.add_argument("--preset", default=DEFAULT_PRESET, choices=list(PRESETS),
+                   help="summarization: fast (greedy), balanced (2 beams) or best (4 beams)")
+    p.add_argument("--fixed-length", action="store_true",
+                   help="summarization: use --max/--min-length as given, not scaled to the input")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--log-level", default="WARNING",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="level for gensumai log messages (warnings go to stderr)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run a task over an input file and write JSONL")
+    add_common_args(run)
+    run.add_argument("--output", default="-", help="JSONL output file (default: stdout)")
+    run.add_argument("--precision", default="fp32", choices=PRECISIONS,
+                     help="int8 = dynamic quantization of Linear layers")
+    run.add_argument("--backend", default="pytorch", choices=BACKENDS,
+                     help="onnx = ONNX Runtime (exported once, falls back to PyTorch)")
+    run.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    run.add_argument("--max-tokens", type=int, default=None,
+                     help="token budget per padded batch")
+    run.add_argument("--chunk-batches", type=int, default=4,
+                     help="model batches per scheduled chunk")
+    run.add_argument("--workers", type=int, default=1,
+                     help="model replicas running in parallel (each loads its own copy)")
+    run.add_argument("--execution", default="thread", choices=EXECUTION_MODES,
+                     help="process = each replica in its own worker process (restarted if it crashes)")
+    run.add_argument("--draft-model",
+                     help="generation: draft model for assisted decoding (same tokenizer, e.g. distilbert/distilgpt2)")
+    run.add_argument("--assistant-tokens", type=int, default=5,
+                     help="generation: tokens the draft model proposes per step")
+    run.add_argument("--progress", action="store_true", help="report progress on stderr")
+    run.add_argument("--metrics", help="write call metrics here (.json, or .prom for Prometheus)")
+    add_cpu_args(run)
+    run.set_defaults(func=cmd_run)
+
+    prec = sub.add_parser("precision", help="compare latency/memory/drift across precisions")
+    add_common_args(prec)
+    prec.add_argument("--precisions", default="fp32,int8",
+                      help=f"comma-separated, first is the baseline ({', '.join(PRECISIONS)})")
+    prec.add_argument("--limit", type=int, default=20, help="max samples to run")
+    prec.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    prec.set_defaults(func=cmd_precision)
+
+    bench = sub.add_parser("bench", help="offline benchmark on tiny random-weight models")
+    bench.add_argument("--tasks", default=",".join(TASKS),
+                       help=f"comma-separated tasks ({', '.join(TASKS)})")
+    bench.add_argument("--output", help="write the JSON report here")
+    bench.add_argument("--baseline", help="JSON report to compare against")
+    bench.add_argument("--threshold", type=float, default=0.10,
+                       help="allowed relative regression before failing (default 0.10)")
+    bench.add_argument("--samples", type=int, default=16)
+    bench.add_argument("--repeats", type=int, default=3, help="single-request latency passes")
+    bench.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    bench.add_argument("--workdir", help="where tiny models/images are built (default: tmp)")
+    bench.set_defaults(func=cmd_bench)
+
+    tune = sub.add_parser("autotune", help="pick torch thread counts by running the benchmark")
+    tune.add_argument("--tasks", default=",".join(TASKS),
+                      help=f"comma-separated tasks ({', '.join(TASKS)})")
+    tune.add_argument("--objective", choices=["throughput", "latency"], default="throughput")
+    tune.add_argument("--max-threads", type=int, help="largest thread count to try (default: all CPUs)")
+    tune.add_argument("--samples", type=int, default=16)
+    tune.add_argument("--repeats", type=int, default=2)
+    tune.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    tune.add_argument("--workdir", help="where tiny models/images are built (default: tmp)")
+    tune.add_argument("--output", help="write the full sweep as JSON")
+    tune.add_argument("--save", nargs="?", const=cpu_config.CPU_CONFIG_PATH,
+                      help=f"save settings for cli/server/GUI (default path: {cpu_config.CPU_CONFIG_PATH})")
+    tune.set_defaults(func=cmd_autotune)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(format="[%(levelname)s] %(message)s")
+    logging.getLogger("gensumai").setLevel(args.log_level)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
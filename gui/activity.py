@@ -0,0 +1,175 @@
+# activity.py
+
+import threading
+import time
+from collections import deque
+from itertools import islice
+
+import customtkinter as ctk
+
+from .theme import THEME
+
+
+DEFAULT_CAPACITY = 2000
+
+# Repeats of the last message within this window become one "(×N)" row
+COALESCE_S = 2.0
+# Pending events are drawn at most this often
+FLUSH_MS = 100
+# Rows hold up to two wrapped lines; longer messages are cut (export keeps them whole)
+ROW_HEIGHT = 40
+ROW_CHARS = 80
+
+
+class ActivityLog:
+    """
+    Ring buffer of (timestamp, text, count) activity events.
+
+    add() may be called from any thread. When full, the oldest events are
+    dropped (`dropped` counts them). A message equal to the previous one
+    within COALESCE_S bumps that event's count instead of adding a row.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._events = deque(maxlen=max(1, int(capacity)))
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self.version = 0   # bumped on every change; the panel redraws when it moves
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen
+
+    def add(self, text: str):
+        now = time.time()
+        with self._lock:
+            if self._events:
+                ts, last, count = self._events[-1]
+                if last == text and now - ts <= COALESCE_S:
+                    self._events[-1] = (now, text, count + 1)
+                    self.version += 1
+                    return
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append((now, text, 1))
+            self.version += 1
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def window(self, start: int, count: int):
+        """Events start..start+count (oldest first)."""
+        start = max(0, start)
+        with self._lock:
+            return list(islice(self._events, start, start + count))
+
+    def export(self, path: str):
+        """Write every retained event as a timestamped line."""
+        with self._lock:
+            events, dropped = list(self._events), self.dropped
+        with open(path, "w", encoding="utf-8") as f:
+            if dropped:
+                f.write(f"# {dropped} older events were dropped (capacity {self.capacity})\n")
+            for ts, text, count in events:
+                stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+                f.write(f"{stamp}  {text}" + (f" (×{count})" if count > 1 else "") + "\n")
+
+
+class ActivityPanel(ctk.CTkFrame):
+    """
+    Virtualized view of an ActivityLog: a fixed pool of rows, as many as
+    fit the panel, shows the visible slice of the log. The view
+    follows new events while scrolled to the bottom.
+    """
+
+    def __init__(self, master, log: ActivityLog, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.log = log
+        self._top = 0            # index of the first visible event
+        self._follow = True
+        self._drawn = None       # (log version, top, rows) last drawn
+        self._rows = []
+
+        self._body = ctk.CTkFrame(self, fg_color="transparent")
+        self._body.pack(side="left", fill="both", expand=True)
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y")
+
+        self._body.bind("<Configure>", lambda e: self._resize(e.height))
+        for widget in (self, self._body):
+            self._bind_wheel(widget)
+        self.after(FLUSH_MS, self._poll)
+
+    def add(self, text: str):
+        """Thread-safe; the row appears on the next redraw."""
+        self.log.add(text)
+
+    # ---- layout ----
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda e: self._scroll(-1))
+        widget.bind("<Button-5>", lambda e: self._scroll(1))
+
+    def _resize(self, height: int):
+        wanted = max(1, height // ROW_HEIGHT)
+        while len(self._rows) < wanted:
+            row = ctk.CTkLabel(
+                self._body, text="", anchor="w", justify="left", height=ROW_HEIGHT,
+                wraplength=250, font=THEME["FONT_SM"],
+            )
+            row.pack(fill="x", padx=6)
+            self._bind_wheel(row)
+            self._rows.append(row)
+        while len(self._rows) > wanted:
+            self._rows.pop().destroy()
+        self._redraw()
+
+    # ---- scrolling ----
+    def _max_top(self) -> int:
+        return max(0, len(self.log) - len(self._rows))
+
+    def _scroll(self, rows: int):
+        self._set_top(self._top + rows * 3)
+
+    def _set_top(self, top: int):
+        self._top = min(max(0, int(top)), self._max_top())
+        self._follow = self._top >= self._max_top()
+        self._redraw()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._set_top(float(value) * len(self.log))
+        elif action == "scroll":
+            step = len(self._rows) if unit == "pages" else 1
+            self._set_top(self._top + int(value) * step)
+
+    # ---- drawing ----
+    def _poll(self):
+        # Events from workers only bump the log; one redraw covers a whole burst
+        if self._drawn is None or self._drawn[0] != self.log.version:
+            self._redraw()
+        self.after(FLUSH_MS, self._poll)
+
+    def _redraw(self):
+        if self._follow:
+            self._top = self._max_top()
+        self._top = min(self._top, self._max_top())
+        state = (self.log.version, self._top, len(self._rows))
+        if state == self._drawn:
+            return
+        self._drawn = state
+        events = self.log.window(self._top, len(self._rows))
+        for i, row in enumerate(self._rows):
+            text = ""
+            if i < len(events):
+                _, text, count = events[i]
+                if count > 1:
+                    text = f"{text} (×{count})"
+                if len(text) > ROW_CHARS:
+                    text = text[:ROW_CHARS - 1] + "…"
+            row.configure(text=text)
+        total = len(self.log)
+        if total:
+            self._scrollbar.set(self._top / total, min(1.0, (self._top + len(self._rows)) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
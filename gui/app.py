@@ -1,22 +1,94 @@
 # gui/app.py
 
 import os
+import queue
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
-from concurrent.futures import ThreadPoolExecutor
+import threading
 
-from model.text_model import TextGenerator
-from model.summary_model import Summarizer
 from model.translation_model import TranslationModelAdapter
+from model.translation_pool import TranslationModelPool
+from model import cpu_config
+from model.loader import LazyModel, ModelState, warm_up
+from model.tasks import TASKS, load_model
+from model.memory_manager import MemoryManager
+from model.base_model import STREAMING
+from model.batching import DEFAULT_BATCH_SIZE
+from model.batch_job import BatchJob
+from model.scheduler import JobScheduler, Priority
+from model.summary_model import preset_kwargs
+from model.result_cache import ResultCache, file_digest, model_id
 from model.image_model import ImageClassificationModelAdapter
+from Utils.metrics import REGISTRY
+from Utils.stats import rss_bytes
 
 from .icons import load_icons
 from .theme import THEME, update_colors
+from .activity import ActivityLog
 from .layout import setup_layout
 
 
 TEXT_FILE_EXTS = {".py", ".txt", ".md", ".json", ".cfg", ".ini", ".log", ".csv"}
 
+# How often streamed text is flushed into the output box
+STREAM_FLUSH_MS = 50
+
+# Batch jobs run this many model batches per chunk (cancel/progress granularity)
+BATCH_WINDOW = 4
+
+# Worker threads per model lane (each needs its own model instance)
+SCHEDULER_CONCURRENCY = {
+    "Text Generation": 1,
+    "Summarization": 1,
+    "Translation": 1,
+    "Image Classification": 1,
+}
+
+# torch intra-op threads per model (None = autotuned budget from `cli.py autotune --save`,
+# else torch's default). Separate per-model budgets need EXECUTION_MODE = "process"; in
+# thread mode torch keeps one count per process and the last model started sets it.
+MODEL_THREADS = {
+    "Text Generation": None,
+    "Summarization": None,
+    "Translation": None,
+    "Image Classification": None,
+}
+
+# Weight precision per model: "fp32", "int8" (dynamic quantization) or "bf16"
+MODEL_PRECISION = {
+    "Text Generation": "fp32",
+    "Summarization": "fp32",
+    "Translation": "fp32",
+    "Image Classification": "fp32",
+}
+
+# Execution backend per model: "pytorch" or "onnx" (ONNX Runtime, falls back to PyTorch)
+MODEL_BACKEND = {
+    "Text Generation": "pytorch",
+    "Summarization": "pytorch",
+    "Translation": "pytorch",
+    "Image Classification": "pytorch",
+}
+
+# "thread": models run in this process; "process": each model runs in its own worker
+# process (no GIL contention between models; a crashed model restarts on the next run)
+EXECUTION_MODE = "thread"
+
+# Assisted decoding for Text Generation: a smaller draft model with GPT-2's tokenizer
+# (e.g. "distilbert/distilgpt2") proposes GENERATION_ASSISTANT_TOKENS tokens per step
+# and GPT-2 verifies them in one pass (None = off)
+GENERATION_DRAFT_MODEL = None
+GENERATION_ASSISTANT_TOKENS = 5
+
+# Loaded models are unloaded least recently used first above this (MB, None = no limit)
+MEMORY_BUDGET_MB = 3072
+
+# Activity events kept in memory (oldest dropped first); Export saves them to a file
+ACTIVITY_CAPACITY = 2000
+
+# Background warm-up priority (default task first)
+WARMUP_ORDER = ["Text Generation", "Summarization", "Translation", "Image Classification"]
+
 
 class NLPApp(ctk.CTk):
     def __init__(self):
@@ -31,18 +103,30 @@ class NLPApp(ctk.CTk):
         assets_folder = os.path.join(os.path.dirname(__file__), "assets")
         self.icons = load_icons(assets_folder)
 
-        # --- Initialize models ---
-        try:
-            self.models = {
-                "Text Generation": TextGenerator("openai-community/gpt2"),
-                "Summarization": Summarizer("facebook/bart-large-cnn"),
-                "Translation": TranslationModelAdapter("French"),  # default
-                "Image Classification": ImageClassificationModelAdapter(),
-            }
-        except Exception as e:
-            messagebox.showerror("Error", f"Model initialization failed: {e}")
-            self.destroy()
-            return
+        # Loaded translators are reused per target language (LRU bounded)
+        self.translation_pool = TranslationModelPool(
+            max_models=3,
+            factory=lambda lang: self._build_model("Translation", lang),
+        )
+
+        # --- Models load on first use or in the background warm-up ---
+        self.models = {
+            "Text Generation": LazyModel(
+                "GPT-2 Text Generator", lambda: self._build_model("Text Generation")
+            ),
+            "Summarization": LazyModel(
+                "BART Summarizer", lambda: self._build_model("Summarization")
+            ),
+            "Translation": LazyModel(
+                "EN→Translator", self._load_translation,
+                on_unload=lambda pool: pool.clear(),
+            ),
+            "Image Classification": LazyModel(
+                "ViT Image Classifier", lambda: self._build_model("Image Classification")
+            ),
+        }
+        for handle in self.models.values():
+            handle.add_listener(self._on_model_state)
 
         # --- Map model_name → task(s) ---
         self.model_name_to_task = {}
@@ -60,13 +144,140 @@ class NLPApp(ctk.CTk):
         self.supported_languages = list(TranslationModelAdapter.SUPPORTED_MODELS.keys())
         self.lang_dropdown = None
 
-        # Executor for background jobs
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        # Batch Run settings (token budget 0 = batch by count only)
+        self.batch_size_var = ctk.IntVar(value=DEFAULT_BATCH_SIZE)
+        self.token_budget_var = ctk.IntVar(value=0)
+
+        # Inference results keyed by model/task/params/input (memory + disk)
+        self.result_cache = ResultCache()
+        self.cache_sampling_var = ctk.BooleanVar(value=False)
+
+        # Streamed text pieces, filled by workers and drained on the Tk loop
+        self._stream_queue = queue.Queue()
+        self._streamed = False
+
+        # Currently running batch job (None when idle)
+        self._batch_job = None
+        self._batch_results = []
+
+        # One queue per model: jobs on different models run in parallel,
+        # interactive runs go ahead of queued batch chunks
+        cpu_config.load_file()
+        short_names = {label: name for name, label in TASKS.items()}
+        self.scheduler = JobScheduler()
+        for task, handle in self.models.items():
+            if EXECUTION_MODE == "process":
+                # Worker processes set their own threads; keep torch out of this one
+                cpu_config.configure(models={short_names[task]: MODEL_THREADS.get(task)})
+                init = None
+            else:
+                init = cpu_config.worker_init(short_names.get(task), MODEL_THREADS.get(task))
+            self.scheduler.register(
+                task, handle, concurrency=SCHEDULER_CONCURRENCY.get(task, 1), worker_init=init,
+            )
+
+        # Idle models are unloaded (LRU) when the loaded total exceeds the budget
+        self.memory_budget_var = ctk.IntVar(value=MEMORY_BUDGET_MB or 0)
+        self.memory_manager = MemoryManager(
+            MEMORY_BUDGET_MB * 2**20 if MEMORY_BUDGET_MB else None,
+            is_busy=self.scheduler.busy,
+            on_unload=self._on_model_unloaded,
+        )
+        for task, handle in self.models.items():
+            self.memory_manager.register(task, handle)
+
+        # Bounded activity log shown by the Activity panel
+        self.activity_log = ActivityLog(ACTIVITY_CAPACITY)
 
         # --- Setup GUI layout ---
         setup_layout(self)
         self.select_task("Text Generation")
 
+        # Warm up after the window is shown, selected task first
+        self.after(200, lambda: warm_up(self.models, WARMUP_ORDER))
+
+    # ------------------ Model loading ------------------
+    def _load_translation(self):
+        # Warm the default language; other languages load through the pool
+        self.translation_pool.get("French")
+        return self.translation_pool
+
+    @staticmethod
+    def _build_model(task, lang="French"):
+        short = {label: name for name, label in TASKS.items()}[task]
+        options = {}
+        if short == "generation" and GENERATION_DRAFT_MODEL:
+            options = {"draft_model": GENERATION_DRAFT_MODEL,
+                       "num_assistant_tokens": GENERATION_ASSISTANT_TOKENS}
+        return load_model(
+            short, lang, MODEL_PRECISION[task], MODEL_BACKEND[task], execution=EXECUTION_MODE,
+            options=options,
+        )
+
+    def _on_model_state(self, handle, state):
+        """Called from loader threads; hop to the Tk main loop."""
+        self.after(0, lambda: self._refresh_model_state(handle, state))
+
+    def _refresh_model_state(self, handle, state):
+        task = next((t for t, h in self.models.items() if h is handle), None)
+        if task is None:
+            return
+        btn = getattr(self, "task_buttons", {}).get(task)
+        if btn is not None:
+            try:
+                btn.configure(text=self._task_label(task))
+            except Exception:
+                pass
+        if task == self.task_var.get():
+            self._update_run_button()
+        if state == ModelState.FAILED:
+            self.add_activity(f"Failed to load {handle.get_model_name()}: {handle.error}")
+        elif state in (ModelState.LOADING, ModelState.READY):
+            self.add_activity(f"{handle.get_model_name()}: {state}")
+
+    def _on_model_unloaded(self, task, handle, freed):
+        msg = f"Unloaded {handle.get_model_name()} ({freed / 2**20:.0f} MB) to stay under the memory budget"
+        self.after(0, lambda: self.add_activity(msg))
+
+    def _apply_memory_budget(self):
+        try:
+            mb = max(0, int(self.memory_budget_var.get()))
+        except Exception:
+            return
+        self.memory_manager.set_budget(mb * 2**20 if mb else None)
+        self.add_activity(f"Memory budget: {f'{mb} MB' if mb else 'off'}")
+
+    def _memory_text(self):
+        rows = self.memory_manager.usage()
+        lines = [
+            f"{r['name']}: {r['bytes'] / 2**20:.0f} MB, idle {r['idle_s']:.0f}s"
+            for r in rows
+        ] or ["No models loaded"]
+        lines.append(
+            f"Loaded total: {self.memory_manager.total_bytes() / 2**20:.0f} MB · "
+            f"process RSS: {rss_bytes() / 2**20:.0f} MB"
+        )
+        return "\n".join(lines)
+
+    def _task_label(self, task):
+        state = self.models[task].state
+        return task if state == ModelState.READY else f"{task} ({state})"
+
+    def _update_run_button(self):
+        if getattr(self, "_job_running", False):
+            return
+        state = self.models[self.task_var.get()].state
+        labels = {
+            ModelState.NOT_LOADED: "Load & Run",
+            ModelState.LOADING: "Loading…",
+            ModelState.READY: "Run",
+            ModelState.FAILED: "Retry",
+        }
+        try:
+            self.run_button.configure(text=labels.get(state, "Run"), state="normal")
+        except Exception:
+            pass
+
     # ------------------ Task selection ------------------
     def on_model_selected(self, selected_model_name):
         if not selected_model_name:
@@ -122,6 +333,9 @@ class NLPApp(ctk.CTk):
         except Exception:
             pass
 
+        if task in self.models:
+            self._update_run_button()
+
         # Show/hide translation language dropdown
         if task == "Translation":
             if self.lang_dropdown:
@@ -149,58 +363,160 @@ class NLPApp(ctk.CTk):
             pass
 
     # ------------------ Model execution ------------------
-    def _run_model_background(self, task, text):
-        """Runs inside a worker thread. Return (success, result)."""
+    def _task_params(self, task):
+        """Run parameters for task, read from the UI (call on the Tk thread)."""
+        if task == "Text Generation":
+            return {"max_length": self.max_len.get(), "do_sample": True}
+        if task == "Summarization":
+            return {"max_length": self.max_len.get(), "min_length": self.min_len.get(),
+                    "preset": self.preset_var.get()}
+        return {}
+
+    @staticmethod
+    def _adapter(handle, task, lang=None):
+        """The model behind a handle; the translation handle holds a per-language pool."""
+        model = handle.get()
+        return model.get(lang) if task == "Translation" else model
+
+    @staticmethod
+    def _item_digest(task, item):
+        """Image inputs are cached by file content rather than by path."""
+        if task == "Image Classification" and os.path.isfile(item):
+            return file_digest(item)
+        return None
+
+    @staticmethod
+    def _cacheable(adapter, params, cache_sampling):
+        return cache_sampling or adapter.deterministic(**params)
+
+    def _cached(self, adapter, task, params, payload, compute, cacheable=True, digest=None):
+        """Serve compute() through the result cache (bypassed for sampled output)."""
+        if not cacheable:
+            return self.result_cache.bypass(compute)
+        key = self.result_cache.make_key(model_id(adapter), task, params, payload, digest)
+        return self.result_cache.get_or_compute(key, compute)
+
+    def _run_model_background(self, handle, task, item, params, lang, long_doc, cache_sampling):
+        """Runs on the scheduler lane for task. Return (success, result)."""
         try:
-            if task == "Text Generation":
-                result = self.models[task].run(text, max_length=self.max_len.get())
-
-            elif task == "Summarization":
-                result = self.models[task].run(
-                    text, max_length=self.max_len.get(), min_length=self.min_len.get()
+            adapter = self._adapter(handle, task, lang)
+            digest = self._item_digest(task, item)
+            payload = None if digest else item
+            cacheable = self._cacheable(adapter, params, cache_sampling)
+
+            if long_doc and hasattr(adapter, "summarize_long") and not adapter.fits_input(item):
+                result = self._cached(
+                    adapter, task, dict(params, mode="long"), payload,
+                    lambda: self._summarize_long(adapter, item, params), cacheable, digest,
                 )
-
-            elif task == "Translation":
-                lang = self.lang_var.get()
-                self.models["Translation"] = TranslationModelAdapter(lang)
-                result = self.models["Translation"].run(text)
-
-            elif task == "Image Classification":
-                img_path = getattr(self, "_last_image_path", None)
-                if not img_path:
-                    return False, "No image selected"
-                pipeline = self.models[task]._build_pipeline()
-                output = pipeline(img_path)
-                result = self.models[task].postprocess(output)
-
+            elif adapter.supports(STREAMING) and self._streams(task, params):
+                result = self._cached(
+                    adapter, task, params, payload,
+                    lambda: self._stream_to_output(adapter.stream(item, **params)),
+                    cacheable, digest,
+                )
+                if task == "Text Generation" and GENERATION_DRAFT_MODEL:
+                    self._report_assisted(adapter)
             else:
-                return False, f"Unknown task: {task}"
-
+                result = self._cached(
+                    adapter, task, params, payload, lambda: adapter.run(item, **params),
+                    cacheable, digest,
+                )
             return True, result
 
         except Exception as e:
             return False, str(e)
 
+    @staticmethod
+    def _streams(task, params):
+        """Beam search cannot stream, so beam summary presets go through run()."""
+        if task == "Summarization":
+            return preset_kwargs(params.get("preset"))["num_beams"] == 1
+        return True
+
+    def _summarize_long(self, summarizer, text, params):
+        result, report = summarizer.summarize_long(text, **params)
+        if report["chunks"] > 1:
+            msg = (
+                f"Long document: {report['input_tokens']} tokens, "
+                f"{report['chunks']} chunks over {len(report['stages'])} stages "
+                f"({report['seconds']}s)"
+            )
+            self.after(0, lambda: self.add_activity(msg))
+        return result
+
+    def _report_assisted(self, generator):
+        last = generator.generation_stats()["last"]
+        if last.get("proposed"):
+            msg = (
+                f"Assisted decoding: {last['acceptance_rate']:.0%} of draft tokens accepted, "
+                f"{last['tokens_per_s']:.1f} tokens/s"
+            )
+            self.after(0, lambda: self.add_activity(msg))
+
+    def _stream_to_output(self, pieces):
+        """Worker side: forward streamed pieces to the Tk loop and return the full text."""
+        parts = []
+        for piece in pieces:
+            parts.append(piece)
+            self._stream_queue.put(piece)
+        return "".join(parts)
+
+    def _flush_stream(self):
+        """Append all queued pieces to output_box in a single insert."""
+        pieces = []
+        while True:
+            try:
+                pieces.append(self._stream_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not pieces:
+            return
+        if not self._streamed:
+            self.output_box.delete("1.0", "end")
+            self._streamed = True
+        self.output_box.insert("end", "".join(pieces))
+        self.output_box.see("end")
+
+    def _poll_stream(self):
+        self._flush_stream()
+        if self._job_running:
+            self.after(STREAM_FLUSH_MS, self._poll_stream)
+
     def run_model(self):
         task = self.task_var.get()
         text = self.input_box.get("1.0", "end").strip()
 
-        # Image Classification doesn’t need text
-        if task != "Image Classification" and not text:
+        # Image Classification takes the browsed file instead of text
+        if task == "Image Classification":
+            text = getattr(self, "_last_image_path", None)
+            if not text:
+                messagebox.showwarning("Warning", "Please select an image first.")
+                return
+        elif not text:
             messagebox.showwarning("Warning", "Please enter some text first.")
             return
 
+        self._job_running = True
         try:
             self.run_button.configure(state="disabled")
         except Exception:
             pass
 
+        if not self.models[task].is_ready:
+            self.add_activity(f"Loading {self.models[task].get_model_name()} on first use")
         self.status_left.configure(text=f"Processing: {task}...")
         self.status_right.configure(text="Working")
         self.progress.set(0.05)
         self.add_activity(f"Started {task}")
 
-        future = self.executor.submit(self._run_model_background, task, text)
+        self._streamed = False
+        self.after(STREAM_FLUSH_MS, self._poll_stream)
+        future = self.scheduler.submit(
+            task, self._run_model_background, task, text,
+            self._task_params(task), self.lang_var.get(), self.long_doc_var.get(),
+            self.cache_sampling_var.get(), priority=Priority.INTERACTIVE,
+        )
 
         def _done_callback(fut):
             success, payload = fut.result()
@@ -210,13 +526,16 @@ class NLPApp(ctk.CTk):
 
     def _on_model_done(self, success, payload, task):
         try:
+            self._flush_stream()
             if success:
-                self.output_box.delete("1.0", "end")
-                self.output_box.insert("end", payload)
+                if not self._streamed:
+                    self.output_box.delete("1.0", "end")
+                    self.output_box.insert("end", payload)
                 self.progress.set(1.0)
                 self.status_left.configure(text="Completed successfully")
                 self.status_right.configure(text="Idle")
                 self.add_activity(f"Completed: {task}")
+                self.memory_manager.enforce()
             else:
                 self.progress.set(0.0)
                 messagebox.showerror("Error", f"Processing failed: {payload}")
@@ -224,10 +543,8 @@ class NLPApp(ctk.CTk):
                 self.status_right.configure(text="Idle")
                 self.add_activity(f"Error: {payload}")
         finally:
-            try:
-                self.run_button.configure(state="normal")
-            except Exception:
-                pass
+            self._job_running = False
+            self._update_run_button()
             self.after(600, lambda: self.progress.set(0.0))
 
     # ------------------ Image file browsing ------------------
@@ -317,48 +634,269 @@ class NLPApp(ctk.CTk):
 
     # ------------------ Batch Processing ------------------
     def run_batch_file(self, task, filepath):
+        """Start a batch job in the background; results stream into the output box."""
+        if self._batch_job is not None:
+            messagebox.showwarning("Warning", "A batch job is already running.")
+            return None
         try:
-            results = []
-            with open(filepath, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
-
-            for line in lines:
-                if task == "Summarization":
-                    res = self.models["Summarization"].run(
-                        line, 
-                        max_length=self.max_len.get(), 
-                        min_length=self.min_len.get()
-                    )
-                elif task == "Translation":
-                    lang = self.lang_var.get()
-                    self.models["Translation"] = TranslationModelAdapter(lang)
-                    res = self.models["Translation"].run(line)
-                else:
-                    res = f"Batch not supported for {task}"
-                results.append({"input": line, "output": res})
-
-            self.output_box.delete("1.0", "end")
-            for r in results:
-                self.output_box.insert(
-                    "end", f"INPUT: {r['input']}\nOUTPUT: {r['output']}\n\n"
-                )
-
-            return results
+            items = self._read_batch_items(task, filepath)
+            run_fn = self._batch_runner(task)
         except Exception as e:
             messagebox.showerror("Error", f"Batch processing failed: {e}")
-            return []
+            return None
+        if not items:
+            messagebox.showwarning("Warning", "The batch file has no inputs.")
+            return None
+
+        opts = self._batch_options()
+        job = BatchJob(
+            items,
+            lambda chunk: self.scheduler.submit(task, run_fn, chunk, priority=Priority.BATCH).result(),
+            chunk_size=opts["batch_size"] * BATCH_WINDOW,
+        )
+        self._batch_job = job
+        self._batch_results = []
+        self.output_box.delete("1.0", "end")
+        self.progress.set(0.0)
+        self._set_batch_controls(running=True)
+        self.status_left.configure(text=f"Batch: {task} (0/{job.total})")
+        self.add_activity(f"Started batch {task}: {job.total} items")
+
+        def _drive():
+            # Each chunk is its own low-priority job, so interactive runs on
+            # the same model can go between chunks.
+            try:
+                for offset, chunk, outputs in job:
+                    self.after(0, lambda c=chunk, o=outputs: self._on_batch_progress(task, job, c, o))
+                result = (True, None)
+            except Exception as e:
+                result = (False, str(e))
+            self.after(10, lambda: self._on_batch_done(task, job, *result))
+
+        threading.Thread(target=_drive, name="batch-driver", daemon=True).start()
+        return job
+
+    def cancel_batch(self):
+        if self._batch_job is not None:
+            self._batch_job.cancel()
+            self.status_right.configure(text="Cancelling…")
+            self.add_activity("Cancelling batch after the current chunk")
+
+    def _read_batch_items(self, task, path):
+        if task == "Image Classification" and os.path.isdir(path):
+            return ImageClassificationModelAdapter.list_images(path)
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+
+    def _batch_runner(self, task):
+        """
+        Build run(handle, chunk) -> outputs for a batch job. Settings are read
+        here on the Tk thread; models are loaded by the worker on the first chunk.
+        """
+        if task not in self.models:
+            raise ValueError(f"Batch not supported for {task}")
+        opts = self._batch_options()
+        params = self._task_params(task)
+        lang = self.lang_var.get()
+        cache_sampling = self.cache_sampling_var.get()
+        cache = self.result_cache
+
+        def _key_for(name, item):
+            digest = self._item_digest(task, item)
+            return cache.make_key(name, task, params, None if digest else item, digest)
+
+        def run(handle, chunk):
+            adapter = self._adapter(handle, task, lang)
+            run_batch = lambda batch: adapter.run_batch(batch, **params, **opts)
+            if not self._cacheable(adapter, params, cache_sampling):
+                return cache.bypass(lambda: run_batch(chunk))
+            # Only inputs missing from the cache reach the model
+            name = model_id(adapter)
+            return cache.run_batch(
+                chunk, lambda item: _key_for(name, item), run_batch,
+                keep=lambda res: not (isinstance(res, str) and res.startswith("Error:")),
+            )
+        return run
+
+    def _on_batch_progress(self, task, job, chunk, outputs):
+        label = "IMAGE" if task == "Image Classification" else "INPUT"
+        sep = "\n" if task == "Image Classification" else " "
+        lines = []
+        for item, res in zip(chunk, outputs):
+            self._batch_results.append({"input": item, "output": res})
+            lines.append(f"{label}: {item}\nOUTPUT:{sep}{res}\n\n")
+        self.output_box.insert("end", "".join(lines))
+        self.output_box.see("end")
+        self.progress.set(job.progress())
+        self.status_left.configure(text=f"Batch: {task} ({job.completed}/{job.total})")
+        self.status_right.configure(text=f"{job.throughput():.1f} items/s")
+
+    def _on_batch_done(self, task, job, success, error):
+        self._batch_job = None
+        self._set_batch_controls(running=False)
+        if not success:
+            self.progress.set(0.0)
+            messagebox.showerror("Error", f"Batch processing failed: {error}")
+            self.status_left.configure(text="Error occurred")
+            self.add_activity(f"Batch error: {error}")
+        else:
+            verb = "Cancelled" if job.cancelled else "Completed"
+            self.status_left.configure(text=f"{verb} batch: {job.completed}/{job.total}")
+            self.add_activity(
+                f"{verb} batch {task}: {job.completed}/{job.total} items in "
+                f"{job.elapsed():.1f}s ({job.throughput():.1f} items/s)"
+            )
+            if task == "Translation":
+                stats = self.translation_pool.stats()
+                self.add_activity(
+                    f"Translation pool: {stats['hits']} hits, {stats['misses']} loads "
+                    f"({stats['load_time_s']}s)"
+                )
+            self._report_cache()
+            self.memory_manager.enforce()
+        self.status_right.configure(text="Idle")
+        self.after(600, lambda: self.progress.set(0.0))
+
+    def _set_batch_controls(self, running):
+        try:
+            self.batch_button.configure(state="disabled" if running else "normal")
+            self.cancel_button.configure(state="normal" if running else "disabled")
+        except Exception:
+            pass
+
+    def _report_cache(self):
+        stats = self.result_cache.stats()
+        self.add_activity(
+            f"Result cache: {stats['hit_rate']:.0%} hit rate "
+            f"({stats['memory_hits']} memory, {stats['disk_hits']} disk, {stats['misses']} misses)"
+        )
+
+    def _batch_options(self):
+        try:
+            batch_size = max(1, int(self.batch_size_var.get()))
+        except Exception:
+            batch_size = DEFAULT_BATCH_SIZE
+        try:
+            max_tokens = int(self.token_budget_var.get()) or None
+        except Exception:
+            max_tokens = None
+        return {"batch_size": batch_size, "max_tokens": max_tokens}
 
     # ------------------ Settings & About ------------------
     def open_settings(self):
         dlg = ctk.CTkToplevel(self)
         dlg.title("Settings")
-        dlg.geometry("520x360")
+        dlg.geometry("560x700")
         ctk.CTkLabel(dlg, text="Application Settings", font=THEME["FONT_LG"]).pack(padx=20, pady=16)
         ctk.CTkLabel(dlg, text="Configure model/autosave/logging here.", font=THEME["FONT_MD"]).pack(padx=20, pady=6)
         save_var = ctk.BooleanVar(value=False)
         ctk.CTkCheckBox(dlg, text="Autosave history", variable=save_var).pack(pady=6, padx=20, anchor="w")
+
+        ctk.CTkCheckBox(
+            dlg, text="Cache sampled text generations", variable=self.cache_sampling_var
+        ).pack(pady=6, padx=20, anchor="w")
+        stats = self.result_cache.stats()
+        ctk.CTkLabel(
+            dlg,
+            text=f"Result cache hit rate: {stats['hit_rate']:.0%} "
+                 f"({stats['memory_items']} items in memory)",
+            font=THEME["FONT_SM"],
+        ).pack(padx=20, pady=6, anchor="w")
+        ctk.CTkButton(
+            dlg, text="Clear result cache", command=lambda: self.result_cache.clear(disk=True)
+        ).pack(padx=20, pady=6, anchor="w")
+
+        lanes = self.scheduler.metrics()
+        queue_text = "\n".join(
+            f"{task}: {m['queue_depth']} queued, {m['running']} running, "
+            f"wait avg {m['wait_avg_ms']:.0f} ms / p95 {m['wait_p95_ms']:.0f} ms"
+            for task, m in lanes.items()
+        )
+        ctk.CTkLabel(dlg, text=queue_text, font=THEME["FONT_SM"], justify="left").pack(
+            padx=20, pady=6, anchor="w"
+        )
+
+        batch_row = ctk.CTkFrame(dlg, fg_color="transparent")
+        batch_row.pack(fill="x", padx=20, pady=6)
+        ctk.CTkLabel(batch_row, text="Batch size:", font=THEME["FONT_SM"]).pack(side="left", padx=(0, 6))
+        ctk.CTkEntry(batch_row, textvariable=self.batch_size_var, width=60).pack(side="left", padx=(0, 12))
+        ctk.CTkLabel(batch_row, text="Token budget (0 = off):", font=THEME["FONT_SM"]).pack(side="left", padx=(0, 6))
+        ctk.CTkEntry(batch_row, textvariable=self.token_budget_var, width=80).pack(side="left")
+
+        ctk.CTkLabel(dlg, text="Resident models", font=THEME["FONT_MD"]).pack(padx=20, pady=(10, 2), anchor="w")
+        ctk.CTkLabel(dlg, text=self._memory_text(), font=THEME["FONT_SM"], justify="left").pack(
+            padx=20, pady=2, anchor="w"
+        )
+        mem_row = ctk.CTkFrame(dlg, fg_color="transparent")
+        mem_row.pack(fill="x", padx=20, pady=6)
+        ctk.CTkLabel(mem_row, text="Memory budget MB (0 = off):", font=THEME["FONT_SM"]).pack(side="left", padx=(0, 6))
+        ctk.CTkEntry(mem_row, textvariable=self.memory_budget_var, width=80).pack(side="left", padx=(0, 12))
+        ctk.CTkButton(mem_row, text="Apply", width=70, command=self._apply_memory_budget).pack(side="left")
+
+        ctk.CTkButton(dlg, text="View metrics", command=self.open_metrics).pack(padx=20, pady=6, anchor="w")
         ctk.CTkButton(dlg, text="Close", command=dlg.destroy).pack(side="bottom", pady=16)
 
+    def _metrics_text(self):
+        """One line per series: call counts and latency (count, mean, ~p50/~p95)."""
+        lines = []
+        for m in sorted(REGISTRY.series(), key=lambda m: (m.name, sorted(m.labels.items()))):
+            labels = ", ".join(f"{k}={v}" for k, v in sorted(m.labels.items()))
+            if m.kind == "histogram":
+                snap = m.snapshot()
+                mean = snap["sum"] / snap["count"] if snap["count"] else 0.0
+                lines.append(
+                    f"{m.name} [{labels}]  n={snap['count']}  mean={mean:.3f}  "
+                    f"p50≈{m.quantile(0.5):.3f}  p95≈{m.quantile(0.95):.3f}"
+                )
+            else:
+                lines.append(f"{m.name} [{labels}]  {m.value}")
+        return "\n".join(lines) or "No metrics recorded yet."
+
+    def export_activity(self):
+        path = filedialog.asksaveasfilename(defaultextension=".log", initialfile="activity.log")
+        if not path:
+            return
+        try:
+            self.activity_log.export(path)
+            self.add_activity(f"Exported activity log to {os.path.basename(path)}")
+        except OSError as e:
+            messagebox.showerror("Export failed", str(e))
+
+    def open_metrics(self):
+        win = ctk.CTkToplevel(self)
+        win.title("Metrics")
+        win.geometry("820x480")
+        box = ctk.CTkTextbox(win, wrap="none", font=THEME["FONT_SM"])
+        box.pack(fill="both", expand=True, padx=12, pady=(12, 6))
+
+        def _refresh():
+            box.configure(state="normal")
+            box.delete("1.0", "end")
+            box.insert("1.0", self._metrics_text())
+            box.configure(state="disabled")
+
+        def _export(fmt):
+            ext = ".json" if fmt == "json" else ".prom"
+            path = filedialog.asksaveasfilename(defaultextension=ext, initialfile=f"metrics{ext}")
+            if not path:
+                return
+            try:
+                if fmt == "json":
+                    REGISTRY.write_json(path)
+                else:
+                    REGISTRY.write_prometheus(path)
+                self.add_activity(f"Exported metrics to {os.path.basename(path)}")
+            except Exception as e:
+                messagebox.showerror("Export failed", str(e))
+
+        row = ctk.CTkFrame(win, fg_color="transparent")
+        row.pack(fill="x", padx=12, pady=(0, 12))
+        ctk.CTkButton(row, text="Refresh", command=_refresh).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(row, text="Export JSON", command=lambda: _export("json")).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(row, text="Export Prometheus", command=lambda: _export("prom")).pack(side="left")
+        ctk.CTkButton(row, text="Close", command=win.destroy).pack(side="right")
+        _refresh()
+
     def show_about(self):
         messagebox.showinfo(
             "About",
@@ -391,7 +929,7 @@ class NLPApp(ctk.CTk):
 
     def destroy(self):
         try:
-            self.executor.shutdown(wait=False)
+            self.scheduler.shutdown(wait=False)
         except Exception:
             pass
         super().destroy()
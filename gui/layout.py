@@ -1,6 +1,8 @@
 import customtkinter as ctk
 from tkinter import filedialog
+from .activity import ActivityPanel
 from .theme import THEME
+from model.summary_model import DEFAULT_PRESET, PRESETS
 
 
 class ToolTip:
@@ -111,7 +113,7 @@ def setup_layout(app):
 
         btn = ctk.CTkButton(
             task_container,
-            text=task,
+            text=app._task_label(task),
             image=icon,
             compound="left",
             width=THEME["SIDEBAR_WIDTH"] - 32,
@@ -188,7 +190,13 @@ def setup_layout(app):
     ToolTip(app.run_button, "Run the selected task (Ctrl+R)")
 
     def _run_batch():
-        path = filedialog.askopenfilename()
+        if app.current_task == "Image Classification":
+            # A folder of images; cancelling falls back to a file listing image paths
+            path = filedialog.askdirectory(title="Select an image folder")
+            if not path:
+                path = filedialog.askopenfilename(title="Select a file of image paths")
+        else:
+            path = filedialog.askopenfilename()
         if path:
             app.run_batch_file(app.current_task, path)
 
@@ -202,7 +210,18 @@ def setup_layout(app):
         fg_color=THEME["PRIMARY"]
     )
     app.batch_button.pack(side="left", padx=(6, 12))
-    ToolTip(app.batch_button, "Run batch file for Summarization/Translation")
+    ToolTip(app.batch_button, "Run a batch file (one input per line), or an image folder")
+
+    app.cancel_button = ctk.CTkButton(
+        right_nav,
+        text="Cancel",
+        width=80,
+        height=36,
+        command=app.cancel_batch,
+        state="disabled",
+    )
+    app.cancel_button.pack(side="left", padx=(0, 12))
+    ToolTip(app.cancel_button, "Stop the running batch after the current chunk")
 
     clear_btn = ctk.CTkButton(
         right_nav,
@@ -282,6 +301,25 @@ def setup_layout(app):
     ctk.CTkLabel(toolbar_row1, text="Min length:", font=THEME["FONT_SM"]).pack(side="left", padx=(0, 6))
     ctk.CTkEntry(toolbar_row1, textvariable=app.min_len, width=80, height=32).pack(side="left", padx=(0, 12))
 
+    # Summary decoding preset (model.summary_model.PRESETS)
+    app.preset_var = ctk.StringVar(value=DEFAULT_PRESET)
+    ctk.CTkLabel(toolbar_row1, text="Summary:", font=THEME["FONT_SM"]).pack(side="left", padx=(0, 6))
+    preset_menu = ctk.CTkOptionMenu(
+        toolbar_row1, variable=app.preset_var, values=list(PRESETS),
+        width=110, height=32, fg_color=THEME["PRIMARY"],
+    )
+    preset_menu.pack(side="left", padx=(0, 12))
+    ToolTip(preset_menu, "fast: greedy, streams as it decodes · balanced: 2 beams · "
+                         "best: 4 beams (slowest); beam presets show the summary when done")
+
+    # Summaries of inputs longer than the model window go through map-reduce
+    app.long_doc_var = ctk.BooleanVar(value=True)
+    long_doc_chk = ctk.CTkCheckBox(
+        toolbar_row1, text="Long documents", variable=app.long_doc_var, font=THEME["FONT_SM"]
+    )
+    long_doc_chk.pack(side="left", padx=(0, 12))
+    ToolTip(long_doc_chk, "Summarize text past 1024 tokens in chunks instead of truncating")
+
     # Second row: Language dropdown
     toolbar_row2 = ctk.CTkFrame(toolbar, fg_color="transparent")
     toolbar_row2.pack(fill="x", pady=(6, 0))
@@ -400,21 +438,16 @@ def setup_layout(app):
     ctk.CTkLabel(rp_header, text="Activity", font=THEME["FONT_MD"]).pack(side="left")
     if app.icons.get("history"):
         ctk.CTkLabel(rp_header, image=app.icons["history"], text="").pack(side="right")
+    export_btn = ctk.CTkButton(rp_header, text="Export", width=64, command=app.export_activity)
+    export_btn.pack(side="right", padx=(0, 6))
+    ToolTip(export_btn, "Save the activity log to a text file")
 
-    app.activity_list = ctk.CTkScrollableFrame(
-        app.right_panel, fg_color="transparent", height=420
-    )
+    # Bounded log (app.activity_log); only the rows that fit are drawn
+    app.activity_list = ActivityPanel(app.right_panel, app.activity_log, height=420)
     app.activity_list.pack(fill="both", expand=True, padx=P, pady=(0, P))
 
-    def add_activity(text):
-        item = ctk.CTkLabel(
-            app.activity_list,
-            text=text,
-            anchor="w",
-            wraplength=260,
-            font=THEME["FONT_SM"],
-        )
-        item.pack(fill="x", pady=6, padx=6)
+    # Safe from any thread; bursts are drawn together on the next refresh
+    add_activity = app.activity_list.add
 
     add_activity("Welcome to NeuralFlow Studio — recent actions will appear here.")
     add_activity(
@@ -107,6 +107,7 @@ def update_colors(app):
     for btn_name in (
         "run_button",
         "batch_button",
+        "cancel_button",
         "clear_btn",
         "menu_btn",
         "image_browse_btn",
@@ -1,3 +1,22 @@
 # models/__init__.py
-from .translation_model import TranslationModelAdapter
-from .image_model import ImageClassificationModelAdapter
+# Exports resolve on first access so `import model` stays cheap; torch and
+# transformers are only imported when a model is loaded.
+import importlib
+
+_EXPORTS = {
+    "TranslationModelAdapter": ".translation_model",
+    "ImageClassificationModelAdapter": ".image_model",
+    "TranslationModelPool": ".translation_pool",
+    "LazyModel": ".loader",
+    "ModelState": ".loader",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
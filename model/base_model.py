@@ -1,8 +1,107 @@
 # base_model.py
 
+import gc
+import threading
 from abc import ABC, abstractmethod
+from model.batching import DEFAULT_BATCH_SIZE
+from Utils.decorators import log_action, measure_time
 
-class BaseNLPModel(ABC):
+
+# Capabilities an adapter can declare
+STREAMING = "streaming"          # has stream(item, **params) yielding text pieces
+BATCHING = "batching"            # run_batch() batches natively (not a loop over run())
+DETERMINISTIC = "deterministic"  # same input + params → same output (safe to cache)
+
+
+def module_bytes(module) -> int:
+    """Bytes of a torch module's weights and buffers (0 for None/non-torch models)."""
+    if module is None or not hasattr(module, "state_dict"):
+        return 0
+    total, seen = 0, set()
+    for value in module.state_dict().values():
+        # Quantized Linear layers store packed (weight, bias) tuples
+        for t in value if isinstance(value, tuple) else (value,):
+            if hasattr(t, "element_size") and t.data_ptr() not in seen:
+                seen.add(t.data_ptr())
+                total += t.nelement() * t.element_size()
+    return total
+
+
+class ModelAdapter(ABC):
+    """
+    Interface every model implements.
+
+    run(item, **params) handles one input; run_batch(items, ...) handles many
+    and returns results in input order. Weights are loaded by load() (the
+    constructors call it) and released by unload(); run() on an unloaded
+    adapter loads it again.
+    """
+
+    task = ""
+    capabilities = frozenset()
+
+    def load(self):
+        """Load weights if needed; returns self."""
+        if not getattr(self, "_loaded", False):
+            with self._lifecycle_lock():
+                if not getattr(self, "_loaded", False):
+                    self._load()
+                    self._loaded = True
+        return self
+
+    def unload(self):
+        """Drop weights so their memory can be reclaimed."""
+        if getattr(self, "_loaded", False):
+            with self._lifecycle_lock():
+                if self._loaded:
+                    self._unload()
+                    self._loaded = False
+            gc.collect()
+
+    @property
+    def is_loaded(self) -> bool:
+        return getattr(self, "_loaded", False)
+
+    def _lifecycle_lock(self):
+        return self.__dict__.setdefault("_lifecycle", threading.Lock())
+
+    @abstractmethod
+    def _load(self): ...
+    @abstractmethod
+    def _unload(self): ...
+
+    def supports(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+    def deterministic(self, **params) -> bool:
+        """True if run(item, **params) always gives the same output."""
+        return self.supports(DETERMINISTIC)
+
+    def torch_model(self):
+        """The loaded torch module (None if unloaded or not a torch model)."""
+        return getattr(self, "model", None)
+
+    def memory_footprint(self) -> int:
+        """Approximate bytes held by weights and buffers (0 when unloaded)."""
+        if not self.is_loaded:
+            return 0
+        if getattr(self, "backend", "pytorch") == "onnx":
+            # ORT sessions are not torch modules; their weights are the exported files
+            from model.onnx_backend import onnx_bytes
+            return onnx_bytes(self.torch_model())
+        return module_bytes(self.torch_model())
+
+    @abstractmethod
+    def run(self, item, **params):
+        """Run inference on one input."""
+
+    def run_batch(self, items, batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = None,
+                  **params):
+        """Run many inputs; results keep input order."""
+        return [self.run(item, **params) for item in items]
+
+
+class BaseNLPModel(ModelAdapter):
     """Abstract base class for NLP models."""
 
     def __init__(self, model_name: str):
@@ -16,9 +115,9 @@ class BaseNLPModel(ABC):
     def get_model_name(self):
         """Accessor for encapsulated attribute."""
         return self._model_name
-    
 
-class BaseModelAdapter(ABC):
+
+class BaseModelAdapter(ModelAdapter):
     def __init__(self, model_name: str, task: str):
         self._model_name = model_name
         self._task = task
@@ -29,9 +128,17 @@ class BaseModelAdapter(ABC):
     @property
     def task(self): return self._task
 
+    def _load(self):
+        self.__pipeline = self._build_pipeline()
+
+    def _unload(self):
+        self.__pipeline = None
+
+    def torch_model(self):
+        return getattr(self.__pipeline, "model", None)
+
     def _ensure_pipeline(self):
-        if self.__pipeline is None:
-            self.__pipeline = self._build_pipeline()
+        self.load()
         return self.__pipeline
 
     @abstractmethod
@@ -41,9 +148,10 @@ class BaseModelAdapter(ABC):
     @abstractmethod
     def postprocess(self, raw_output): ...
 
+    @log_action
+    @measure_time
     def run(self, raw_input):
         x = self.preprocess(raw_input)     # overridden in child
         pipe = self._ensure_pipeline()
         out = pipe(x)
         return self.postprocess(out)       # overridden in child
-
@@ -0,0 +1,58 @@
+# batch_job.py
+
+import threading
+import time
+
+
+class BatchJob:
+    """
+    A cancellable batch over a list of inputs, processed chunk by chunk.
+
+    Iterating the job calls run_fn(chunk) -> outputs for one chunk at a time
+    and yields (offset, chunk, outputs), so callers can show results as they
+    arrive. cancel() takes effect between chunks.
+    """
+
+    def __init__(self, items, run_fn, chunk_size: int = 32):
+        self.items = list(items)
+        self._run_fn = run_fn
+        self.chunk_size = max(1, int(chunk_size))
+        self._cancel = threading.Event()
+        self.completed = 0
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def total(self): return len(self.items)
+    @property
+    def cancelled(self): return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def __iter__(self):
+        self.started_at = time.perf_counter()
+        try:
+            for offset in range(0, self.total, self.chunk_size):
+                if self.cancelled:
+                    break
+                chunk = self.items[offset:offset + self.chunk_size]
+                outputs = self._run_fn(chunk)
+                self.completed += len(chunk)
+                yield offset, chunk, outputs
+        finally:
+            self.finished_at = time.perf_counter()
+
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def throughput(self) -> float:
+        """Completed items per second."""
+        elapsed = self.elapsed()
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def progress(self) -> float:
+        return self.completed / self.total if self.total else 1.0
@@ -0,0 +1,50 @@
+# batching.py
+
+DEFAULT_BATCH_SIZE = 8
+
+
+def length_buckets(lengths, batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = None):
+    """
+    Group item indices into batches of similar length.
+
+    Indices are sorted by length so each padded batch wastes little padding.
+    A batch closes at batch_size items, or earlier when max_tokens is set and
+    (longest item × items) would exceed the token budget.
+    """
+    batch_size = max(1, int(batch_size or 1))
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batch, longest = [], 0
+    for i in order:
+        size = max(longest, lengths[i])
+        if batch and (
+            len(batch) >= batch_size
+            or (max_tokens and size * (len(batch) + 1) > max_tokens)
+        ):
+            yield batch
+            batch, size = [], lengths[i]
+        batch.append(i)
+        longest = size
+    if batch:
+        yield batch
+
+
+def run_bucketed(items, lengths, run_fn, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_tokens: int = None):
+    """
+    Run run_fn(list_of_items) -> list_of_results over length buckets and
+    return the results in the original item order.
+    """
+    results = [None] * len(items)
+    for idx in length_buckets(lengths, batch_size, max_tokens):
+        outputs = run_fn([items[i] for i in idx])
+        for i, out in zip(idx, outputs):
+            results[i] = out
+    return results
+
+
+def token_lengths(tokenizer, texts, max_length: int = None):
+    """Token count per text (capped at max_length), used for bucketing."""
+    ids = tokenizer(list(texts), add_special_tokens=True)["input_ids"]
+    if max_length:
+        return [min(len(x), max_length) for x in ids]
+    return [len(x) for x in ids]
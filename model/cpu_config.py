@@ -0,0 +1,135 @@
+# cpu_config.py
+"""
+CPU threading for torch: process-wide intra-op/inter-op thread counts,
+per-model thread budgets and CPU affinity.
+
+Settings are only recorded by configure(); torch is imported and updated
+when a worker starts (apply()).
+"""
+
+import json
+import logging
+import os
+import threading
+
+
+logger = logging.getLogger("gensumai")
+
+CPU_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".config", "gensumai", "cpu.json")
+
+_settings = {"intra_op": None, "inter_op": None, "models": {}}
+_applied = False
+_lock = threading.Lock()
+
+
+def cpu_count() -> int:
+    """CPUs this process may run on (respects affinity/cgroup masks where exposed)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def parse_cpus(spec: str):
+    """'0-3,6' → {0, 1, 2, 3, 6}."""
+    cpus = set()
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            cpus.update(range(int(lo), int(hi) + 1))
+        else:
+            cpus.add(int(part))
+    return cpus
+
+
+def set_affinity(cpus) -> bool:
+    """Pin the calling process (Linux: the calling thread) to cpus; False if unsupported."""
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, set(cpus))
+    return True
+
+
+def configure(intra_op: int = None, inter_op: int = None, models: dict = None):
+    """Record thread settings; None keeps the current value (or torch's default)."""
+    with _lock:
+        if intra_op is not None:
+            _settings["intra_op"] = int(intra_op)
+        if inter_op is not None:
+            _settings["inter_op"] = int(inter_op)
+        if models:
+            _settings["models"].update({k: int(v) for k, v in models.items() if v})
+
+
+def settings() -> dict:
+    with _lock:
+        return {**_settings, "models": dict(_settings["models"])}
+
+
+def load_file(path: str = CPU_CONFIG_PATH) -> bool:
+    """configure() from a JSON file written by `cli.py autotune --save`; False if missing."""
+    if not os.path.isfile(path):
+        return False
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    configure(data.get("intra_op"), data.get("inter_op"), data.get("models"))
+    return True
+
+
+def save_file(data: dict, path: str = CPU_CONFIG_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+def apply():
+    """Push the process-wide settings into torch (once; inter-op can only be set early)."""
+    global _applied
+    with _lock:
+        if _applied:
+            return
+        _applied = True
+        intra, inter = _settings["intra_op"], _settings["inter_op"]
+    if intra is None and inter is None:
+        return
+    import torch
+
+    if intra:
+        torch.set_num_threads(intra)
+    if inter:
+        try:
+            torch.set_num_interop_threads(inter)
+        except RuntimeError as e:
+            logger.warning("could not set inter-op threads (%s)", e)
+
+
+def model_threads(key) -> int:
+    with _lock:
+        return _settings["models"].get(key)
+
+
+def worker_init(key=None, threads: int = None, cpus=None):
+    """
+    Build an initializer for a model's worker thread. It applies the process
+    settings and then the model's thread budget (threads, or the configured
+    budget for key).
+
+    torch.set_num_threads also sets a process-wide count that every thread
+    picks up on its first parallel op, so in one process the lane that
+    starts last decides the budget for all of them. Budgets are only
+    isolated per model with execution="process" (one worker per model).
+    """
+    def _init():
+        apply()
+        if cpus:
+            set_affinity(cpus)
+        budget = threads or (model_threads(key) if key is not None else None)
+        if budget:
+            import torch
+            torch.set_num_threads(budget)
+    return _init
@@ -1,8 +1,15 @@
 # image_model.py
 
 import os
-from transformers import pipeline
-from model.base_model import BaseModelAdapter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from model.base_model import BATCHING, DETERMINISTIC, BaseModelAdapter
+from model.precision import apply_precision, load_kwargs, resolve_precision
+from model.onnx_backend import try_load_onnx
+
+
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp"}
 
 
 class ImageClassificationModelAdapter(BaseModelAdapter):
@@ -11,14 +18,29 @@ class ImageClassificationModelAdapter(BaseModelAdapter):
     Your BaseModelAdapter sets (model_name, task) and may implement shared utilities.
     """
 
-    def __init__(self):
-        super().__init__(
-            model_name="google/vit-base-patch16-224", task="image-classification"
-        )
+    capabilities = frozenset({BATCHING, DETERMINISTIC})
+
+    def __init__(self, precision: str = "fp32", backend: str = "pytorch",
+                 model_name: str = "google/vit-base-patch16-224"):
+        super().__init__(model_name=model_name, task="image-classification")
+        self.precision = precision
+        self.backend = backend
 
     def _build_pipeline(self):
+        from transformers import AutoImageProcessor, pipeline
+
         # Lazily build a HF pipeline for image classification
-        return pipeline(self.task, model=self.model_name)
+        if self.backend == "onnx":
+            ort_model = try_load_onnx(self.model_name, "image-classification")
+            if ort_model is not None:
+                self.precision = "fp32"
+                processor = AutoImageProcessor.from_pretrained(self.model_name)
+                return pipeline(self.task, model=ort_model, image_processor=processor)
+            self.backend = "pytorch"
+        self.precision = resolve_precision(self.precision)
+        pipe = pipeline(self.task, model=self.model_name, **load_kwargs(self.precision))
+        pipe.model = apply_precision(pipe.model, self.precision)
+        return pipe
 
     def preprocess(self, raw_input: str):
         # Here, input is just an image path selected via filedialog
@@ -28,6 +50,81 @@ class ImageClassificationModelAdapter(BaseModelAdapter):
         # Format top-3 predictions nicely
         return "\n".join([f"{o['label']} ({o['score']:.2f})" for o in output[:3]])
 
+    # ------------------ Batched classification ------------------
+    @staticmethod
+    def list_images(directory: str):
+        """Image files directly inside directory, sorted by name."""
+        return [
+            os.path.join(directory, fn)
+            for fn in sorted(os.listdir(directory))
+            if os.path.splitext(fn)[1].lower() in IMAGE_EXTS
+        ]
+
+    def _input_size(self, pipe):
+        size = getattr(getattr(pipe, "image_processor", None), "size", None) or {}
+        if "height" in size and "width" in size:
+            return (size["width"], size["height"])
+        return None
+
+    @staticmethod
+    def load_image(path: str, size=None):
+        """Decode an image to RGB and resize it to the model input size."""
+        from PIL import Image
+
+        with Image.open(path) as img:
+            img = img.convert("RGB")
+            if size and img.size != size:
+                img = img.resize(size, Image.BILINEAR)
+        return img
+
+    def classify_batch(self, paths, batch_size: int = 8, workers: int = 4):
+        """
+        Classify many images, yielding (path, result) in input order.
+
+        Decoding and resizing run on a thread pool one batch ahead of the
+        model, so PIL work overlaps with inference. Files that fail to decode
+        yield an "Error: ..." result instead of aborting the batch.
+        """
+        paths = list(paths)
+        pipe = self._ensure_pipeline()
+        size = self._input_size(pipe)
+        chunks = iter([paths[i:i + batch_size] for i in range(0, len(paths), batch_size)])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+
+            def submit_next():
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append(
+                        (chunk, [pool.submit(self.load_image, p, size) for p in chunk])
+                    )
+
+            submit_next()
+            submit_next()  # keep one batch decoding while the current one runs
+            while pending:
+                chunk, futures = pending.popleft()
+                submit_next()
+
+                results, images = {}, []
+                for i, fut in enumerate(futures):
+                    try:
+                        images.append((i, fut.result()))
+                    except Exception as e:
+                        results[i] = f"Error: {e}"
+
+                if images:
+                    outputs = pipe([img for _, img in images], batch_size=len(images))
+                    for (i, _), out in zip(images, outputs):
+                        results[i] = self.postprocess(out)
+
+                for i, path in enumerate(chunk):
+                    yield path, results[i]
+
+    def run_batch(self, paths, batch_size: int = 8, max_tokens: int = None):
+        """classify_batch() as a list in input order (max_tokens does not apply to images)."""
+        return [res for _, res in self.classify_batch(paths, batch_size=batch_size)]
+
     def save_output(self, result: str, filename: str = "image_output.txt"):
         os.makedirs("outputs", exist_ok=True)
         path = os.path.join("outputs", filename)
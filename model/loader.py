@@ -0,0 +1,133 @@
+# loader.py
+
+import gc
+import threading
+import time
+
+
+class ModelState:
+    """Lifecycle states shown in the UI."""
+    NOT_LOADED = "not loaded"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class LazyModel:
+    """
+    Handle that builds a model on first use.
+
+    `factory` is only called by load()/get(); until then the handle is cheap
+    and only knows the display name. unload() drops the model (calling
+    on_unload(model) first, e.g. to clear a pool) and the next get() builds
+    it again. Listeners are called as listener(handle, state) from whichever
+    thread changes the state.
+    """
+
+    def __init__(self, display_name: str, factory, on_unload=None):
+        self._display_name = display_name
+        self._factory = factory
+        self._on_unload = on_unload
+        self.last_used = 0.0   # time.monotonic() of the last get()
+        self._model = None
+        self._state = ModelState.NOT_LOADED
+        self._error = None
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    @property
+    def state(self): return self._state
+    @property
+    def error(self): return self._error
+    @property
+    def is_ready(self): return self._state == ModelState.READY
+    @property
+    def model(self):
+        """The loaded model, or None (never triggers a load)."""
+        return self._model
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def _set_state(self, state):
+        self._state = state
+        for listener in list(self._listeners):
+            try:
+                listener(self, state)
+            except Exception:
+                pass
+
+    def load(self):
+        """Build the model if needed (blocking) and return it."""
+        self.last_used = time.monotonic()
+        model = self._model
+        if model is not None:
+            return model
+        loaded = False
+        with self._lock:
+            if self._model is None:
+                self._error = None
+                self._set_state(ModelState.LOADING)
+                try:
+                    self._model = self._factory()
+                except Exception as e:
+                    self._error = e
+                    self._set_state(ModelState.FAILED)
+                    raise
+                loaded = True
+            model = self._model
+        # Outside the lock: READY listeners may unload other handles
+        if loaded:
+            self._set_state(ModelState.READY)
+        return model
+
+    get = load
+
+    def unload(self):
+        """
+        Drop the loaded model. A job already holding it keeps running; the
+        memory is released when that job lets go of it.
+        """
+        with self._lock:
+            model, self._model = self._model, None
+            if model is None:
+                return
+            if self._on_unload is not None:
+                try:
+                    self._on_unload(model)
+                except Exception:
+                    pass
+            del model
+        self._set_state(ModelState.NOT_LOADED)
+        gc.collect()
+
+    # Friendly name for UI (available before loading)
+    def get_model_name(self) -> str:
+        return self._display_name
+
+    def __str__(self) -> str:
+        return self.get_model_name()
+
+
+def warm_up(models, order=None):
+    """
+    Load models one by one on a daemon thread, in priority order.
+
+    Models that are already loaded (or loading on demand) are skipped;
+    failures are recorded on the handle and do not stop the warm-up.
+    """
+    order = list(order) if order is not None else list(models.keys())
+
+    def _worker():
+        for key in order:
+            handle = models.get(key)
+            if handle is None or handle.state != ModelState.NOT_LOADED:
+                continue
+            try:
+                handle.load()
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=_worker, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
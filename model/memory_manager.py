@@ -0,0 +1,114 @@
+# memory_manager.py
+
+import threading
+import time
+
+from model.loader import ModelState
+
+
+def footprint(model) -> int:
+    """Bytes held by a loaded model: an adapter or a pool of adapters."""
+    if model is None:
+        return 0
+    try:
+        if hasattr(model, "memory_used"):       # TranslationModelPool
+            return model.memory_used()
+        return model.memory_footprint()
+    except Exception:
+        return 0
+
+
+class MemoryManager:
+    """
+    Keeps the models behind LazyModel handles under a memory budget.
+
+    Each handle's footprint (weights and buffers) is measured when it finishes
+    loading; enforce() then unloads the least recently used handles until
+    the total fits budget_bytes. Handles that is_busy(key) reports as
+    running or queued, and pinned handles, are never unloaded. Unloaded
+    handles reload on their next get().
+    """
+
+    def __init__(self, budget_bytes: int = None, is_busy=None, on_unload=None):
+        self.budget_bytes = budget_bytes
+        self._is_busy = is_busy or (lambda key: False)
+        self._on_unload = on_unload      # on_unload(key, handle, freed_bytes)
+        self._handles = {}               # key → LazyModel
+        self._sizes = {}                 # key → bytes measured at load
+        self._pinned = set()
+        self._lock = threading.RLock()
+        self.unloads = 0
+
+    def register(self, key, handle, pinned: bool = False):
+        with self._lock:
+            self._handles[key] = handle
+            if pinned:
+                self._pinned.add(key)
+        handle.add_listener(lambda h, state, key=key: self._on_state(key, h, state))
+
+    def _on_state(self, key, handle, state):
+        if state == ModelState.READY:
+            with self._lock:
+                self._sizes[key] = footprint(handle.model)
+            self.enforce(keep=key)
+        elif state in (ModelState.NOT_LOADED, ModelState.FAILED):
+            with self._lock:
+                self._sizes.pop(key, None)
+
+    def _size(self, key) -> int:
+        handle = self._handles[key]
+        if handle.model is None:
+            return 0
+        # Pools grow as languages load, so measure those live
+        if hasattr(handle.model, "memory_used"):
+            return footprint(handle.model)
+        return self._sizes.get(key, 0)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self._size(key) for key in self._handles)
+
+    def set_budget(self, budget_bytes: int = None):
+        self.budget_bytes = budget_bytes
+        self.enforce()
+
+    def enforce(self, keep=None):
+        """Unload least recently used idle models until under budget; return keys unloaded."""
+        unloaded = []
+        if self.budget_bytes is None:
+            return unloaded
+        with self._lock:
+            while self.total_bytes() > self.budget_bytes:
+                candidates = [
+                    key for key, h in self._handles.items()
+                    if h.model is not None and key != keep
+                    and key not in self._pinned and not self._is_busy(key)
+                ]
+                if not candidates:
+                    break
+                key = min(candidates, key=lambda k: self._handles[k].last_used)
+                freed = self._size(key)
+                self._handles[key].unload()
+                self._sizes.pop(key, None)
+                self.unloads += 1
+                unloaded.append(key)
+                if self._on_unload is not None:
+                    self._on_unload(key, self._handles[key], freed)
+        return unloaded
+
+    def usage(self):
+        """Loaded models, most recently used first."""
+        now = time.monotonic()
+        with self._lock:
+            rows = [
+                {
+                    "key": key,
+                    "name": h.get_model_name(),
+                    "bytes": self._size(key),
+                    "idle_s": round(now - h.last_used, 1),
+                    "pinned": key in self._pinned,
+                }
+                for key, h in self._handles.items()
+                if h.model is not None
+            ]
+        return sorted(rows, key=lambda r: r["idle_s"])
@@ -0,0 +1,86 @@
+# micro_batcher.py
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+
+class MicroBatcher:
+    """
+    Gathers concurrent single requests into micro-batches.
+
+    The first request opens a batch; the batch closes when max_batch items
+    have arrived or window_ms has passed, whichever is first. run_batch(items)
+    must return one output per item in order. on_batch(size, seconds) is
+    called after each batch (e.g. to record histograms).
+    """
+
+    def __init__(self, run_batch, max_batch: int = 8, window_ms: float = 10.0,
+                 on_batch=None, name: str = "micro-batcher"):
+        self._run_batch = run_batch
+        self.max_batch = max(1, int(max_batch))
+        self.window = max(0.0, window_ms) / 1000.0
+        self._on_batch = on_batch
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item) -> Future:
+        if self._closed:
+            raise RuntimeError("batcher is closed")
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                self._queue.put(None)   # finish this batch, then stop
+                break
+            batch.append(entry)
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            batch = [(item, fut) for item, fut in batch if fut.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            start = time.perf_counter()
+            try:
+                outputs = self._run_batch([item for item, _ in batch])
+                if len(outputs) != len(batch):
+                    raise RuntimeError(
+                        f"batch returned {len(outputs)} outputs for {len(batch)} inputs"
+                    )
+            except Exception as e:
+                for _, fut in batch:
+                    fut.set_exception(e)
+            else:
+                for (_, fut), out in zip(batch, outputs):
+                    fut.set_result(out)
+            if self._on_batch is not None:
+                try:
+                    self._on_batch(len(batch), time.perf_counter() - start)
+                except Exception:
+                    pass
+
+    def close(self):
+        self._closed = True
+        self._queue.put(None)
@@ -0,0 +1,109 @@
+# onnx_backend.py
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+
+
+logger = logging.getLogger("gensumai")
+
+BACKENDS = ("pytorch", "onnx")
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gensumai", "onnx")
+
+# kind → optimum.onnxruntime class name
+_ORT_CLASSES = {
+    "seq2seq": "ORTModelForSeq2SeqLM",
+    "causal-lm": "ORTModelForCausalLM",
+    "image-classification": "ORTModelForImageClassification",
+}
+
+
+def onnx_available() -> bool:
+    try:
+        import onnxruntime  # noqa: F401
+        import optimum.onnxruntime  # noqa: F401
+        return True
+    except Exception:
+        return False
+
+
+def model_version(model_name: str) -> str:
+    """Checkpoint revision (hub commit hash when known) plus the optimum version."""
+    import optimum.version
+    from transformers import AutoConfig
+
+    revision = "local"
+    if not os.path.isdir(model_name):
+        config = AutoConfig.from_pretrained(model_name)
+        revision = (getattr(config, "_commit_hash", None) or "main")[:12]
+    return f"{revision}-optimum{optimum.version.__version__}"
+
+
+def export_dir(model_name: str, version: str, cache_dir: str = ONNX_CACHE_DIR) -> str:
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "--", model_name.strip("/"))
+    return os.path.join(cache_dir, slug, version)
+
+
+def load_onnx_model(model_name: str, kind: str, cache_dir: str = ONNX_CACHE_DIR):
+    """
+    Load an ONNX Runtime model for model_name, exporting it on first use.
+
+    Exported graphs are cached under cache_dir/<model>/<version>, so export
+    happens once per checkpoint version. Decoders are exported with KV past
+    state (use_cache=True) so generation does not re-run the whole prefix.
+    """
+    import optimum.onnxruntime as ort
+
+    cls = getattr(ort, _ORT_CLASSES[kind])
+    kwargs = {"use_cache": True} if kind in ("seq2seq", "causal-lm") else {}
+    path = export_dir(model_name, model_version(model_name), cache_dir)
+
+    if os.path.isfile(os.path.join(path, "config.json")):
+        model = cls.from_pretrained(path, **kwargs)
+    else:
+        model = cls.from_pretrained(model_name, export=True, **kwargs)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".")
+        model.save_pretrained(tmp)
+        _publish(tmp, path)
+    model.onnx_export_dir = path   # for onnx_bytes()
+    return model
+
+
+def _publish(tmp: str, path: str):
+    """
+    Move a finished export from tmp to path. If another process published
+    a complete export there first, keep it and drop tmp.
+    """
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isfile(os.path.join(path, "config.json")):
+            raise
+
+
+def onnx_bytes(model) -> int:
+    """Size of an ONNX model's graph and external weight files (.onnx / .onnx_data)."""
+    path = getattr(model, "onnx_export_dir", None) or getattr(model, "model_save_dir", None)
+    if not path or not os.path.isdir(path):
+        return 0
+    total = 0
+    for fn in os.listdir(path):
+        if fn.endswith((".onnx", ".onnx_data")):
+            total += os.path.getsize(os.path.join(path, fn))
+    return total
+
+
+def try_load_onnx(model_name: str, kind: str):
+    """load_onnx_model(), or None (with a warning) so callers fall back to PyTorch."""
+    if not onnx_available():
+        logger.warning("onnxruntime/optimum not installed; using the PyTorch backend")
+        return None
+    try:
+        return load_onnx_model(model_name, kind)
+    except Exception as e:
+        logger.warning("ONNX export/load failed for %s (%s); using PyTorch", model_name, e)
+        return None
@@ -0,0 +1,92 @@
+# precision.py
+
+# PRECISIONS is read by argument parsers; torch is only needed once a model loads
+
+import logging
+
+logger = logging.getLogger("gensumai")
+
+PRECISIONS = ("fp32", "int8", "bf16")
+
+
+def bf16_supported() -> bool:
+    """True if this CPU has native bf16 support in oneDNN."""
+    try:
+        import torch
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
+
+def resolve_precision(precision: str) -> str:
+    """Validate precision; bf16 falls back to fp32 on CPUs without support."""
+    precision = (precision or "fp32").lower()
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}' (choose from {', '.join(PRECISIONS)})")
+    if precision == "bf16" and not bf16_supported():
+        logger.warning("bf16 is not supported on this CPU; using fp32")
+        return "fp32"
+    return precision
+
+
+def load_kwargs(precision: str) -> dict:
+    """Extra from_pretrained()/pipeline() kwargs for a resolved precision."""
+    if precision == "bf16":
+        import torch
+        return {"torch_dtype": torch.bfloat16}
+    return {}
+
+
+def _conv1d_to_linear(model):
+    """
+    Swap transformers Conv1D layers (GPT-2 attention/MLP) for equivalent
+    nn.Linear layers so dynamic quantization picks them up. Conv1D computes
+    x @ W + b with W stored as (in, out); Linear stores W transposed.
+    """
+    import torch
+
+    for parent in list(model.modules()):
+        for name, child in list(parent.named_children()):
+            if type(child).__name__ != "Conv1D":
+                continue
+            in_features, out_features = child.weight.shape
+            linear = torch.nn.Linear(in_features, out_features, bias=child.bias is not None,
+                                     dtype=child.weight.dtype)
+            with torch.no_grad():
+                linear.weight.copy_(child.weight.t())
+                if child.bias is not None:
+                    linear.bias.copy_(child.bias)
+            setattr(parent, name, linear)
+    return model
+
+
+def _tied_modules(model):
+    """Output heads that share their weight with the input embedding."""
+    get_out = getattr(model, "get_output_embeddings", None)
+    get_in = getattr(model, "get_input_embeddings", None)
+    if get_out is None or get_in is None:
+        return set()
+    head, embeddings = get_out(), get_in()
+    if head is None or embeddings is None or head.weight is not embeddings.weight:
+        return set()
+    return {head}
+
+
+def apply_precision(model, precision: str):
+    """
+    Post-load step: dynamic int8 quantization of the Linear layers (Conv1D
+    layers are converted to Linear first). Heads tied to the input embedding
+    stay in fp32: quantizing them would add a second copy of the weights.
+    """
+    if precision == "int8":
+        import torch
+
+        model = _conv1d_to_linear(model)
+        tied = _tied_modules(model)
+        qconfig = torch.ao.quantization.default_dynamic_qconfig
+        spec = {
+            name: qconfig for name, module in model.named_modules()
+            if isinstance(module, torch.nn.Linear) and module not in tied
+        }
+        return torch.ao.quantization.quantize_dynamic(model, spec, dtype=torch.qint8)
+    return model
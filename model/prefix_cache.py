@@ -0,0 +1,132 @@
+# prefix_cache.py
+
+import copy
+import threading
+from collections import OrderedDict
+
+
+def _layers(past):
+    """(key, value) tensor pairs of a transformers cache or a legacy tuple cache."""
+    if hasattr(past, "layers"):              # transformers >= 4.56
+        return [(layer.keys, layer.values) for layer in past.layers]
+    if hasattr(past, "key_cache"):           # DynamicCache before 4.56
+        return list(zip(past.key_cache, past.value_cache))
+    return [tuple(layer[:2]) for layer in past]
+
+
+def cache_bytes(past) -> int:
+    total = 0
+    for pair in _layers(past):
+        for t in pair:
+            if t is not None and hasattr(t, "element_size"):
+                total += t.nelement() * t.element_size()
+    return total
+
+
+def _common_prefix(a, b) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class PrefixKVCache:
+    """
+    LRU cache of attention key/value states (past_key_values) for prompt
+    prefixes, bounded by max_bytes.
+
+    Entries are keyed by token ids. lookup(ids) finds the entry sharing the
+    longest common prefix with ids and returns a private copy cropped to that
+    length, so generate() can extend it without touching the stored entry.
+    Prefixes shorter than min_tokens are not worth the copy and are ignored.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, min_tokens: int = 8):
+        self.max_bytes = max_bytes
+        self.min_tokens = min_tokens
+        self._entries = OrderedDict()   # tuple(token ids) → (past, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+        self.evictions = 0
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, ids, limit: int = None):
+        """
+        Return (past, length): a copy of the cached states for ids[:length],
+        or (None, 0). limit caps length (generate needs at least one uncached
+        prompt token).
+        """
+        ids = tuple(ids)
+        limit = len(ids) if limit is None else min(limit, len(ids))
+        with self._lock:
+            best_key, best = None, 0
+            for key in self._entries:
+                n = min(_common_prefix(key, ids), limit)
+                if n > best:
+                    best_key, best = key, n
+            if best_key is None or best < self.min_tokens:
+                self.misses += 1
+                return None, 0
+            self._entries.move_to_end(best_key)
+            past = copy.deepcopy(self._entries[best_key][0])
+            self.hits += 1
+            self.saved_tokens += best
+        if best < len(best_key):
+            past = _crop(past, best)
+        return past, best
+
+    def store(self, ids, past):
+        """Cache a copy of past (the states for exactly ids); evicts LRU entries over budget."""
+        ids = tuple(ids)
+        if len(ids) < self.min_tokens:
+            return
+        size = cache_bytes(past)
+        if size > self.max_bytes:
+            return
+        past = copy.deepcopy(past)
+        with self._lock:
+            old = self._entries.pop(ids, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[ids] = (past, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, freed) = self._entries.popitem(last=False)
+                self._bytes -= freed
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_tokens": self.saved_tokens,
+            "evictions": self.evictions,
+        }
+
+
+def _crop(past, length: int):
+    if hasattr(past, "crop"):
+        past.crop(length)
+        return past
+    return tuple(
+        tuple(t[..., :length, :] for t in layer[:2]) + tuple(layer[2:]) for layer in past
+    )
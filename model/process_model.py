@@ -0,0 +1,377 @@
+# process_model.py
+"""
+Process execution mode: a model hosted in its own worker process.
+
+ProcessModel is a proxy with the ModelAdapter interface (run, run_batch,
+stream, capabilities, load/unload). Calls go over a pipe to a spawned
+child that owns the real adapter, so Python-heavy model code runs outside
+the caller's GIL. Image bytes move through shared memory instead of being
+pickled. If the child dies, the call in flight raises WorkerCrashed and
+the next call starts a fresh child.
+"""
+
+import io
+import itertools
+import multiprocessing
+import queue
+import threading
+import traceback
+import weakref
+from multiprocessing import shared_memory
+
+from model.base_model import DETERMINISTIC
+
+
+EXECUTION_MODES = ("thread", "process")
+
+# Poll interval while waiting on the child (to notice it dying)
+_POLL_S = 0.5
+
+
+class WorkerCrashed(RuntimeError):
+    """The model worker process exited while handling a request."""
+
+
+class RemoteError(RuntimeError):
+    """An exception raised inside the model worker process."""
+
+
+# ------------------ Shared memory payloads ------------------
+def _to_shm(data: bytes):
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    shm.buf[:len(data)] = data
+    return shm
+
+
+def _pack(value, segments):
+    """Replace bytes/BytesIO payloads with shared memory references."""
+    if isinstance(value, io.BytesIO):
+        value = value.getvalue()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        shm = _to_shm(bytes(value))
+        segments.append(shm)
+        return ("__shm__", shm.name, len(value))
+    if isinstance(value, list):
+        return [_pack(v, segments) for v in value]
+    return value
+
+
+def _unpack(value):
+    if isinstance(value, tuple) and len(value) == 3 and value[0] == "__shm__":
+        shm = shared_memory.SharedMemory(name=value[1])
+        try:
+            data = bytes(shm.buf[:value[2]])
+        finally:
+            shm.close()   # the parent owns the segment and unlinks it
+        return io.BytesIO(data)
+    if isinstance(value, list):
+        return [_unpack(v) for v in value]
+    return value
+
+
+# ------------------ Child process ------------------
+def _serve(conn, spec: dict):
+    """Child main loop: load the adapter, then answer (id, method, args, kwargs) requests."""
+    from model import cpu_config
+    from model.tasks import load_model
+
+    load_model = spec.get("loader") or load_model
+
+    if spec.get("cpus"):
+        cpu_config.set_affinity(spec["cpus"])
+    cpu_config.load_file()
+    cpu_config.configure(intra_op=spec.get("threads"))
+    cpu_config.apply()
+
+    try:
+        adapter = load_model(
+            spec["task"], spec["lang"], spec["precision"], spec["backend"], spec["model_name"],
+            options=spec.get("options"),
+        )
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    methods = sorted(
+        name for name in dir(adapter)
+        if not name.startswith("_") and callable(getattr(adapter, name, None))
+    )
+    conn.send(("ready", {
+        "task": adapter.task,
+        "capabilities": sorted(adapter.capabilities),
+        "model_name": getattr(adapter, "model_name", None) or getattr(adapter, "_model_name", None),
+        "precision": getattr(adapter, "precision", "fp32"),
+        "backend": getattr(adapter, "backend", "pytorch"),
+        "display_name": adapter.get_model_name(),
+        "methods": methods,
+    }))
+
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg is None:
+            break
+        if msg[0] == "cancel":
+            continue   # the stream it was meant for already finished
+        rid, method, args, kwargs = msg
+        try:
+            args = [_unpack(a) for a in args]
+            if method == "stream":
+                pieces = adapter.stream(*args, **kwargs)
+                try:
+                    for piece in pieces:
+                        conn.send(("piece", piece))
+                        # The parent sends ("cancel", id) when its consumer stops reading;
+                        # cancels for other requests are stale and dropped
+                        if conn.poll() and conn.recv() == ("cancel", rid):
+                            break
+                finally:
+                    pieces.close()   # stops generate at the next token
+                conn.send(("ok", None))
+            else:
+                conn.send(("ok", getattr(adapter, method)(*args, **kwargs)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=3)}"))
+
+
+def _stop(proc, conn):
+    try:
+        conn.send(None)
+    except Exception:
+        pass
+    proc.join(timeout=5)
+    if proc.is_alive():
+        proc.kill()
+        proc.join(timeout=5)
+    conn.close()
+
+
+# ------------------ Parent-side proxy ------------------
+class ProcessModel:
+    """
+    Proxy for a model running in a worker process (see module docstring).
+
+    Calls are serialized per proxy; run several proxies (replicas) for
+    parallelism. `restarts` counts children replaced after a crash.
+    """
+
+    def __init__(self, task: str, lang: str = "French", precision: str = "fp32",
+                 backend: str = "pytorch", model_name: str = None, threads: int = None,
+                 cpus=None, loader=None, options: dict = None):
+        """loader: picklable replacement for tasks.load_model (same arguments)."""
+        self._spec = {
+            "task": task, "lang": lang, "precision": precision, "backend": backend,
+            "model_name": model_name, "threads": threads, "cpus": sorted(cpus or []),
+            "loader": loader, "options": dict(options or {}),
+        }
+        self._proc = None
+        self._conn = None
+        self._finalizer = None
+        self._info = {}
+        self._lock = threading.RLock()
+        # Held for every send: _cancel() sends while another thread's request holds _lock
+        self._send_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._active = None   # id of the request whose reply is being read
+        self.restarts = 0
+        self.target_lang = lang
+
+    # ---- lifecycle ----
+    def load(self):
+        """Start the worker and wait until its model is loaded; returns self."""
+        with self._lock:
+            if self._proc is not None and self._proc.is_alive():
+                return self
+            ctx = multiprocessing.get_context("spawn")
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(
+                target=_serve, args=(child, self._spec),
+                name=f"model-{self._spec['task']}", daemon=True,
+            )
+            proc.start()
+            child.close()
+            self._proc, self._conn = proc, parent
+            try:
+                kind, payload = self._recv()
+            except (EOFError, OSError):
+                kind, payload = "error", f"exited with code {proc.exitcode}"
+            if kind != "ready":
+                self._shutdown()
+                raise RuntimeError(f"model worker failed to load: {payload}")
+            self._info = payload
+            self._finalizer = weakref.finalize(self, _stop, proc, parent)
+        return self
+
+    def unload(self):
+        """Stop the worker process (its memory goes back to the OS)."""
+        with self._lock:
+            self._shutdown()
+
+    def _shutdown(self):
+        with self._send_lock:
+            self._active = None
+            if self._finalizer is not None:
+                self._finalizer()          # runs _stop once
+                self._finalizer = None
+            elif self._proc is not None:
+                _stop(self._proc, self._conn)
+            self._proc = self._conn = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._proc is not None and self._proc.is_alive()
+
+    @property
+    def pid(self):
+        return self._proc.pid if self._proc is not None else None
+
+    # ---- transport ----
+    def _recv(self):
+        while not self._conn.poll(_POLL_S):
+            if not self._proc.is_alive():
+                raise EOFError
+        return self._conn.recv()
+
+    def _crashed(self):
+        code = None
+        if self._proc is not None:
+            self._proc.join(timeout=1)
+            code = self._proc.exitcode
+        self._shutdown()
+        self.restarts += 1
+        return WorkerCrashed(
+            f"{self._spec['task']} worker exited (code {code}); it restarts on the next request"
+        )
+
+    def _request(self, method, args, kwargs, on_piece=None, on_sent=None):
+        """on_sent(id) is called once the request is on the pipe (see _cancel)."""
+        with self._lock:
+            self.load()
+            rid = next(self._ids)
+            segments = []
+            try:
+                packed = [_pack(a, segments) for a in args]
+                try:
+                    with self._send_lock:
+                        self._conn.send((rid, method, packed, kwargs))
+                        self._active = rid
+                    if on_sent is not None:
+                        on_sent(rid)
+                    while True:
+                        kind, payload = self._recv()
+                        if kind != "piece":
+                            break
+                        on_piece(payload)
+                except (EOFError, OSError, BrokenPipeError):
+                    raise self._crashed() from None
+            finally:
+                with self._send_lock:
+                    self._active = None
+                for shm in segments:
+                    shm.close()
+                    shm.unlink()
+            if kind == "error":
+                raise RemoteError(payload)
+            return payload
+
+    def call(self, method: str, *args, **kwargs):
+        """Call adapter.method(*args, **kwargs) in the worker."""
+        return self._request(method, args, kwargs)
+
+    # ---- ModelAdapter interface ----
+    @property
+    def task(self):
+        return self._info.get("task", self._spec["task"])
+
+    @property
+    def capabilities(self):
+        return frozenset(self._info.get("capabilities", ()))
+
+    @property
+    def model_name(self):
+        return self._info.get("model_name") or self._spec["model_name"]
+
+    @property
+    def precision(self):
+        return self._info.get("precision", self._spec["precision"])
+
+    @property
+    def backend(self):
+        return self._info.get("backend", self._spec["backend"])
+
+    def supports(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+    def deterministic(self, **params) -> bool:
+        if "deterministic" in self._info.get("methods", ()):
+            return self.call("deterministic", **params)
+        return self.supports(DETERMINISTIC)
+
+    def run(self, item, **params):
+        return self.call("run", item, **params)
+
+    def run_batch(self, items, **kwargs):
+        return self.call("run_batch", list(items), **kwargs)
+
+    def stream(self, item, **params):
+        """
+        Yield pieces as the worker produces them (the pipe is held until done).
+        Closing the generator early asks the worker to stop generating, so
+        the next request does not wait behind an abandoned stream.
+        """
+        pieces, end, error, sent = queue.Queue(), object(), [], []
+
+        def _run():
+            try:
+                self._request("stream", (item,), params, on_piece=pieces.put,
+                              on_sent=sent.append)
+            except Exception as e:
+                error.append(e)
+            finally:
+                pieces.put(end)
+
+        threading.Thread(target=_run, name="process-stream", daemon=True).start()
+        finished = False
+        try:
+            while True:
+                piece = pieces.get()
+                if piece is end:
+                    finished = True
+                    break
+                yield piece
+        finally:
+            if not finished and sent:
+                self._cancel(sent[0])
+        if error:
+            raise error[0]
+
+    def _cancel(self, rid: int):
+        """
+        Tell the worker to end stream request rid (it replies "ok" as usual).
+        Nothing is sent once that request has returned, so a cancel cannot
+        reach a later request.
+        """
+        with self._send_lock:
+            if self._active != rid or self._conn is None:
+                return
+            try:
+                self._conn.send(("cancel", rid))
+            except (OSError, ValueError):
+                pass   # worker already gone; _request reports the crash
+
+    def memory_footprint(self) -> int:
+        return self.call("memory_footprint") if self.is_loaded else 0
+
+    def __getattr__(self, name):
+        # Task-specific methods (fits_input, summarize_long, ...) forward to the worker
+        if name.startswith("_") or name not in self.__dict__.get("_info", {}).get("methods", ()):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+
+    def get_model_name(self) -> str:
+        return self._info.get("display_name") or f"{self._spec['task']} (process)"
+
+    def __str__(self) -> str:
+        return self.get_model_name()
+
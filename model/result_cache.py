@@ -0,0 +1,251 @@
+# result_cache.py
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gensumai", "results")
+
+
+def input_digest(payload) -> str:
+    """sha256 of text (utf-8) or raw bytes."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's bytes, e.g. an image selected for classification."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def model_id(adapter) -> str:
+    """Checkpoint name (plus non-default precision/backend) of an adapter, not its UI name."""
+    name = (
+        getattr(adapter, "model_name", None)
+        or getattr(adapter, "_model_name", None)
+        or str(adapter)
+    )
+    for variant, default in (("precision", "fp32"), ("backend", "pytorch")):
+        value = getattr(adapter, variant, default)
+        if value != default:
+            name = f"{name}@{value}"
+    return name
+
+
+class ResultCache:
+    """
+    Content-addressed cache of inference results.
+
+    Keys cover model, task, generation parameters and a digest of the input.
+    Lookups go to an in-memory LRU first, then to an on-disk tier (one JSON
+    file per key) that is trimmed oldest-first when it grows past
+    max_disk_bytes. Set disk_dir=None for a memory-only cache.
+    """
+
+    def __init__(self, max_items: int = 512, disk_dir: str = DEFAULT_CACHE_DIR,
+                 max_disk_bytes: int = 200 * 1024 * 1024):
+        self.max_items = max_items
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = None   # computed on first disk write
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @staticmethod
+    def make_key(model_name: str, task: str, params: dict, payload=None, digest: str = None) -> str:
+        """Key from model, task, params and the input (or a precomputed digest)."""
+        if digest is None:
+            digest = input_digest(payload)
+        header = json.dumps(
+            {"model": model_name, "task": task, "params": params},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(f"{header}\n{digest}".encode("utf-8")).hexdigest()
+
+    # ------------------ Lookup / store ------------------
+    def get(self, key):
+        """Return (hit, value)."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return True, self._memory[key]
+
+        value = self._disk_get(key)
+        with self._lock:
+            if value is not None:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return True, value
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+        self._disk_put(key, value)
+
+    def get_or_compute(self, key, compute):
+        hit, value = self.get(key)
+        if hit:
+            return value
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def bypass(self, compute):
+        """Run compute without caching (e.g. sampled generations)."""
+        with self._lock:
+            self.bypassed += 1
+        return compute()
+
+    def run_batch(self, items, key_fn, batch_fn, keep=None):
+        """
+        Resolve a batch: cached items are returned from the cache and only
+        the misses are passed (in order) to batch_fn. Results keep input order.
+        keep(result) -> bool can exclude results (e.g. per-item errors) from caching.
+        """
+        items = list(items)
+        keys = [key_fn(item) for item in items]
+        results, missing = [None] * len(items), []
+        for i, key in enumerate(keys):
+            hit, value = self.get(key)
+            if hit:
+                results[i] = value
+            else:
+                missing.append(i)
+        if missing:
+            outputs = batch_fn([items[i] for i in missing])
+            for i, out in zip(missing, outputs):
+                results[i] = out
+                if keep is None or keep(out):
+                    self.put(keys[i], out)
+        return results
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    # ------------------ Disk tier ------------------
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def _disk_get(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)["result"]
+            os.utime(path)   # refresh age for eviction
+            return value
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _disk_put(self, key, value):
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        try:
+            data = json.dumps({"result": value})
+        except (TypeError, ValueError):
+            return   # not JSON-serializable; memory tier only
+        encoded = data.encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # A unique temp file per writer, so concurrent puts of one key cannot interleave
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded)
+            except OSError:
+                os.remove(tmp)
+                raise
+        except OSError:
+            return
+        with self._lock:
+            try:
+                old = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp, path)
+            except OSError:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                return
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+            else:
+                # Overwriting a key replaces its file rather than adding to the total
+                self._disk_bytes += len(encoded) - old
+            if self._disk_bytes > self.max_disk_bytes:
+                self._trim_disk()
+
+    def _disk_files(self):
+        for root, _, files in os.walk(self.disk_dir):
+            for fn in files:
+                if fn.endswith(".json"):
+                    fp = os.path.join(root, fn)
+                    try:
+                        st = os.stat(fp)
+                    except OSError:
+                        continue
+                    yield fp, st.st_size, st.st_mtime
+
+    def _trim_disk(self):
+        """Delete least recently used files until under 90% of the budget."""
+        files = sorted(self._disk_files(), key=lambda f: f[2])
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        for fp, size, _ in files:
+            if total <= target:
+                break
+            try:
+                os.remove(fp)
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    # ------------------ Maintenance / stats ------------------
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._memory.clear()
+            if disk and self.disk_dir:
+                for fp, _, _ in list(self._disk_files()):
+                    try:
+                        os.remove(fp)
+                    except OSError:
+                        pass
+                self._disk_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
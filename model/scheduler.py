@@ -0,0 +1,180 @@
+# scheduler.py
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+logger = logging.getLogger("gensumai")
+
+
+class Priority:
+    """Lower runs first."""
+    INTERACTIVE = 0
+    BATCH = 10
+
+
+_STOP = object()
+
+
+class _Lane:
+    """Queue and worker threads for one model."""
+
+    def __init__(self, key, instances, factory, concurrency, worker_init=None):
+        self.key = key
+        self.instances = list(instances)
+        self.factory = factory
+        self.concurrency = concurrency
+        self.worker_init = worker_init
+        self.queue = queue.PriorityQueue()
+        self.workers = []
+        self.lock = threading.Lock()
+
+        # Metrics
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+        self.waits = deque(maxlen=512)   # seconds spent queued, recent jobs
+
+
+class JobScheduler:
+    """
+    Runs jobs on per-model worker queues.
+
+    Each registered model gets its own priority queue and `concurrency`
+    worker threads, so a long job on one model does not block another.
+    Every worker owns exactly one model instance and passes it to the job as
+    fn(instance, *args, **kwargs); a single instance is therefore never used
+    by two threads at once. Concurrency above the number of instances needs
+    a factory that builds replicas. worker_init() runs once on each worker
+    thread before its first job (e.g. to set the model's thread budget).
+    """
+
+    def __init__(self):
+        self._lanes = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def register(self, key, instance=None, concurrency: int = 1, factory=None, replicas=None,
+                 worker_init=None):
+        """Add a model lane. Pass one instance, a list of replicas, or a factory."""
+        instances = list(replicas or ([] if instance is None else [instance]))
+        concurrency = max(1, int(concurrency))
+        if len(instances) < concurrency and factory is None:
+            raise ValueError(
+                f"{key}: concurrency {concurrency} needs {concurrency} model instances "
+                f"(got {len(instances)}) or a factory for replicas"
+            )
+        with self._lock:
+            if key in self._lanes:
+                raise ValueError(f"{key} is already registered")
+            self._lanes[key] = _Lane(key, instances, factory, concurrency, worker_init)
+
+    def submit(self, key, fn, *args, priority: int = Priority.INTERACTIVE, **kwargs) -> Future:
+        """Queue fn(instance, *args, **kwargs) on the lane for key."""
+        if self._closed:
+            raise RuntimeError("scheduler is shut down")
+        lane = self._lanes[key]
+        future = Future()
+        with lane.lock:
+            lane.submitted += 1
+            self._ensure_workers(lane)
+        lane.queue.put(
+            (priority, next(self._seq), time.perf_counter(), future, fn, args, kwargs)
+        )
+        return future
+
+    def _ensure_workers(self, lane):
+        while len(lane.workers) < lane.concurrency:
+            idx = len(lane.workers)
+            t = threading.Thread(
+                target=self._worker, args=(lane, idx),
+                name=f"sched-{lane.key}-{idx}", daemon=True,
+            )
+            lane.workers.append(t)
+            t.start()
+
+    def _worker(self, lane, idx):
+        instance = lane.instances[idx] if idx < len(lane.instances) else None
+        if lane.worker_init is not None:
+            try:
+                lane.worker_init()
+            except Exception as e:
+                logger.warning("worker init for %s failed: %s", lane.key, e)
+        while True:
+            priority, _, enqueued, future, fn, args, kwargs = lane.queue.get()
+            if future is _STOP:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+            with lane.lock:
+                lane.running += 1
+                lane.waits.append(time.perf_counter() - enqueued)
+            try:
+                if instance is None:
+                    instance = lane.factory()
+                result = fn(instance, *args, **kwargs)
+            except BaseException as e:
+                with lane.lock:
+                    lane.running -= 1
+                    lane.failed += 1
+                future.set_exception(e)
+            else:
+                with lane.lock:
+                    lane.running -= 1
+                    lane.completed += 1
+                future.set_result(result)
+
+    # ------------------ Metrics ------------------
+    def metrics(self) -> dict:
+        """Queue depth, running jobs and queue wait times (ms) per model."""
+        out = {}
+        for key, lane in list(self._lanes.items()):
+            with lane.lock:
+                waits = sorted(lane.waits)
+                out[key] = {
+                    "queue_depth": lane.queue.qsize(),
+                    "running": lane.running,
+                    "workers": lane.concurrency,
+                    "submitted": lane.submitted,
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "wait_avg_ms": 1000 * sum(waits) / len(waits) if waits else 0.0,
+                    "wait_p95_ms": 1000 * waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+                    "wait_max_ms": 1000 * waits[-1] if waits else 0.0,
+                }
+        return out
+
+    def busy(self, key) -> bool:
+        """True while the lane for key has a job running or queued."""
+        lane = self._lanes.get(key)
+        return lane is not None and (lane.running > 0 or not lane.queue.empty())
+
+    def queue_depth(self, key=None) -> int:
+        if key is not None:
+            return self._lanes[key].queue.qsize()
+        return sum(lane.queue.qsize() for lane in self._lanes.values())
+
+    # ------------------ Shutdown ------------------
+    def shutdown(self, wait: bool = False, cancel_pending: bool = True):
+        self._closed = True
+        for lane in self._lanes.values():
+            if cancel_pending:
+                while True:
+                    try:
+                        item = lane.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    item[3].cancel()
+            for _ in lane.workers:
+                # Stop markers sort after every real job
+                lane.queue.put((float("inf"), next(self._seq), 0.0, _STOP, None, (), {}))
+        if wait:
+            for lane in self._lanes.values():
+                for t in lane.workers:
+                    t.join()
@@ -0,0 +1,52 @@
+# streaming.py
+
+import threading
+
+
+def stream_generate(model, tokenizer, gen_kwargs: dict, skip_prompt: bool = False):
+    """
+    Run model.generate on a helper thread and yield decoded text pieces as
+    tokens are produced. Errors raised by generate are re-raised here once
+    the stream ends. The generated sequences are the generator's return
+    value (`out = yield from stream_generate(...)`). Closing the generator
+    early stops generate at the next token.
+    """
+    import torch
+    from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+
+    streamer = TextIteratorStreamer(
+        tokenizer, skip_prompt=skip_prompt, skip_special_tokens=True
+    )
+    stop = threading.Event()
+
+    class _Stopped(StoppingCriteria):
+        def __call__(self, input_ids, scores, **kwargs):
+            return torch.full(
+                (input_ids.shape[0],), stop.is_set(), dtype=torch.bool, device=input_ids.device
+            )
+
+    gen_kwargs = dict(gen_kwargs, stopping_criteria=StoppingCriteriaList(
+        [*(gen_kwargs.get("stopping_criteria") or []), _Stopped()]
+    ))
+    error, output = [], []
+
+    def _generate():
+        try:
+            with torch.no_grad():
+                output.append(model.generate(**gen_kwargs, streamer=streamer))
+        except Exception as e:
+            error.append(e)
+            streamer.end()   # unblock the consumer
+
+    thread = threading.Thread(target=_generate, name="stream-generate", daemon=True)
+    thread.start()
+    try:
+        for piece in streamer:
+            if piece:
+                yield piece
+    finally:
+        stop.set()   # no-op when generate already finished
+        thread.join()
+    if error:
+        raise error[0]
+    return output[0] if output else None
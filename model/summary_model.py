@@ -1,37 +1,250 @@
 # summary_model.py
 
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-import torch
-from model.base_model import BaseNLPModel
+import time
+
+from model.base_model import BATCHING, DETERMINISTIC, STREAMING, BaseNLPModel
+from model.batching import DEFAULT_BATCH_SIZE, run_bucketed, token_lengths
+from model.streaming import stream_generate
+from model.precision import apply_precision, load_kwargs, resolve_precision
+from model.onnx_backend import try_load_onnx
 from Utils.decorators import log_action, measure_time
 
 
+# Decoding presets, fastest first. "best" is the original 4-beam search.
+PRESETS = {
+    "fast": {"num_beams": 1},
+    "balanced": {"num_beams": 2, "length_penalty": 1.5, "early_stopping": True},
+    "best": {"num_beams": 4, "length_penalty": 2.0, "early_stopping": True},
+}
+DEFAULT_PRESET = "balanced"
+
+
+def preset_kwargs(preset: str) -> dict:
+    """generate() kwargs for a preset name."""
+    try:
+        return dict(PRESETS[preset or DEFAULT_PRESET])
+    except KeyError:
+        raise ValueError(f"Unknown preset '{preset}' (choose from {', '.join(PRESETS)})") from None
+
+
+def adaptive_lengths(input_tokens: int, max_length: int, min_length: int):
+    """
+    Scale (max_length, min_length) to the input: a summary is at most
+    MAX_RATIO and at least MIN_RATIO of the input tokens, within the
+    requested bounds, so short inputs stop decoding early.
+    """
+    ceiling = max(Summarizer.MIN_OUTPUT_TOKENS, int(input_tokens * Summarizer.MAX_RATIO))
+    max_length = min(max_length, ceiling)
+    min_length = max(0, min(min_length, int(input_tokens * Summarizer.MIN_RATIO), max_length - 1))
+    return max_length, min_length
+
+
 class Summarizer(BaseNLPModel):
     """Summarization model (BART)."""
 
-    def __init__(self, model_name: str = "facebook/bart-large-cnn"):
+    task = "summarization"
+    capabilities = frozenset({STREAMING, BATCHING, DETERMINISTIC})
+
+    MAX_INPUT_TOKENS = 1024
+
+    # Adaptive output bounds (fractions of the input length, see adaptive_lengths)
+    MAX_RATIO = 0.75
+    MIN_RATIO = 0.25
+    MIN_OUTPUT_TOKENS = 16
+
+    def __init__(self, model_name: str = "facebook/bart-large-cnn", precision: str = "fp32",
+                 backend: str = "pytorch"):
         super().__init__(model_name)   # inheritance stores self.model_name
+        self.precision, self.backend = precision, backend
+        self.load()
+
+    def _load(self):
+        from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+        model_name = self._model_name
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-        self.model.eval()
+        self.model = try_load_onnx(model_name, "seq2seq") if self.backend == "onnx" else None
+        if self.model is not None:
+            self.backend, self.precision = "onnx", "fp32"
+        else:
+            self.backend = "pytorch"
+            self.precision = resolve_precision(self.precision)
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name, **load_kwargs(self.precision)
+            )
+            self.model = apply_precision(self.model, self.precision)
+            self.model.eval()
 
-    @log_action
-    @measure_time
-    def run(self, text: str, max_length: int = 150, min_length: int = 40) -> str:
-        """Override base method: run() → summarization."""
+    def _unload(self):
+        self.model = self.tokenizer = None
+
+    def _generate(self, texts, max_length: int, min_length: int,
+                  preset: str = DEFAULT_PRESET, adaptive: bool = True):
+        """Summarize a list of texts as one padded batch."""
+        import torch
+
+        self.load()
         inputs = self.tokenizer(
-            [text], return_tensors="pt", max_length=1024, truncation=True
+            texts, return_tensors="pt", max_length=self.MAX_INPUT_TOKENS,
+            truncation=True, padding=True,
         )
+        if adaptive:
+            longest = int(inputs["attention_mask"].sum(dim=1).max())
+            max_length, min_length = adaptive_lengths(longest, max_length, min_length)
         with torch.no_grad():
             outputs = self.model.generate(
                 **inputs,
                 max_length=max_length,
                 min_length=min_length,
-                length_penalty=2.0,
-                num_beams=4,
-                early_stopping=True,
+                **preset_kwargs(preset),
+            )
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+    def _too_short(self, text: str, min_length: int) -> bool:
+        """True if text is already no longer than the requested summary."""
+        return len(self.tokenizer(text, add_special_tokens=False)["input_ids"]) <= min_length
+
+    @log_action
+    @measure_time
+    def run(self, text: str, max_length: int = 150, min_length: int = 40,
+            preset: str = DEFAULT_PRESET, adaptive: bool = True) -> str:
+        """
+        Override base method: run() → summarization. preset picks the
+        decoding (fast/balanced/best); adaptive scales the length bounds to
+        the input and returns inputs shorter than min_length unchanged.
+        """
+        self.load()
+        if adaptive and self._too_short(text, min_length):
+            return text.strip()
+        return self._generate([text], max_length, min_length, preset, adaptive)[0]
+
+    def stream(self, text: str, max_length: int = 150, min_length: int = 40,
+               preset: str = DEFAULT_PRESET, adaptive: bool = True):
+        """
+        Like run(), but yields the summary piece by piece. Streaming cannot
+        follow a beam search, so presets with beams yield the finished
+        summary in one piece; "fast" (greedy) streams token by token.
+        """
+        self.load()
+        kwargs = preset_kwargs(preset)
+        if adaptive and self._too_short(text, min_length):
+            yield text.strip()
+            return
+        if kwargs["num_beams"] > 1:
+            yield self._generate([text], max_length, min_length, preset, adaptive)[0]
+            return
+        inputs = self.tokenizer(
+            [text], return_tensors="pt", max_length=self.MAX_INPUT_TOKENS, truncation=True
+        )
+        if adaptive:
+            max_length, min_length = adaptive_lengths(
+                inputs["input_ids"].shape[-1], max_length, min_length
+            )
+        gen_kwargs = dict(
+            **inputs,
+            max_length=max_length,
+            min_length=min_length,
+            **kwargs,
+        )
+        yield from stream_generate(self.model, self.tokenizer, gen_kwargs, skip_prompt=True)
+
+    def fits_input(self, text: str) -> bool:
+        """True if text fits the model input window without truncation."""
+        self.load()
+        ids = self.tokenizer(text, add_special_tokens=True)["input_ids"]
+        return len(ids) <= self.MAX_INPUT_TOKENS
+
+    @measure_time
+    def run_batch(self, texts, max_length: int = 150, min_length: int = 40,
+                  batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = None,
+                  preset: str = DEFAULT_PRESET, adaptive: bool = True):
+        """Summarize many texts in length-bucketed batches; results keep input order."""
+        self.load()
+        texts = list(texts)
+        lengths = token_lengths(self.tokenizer, texts, self.MAX_INPUT_TOKENS)
+        results = [None] * len(texts)
+        todo = []
+        for i, (text, n) in enumerate(zip(texts, lengths)):
+            # lengths include special tokens; the early exit compares content tokens
+            if adaptive and n - self.tokenizer.num_special_tokens_to_add() <= min_length:
+                results[i] = text.strip()
+            else:
+                todo.append(i)
+        summaries = run_bucketed(
+            [texts[i] for i in todo], [lengths[i] for i in todo],
+            lambda batch: self._generate(batch, max_length, min_length, preset, adaptive),
+            batch_size=batch_size, max_tokens=max_tokens,
+        )
+        for i, summary in zip(todo, summaries):
+            results[i] = summary
+        return results
+
+    # ------------------ Long documents (map-reduce) ------------------
+    def _chunk_ids(self, ids, chunk_tokens: int, overlap: int):
+        """Split token ids into overlapping windows of at most chunk_tokens."""
+        stride = max(1, chunk_tokens - overlap)
+        chunks = []
+        for start in range(0, len(ids), stride):
+            chunks.append(ids[start:start + chunk_tokens])
+            if start + chunk_tokens >= len(ids):
+                break
+        return chunks
+
+    def summarize_long(self, text: str, max_length: int = 150, min_length: int = 40,
+                       overlap: int = 64, max_stages: int = 4, batch_size: int = None,
+                       preset: str = DEFAULT_PRESET, adaptive: bool = True):
+        """
+        Summarize text of any length. Returns (summary, report).
+
+        Text longer than the model input is split into overlapping token
+        windows; all windows are summarized in one batched generate call
+        (or batches of batch_size), the partial summaries are joined and the
+        process repeats until the joined text fits, then a final pass
+        produces the summary. The report holds chunk counts and per-stage
+        timing.
+        """
+        self.load()
+        limit = self.MAX_INPUT_TOKENS - self.tokenizer.num_special_tokens_to_add()
+        ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+        report = {"input_tokens": len(ids), "chunks": 0, "stages": []}
+        start = time.perf_counter()
+
+        while len(ids) > limit and len(report["stages"]) < max_stages:
+            stage_start = time.perf_counter()
+            chunk_texts = self.tokenizer.batch_decode(
+                self._chunk_ids(ids, limit, overlap), skip_special_tokens=True
             )
-        return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+            step = batch_size or len(chunk_texts)
+            partials = []
+            for i in range(0, len(chunk_texts), step):
+                partials.extend(self._generate(
+                    chunk_texts[i:i + step], max_length, min(min_length, max_length // 2),
+                    preset, adaptive,
+                ))
+            text = " ".join(p.strip() for p in partials)
+            new_ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+            report["chunks"] += len(chunk_texts)
+            report["stages"].append({
+                "chunks": len(chunk_texts),
+                "tokens_in": len(ids),
+                "tokens_out": len(new_ids),
+                "seconds": round(time.perf_counter() - stage_start, 3),
+            })
+            shrunk = len(new_ids) < len(ids)
+            ids = new_ids
+            if not shrunk:
+                break  # final pass truncates the remainder
+
+        stage_start = time.perf_counter()
+        summary = self._generate([text], max_length, min_length, preset, adaptive)[0]
+        report["stages"].append({
+            "chunks": 1,
+            "tokens_in": len(ids),
+            "seconds": round(time.perf_counter() - stage_start, 3),
+        })
+        report["chunks"] += 1
+        report["seconds"] = round(time.perf_counter() - start, 3)
+        return summary, report
 
     # Friendly name for UI
     def get_model_name(self) -> str:
@@ -0,0 +1,78 @@
+# tasks.py
+
+from model.batching import DEFAULT_BATCH_SIZE
+
+
+# Short task names used by the CLI/server → task names used by the GUI
+TASKS = {
+    "generation": "Text Generation",
+    "summarization": "Summarization",
+    "translation": "Translation",
+    "image": "Image Classification",
+}
+
+
+DEFAULT_MODELS = {
+    "generation": "openai-community/gpt2",
+    "summarization": "facebook/bart-large-cnn",
+    "image": "google/vit-base-patch16-224",
+}
+
+
+def load_model(task: str, lang: str = "French", precision: str = "fp32",
+               backend: str = "pytorch", model_name: str = None, execution: str = "thread",
+               options: dict = None):
+    """
+    Build the adapter for a short task name (imports stay local to the task).
+    model_name overrides the checkpoint, e.g. a local directory.
+    execution="process" hosts the model in its own worker process instead.
+    options are extra constructor arguments (e.g. draft_model for generation).
+    """
+    options = options or {}
+    if execution == "process":
+        from model import cpu_config
+        from model.process_model import ProcessModel
+
+        if task not in TASKS:
+            raise ValueError(f"Unknown task: {task} (choose from {', '.join(TASKS)})")
+        return ProcessModel(
+            task, lang, precision, backend, model_name, threads=cpu_config.model_threads(task),
+            options=options,
+        ).load()
+    if execution != "thread":
+        raise ValueError(f"Unknown execution mode: {execution} (choose thread or process)")
+    if task == "generation":
+        from model.text_model import TextGenerator
+        return TextGenerator(
+            model_name or DEFAULT_MODELS[task], precision=precision, backend=backend, **options
+        )
+    if task == "summarization":
+        from model.summary_model import Summarizer
+        return Summarizer(
+            model_name or DEFAULT_MODELS[task], precision=precision, backend=backend, **options
+        )
+    if task == "translation":
+        from model.translation_model import TranslationModelAdapter
+        return TranslationModelAdapter(
+            lang, precision=precision, backend=backend, model_name=model_name, **options
+        )
+    if task == "image":
+        from model.image_model import ImageClassificationModelAdapter
+        return ImageClassificationModelAdapter(
+            precision=precision, backend=backend, model_name=model_name or DEFAULT_MODELS[task],
+            **options
+        ).load()
+    raise ValueError(f"Unknown task: {task} (choose from {', '.join(TASKS)})")
+
+
+def run_one(adapter, task: str, item, params: dict = None):
+    """Single-request path (adapter.run)."""
+    return adapter.run(item, **(params or {}))
+
+
+def run_batch(adapter, task: str, inputs, params: dict = None,
+              batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = None):
+    """Run one batch of inputs through adapter; outputs keep input order."""
+    return adapter.run_batch(
+        inputs, batch_size=batch_size, max_tokens=max_tokens, **(params or {})
+    )
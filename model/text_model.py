@@ -1,22 +1,184 @@
 # text_model.py
 
-from transformers import AutoTokenizer, AutoModelForCausalLM
-import torch
-from model.base_model import BaseNLPModel
+import logging
+import time
+
+from model.base_model import BATCHING, STREAMING, BaseNLPModel, module_bytes
+from model.batching import DEFAULT_BATCH_SIZE, run_bucketed, token_lengths
+from model.streaming import stream_generate
+from model.precision import apply_precision, load_kwargs, resolve_precision
+from model.onnx_backend import try_load_onnx
+from model.prefix_cache import PrefixKVCache
 from Utils.decorators import log_action, measure_time
+from Utils.metrics import REGISTRY
+
+logger = logging.getLogger("gensumai")
 
 
 class TextGenerator(BaseNLPModel):
     """Text generation model (GPT-2)."""
 
-    def __init__(self, model_name: str = "openai-community/gpt2"):
+    task = "text-generation"
+    capabilities = frozenset({STREAMING, BATCHING})
+
+    def __init__(self, model_name: str = "openai-community/gpt2", precision: str = "fp32",
+                 backend: str = "pytorch", prefix_cache_mb: int = 64,
+                 draft_model: str = None, num_assistant_tokens: int = 5):
+        """
+        draft_model: a smaller causal LM with GPT-2's tokenizer (e.g.
+        distilbert/distilgpt2). run() and stream() then use assisted decoding:
+        the draft proposes num_assistant_tokens tokens per step and the main
+        model checks them in one forward pass. Needs the PyTorch backend.
+        """
         super().__init__(model_name)   # inheritance stores self.model_name
+        self.precision, self.backend = precision, backend
+        # Prompt-prefix KV cache for run()/stream(); prefix_cache_mb=0 disables it
+        self.prefix_cache = PrefixKVCache(prefix_cache_mb * 1024 * 1024) if prefix_cache_mb else None
+        self.last_prefix_stats = {"prompt_tokens": 0, "saved_tokens": 0}
+        self.draft_model_name = draft_model
+        self.num_assistant_tokens = num_assistant_tokens
+        self.draft = None
+        self._forward_calls = {"main": 0, "draft": 0}
+        self._stats = {"last": {}, "total": {}}
+        self.load()
+
+    def _load(self):
+        from transformers import AutoTokenizer, AutoModelForCausalLM
+
+        model_name = self._model_name
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForCausalLM.from_pretrained(model_name)
+        self.model = try_load_onnx(model_name, "causal-lm") if self.backend == "onnx" else None
+        if self.model is not None:
+            self.backend, self.precision = "onnx", "fp32"
+        else:
+            self.backend = "pytorch"
+            self.precision = resolve_precision(self.precision)
+            self.model = AutoModelForCausalLM.from_pretrained(
+                model_name, **load_kwargs(self.precision)
+            )
+            self.model = apply_precision(self.model, self.precision)
+            self.model.eval()
+        if self.draft_model_name:
+            self._load_draft()
         # GPT-2 has no pad token; map pad→eos to avoid warnings when sampling
         if self.tokenizer.pad_token_id is None:
             self.tokenizer.pad_token_id = self.tokenizer.eos_token_id
-        self.model.eval()
+        # Decoder-only models must be padded on the left for batched generate
+        self.tokenizer.padding_side = "left"
+
+    def _load_draft(self):
+        from transformers import AutoModelForCausalLM
+
+        if self.backend != "pytorch":
+            logger.warning("assisted decoding needs the PyTorch backend; draft model not loaded")
+            return
+        draft = AutoModelForCausalLM.from_pretrained(
+            self.draft_model_name, **load_kwargs(self.precision)
+        )
+        if draft.config.vocab_size != self.model.config.vocab_size:
+            raise ValueError(
+                f"draft model {self.draft_model_name} does not share the tokenizer of "
+                f"{self._model_name} (vocab {draft.config.vocab_size} vs "
+                f"{self.model.config.vocab_size})"
+            )
+        self.draft = apply_precision(draft, self.precision).eval()
+        # One forward call = one proposed token (draft) or one verification step (main)
+        for key, module in (("main", self.model), ("draft", self.draft)):
+            module.register_forward_hook(
+                lambda *_, key=key: self._forward_calls.__setitem__(key, self._forward_calls[key] + 1)
+            )
+
+    def _unload(self):
+        self.model = self.tokenizer = self.draft = None
+        if self.prefix_cache is not None:
+            self.prefix_cache.clear()
+
+    def memory_footprint(self) -> int:
+        if not self.is_loaded:
+            return 0
+        cached = self.prefix_cache.bytes if self.prefix_cache is not None else 0
+        return super().memory_footprint() + module_bytes(self.draft) + cached
+
+    @property
+    def assisted(self) -> bool:
+        return self.draft is not None
+
+    def deterministic(self, do_sample: bool = True, **params) -> bool:
+        """Greedy decoding is repeatable; sampling is not."""
+        return not do_sample
+
+    def _gen_kwargs(self, max_length, temperature, top_p, do_sample, assisted=False):
+        kwargs = dict(
+            max_length=max_length,
+            do_sample=do_sample,
+            pad_token_id=self.tokenizer.pad_token_id,
+            eos_token_id=self.tokenizer.eos_token_id,
+        )
+        if do_sample:
+            kwargs.update(temperature=temperature, top_p=top_p)
+        if assisted:
+            # Fixed look-ahead, so the configured value is what gets measured
+            kwargs.update(
+                assistant_model=self.draft,
+                num_assistant_tokens=self.num_assistant_tokens,
+                num_assistant_tokens_schedule="constant",
+            )
+        return kwargs
+
+    def _generate(self, texts, max_length: int, temperature: float, top_p: float,
+                  do_sample: bool = True):
+        """Generate continuations for a list of prompts as one padded batch."""
+        import torch
+
+        self.load()
+        inputs = self.tokenizer(texts, return_tensors="pt", padding=True)
+        with torch.no_grad():
+            outputs = self.model.generate(
+                **inputs, **self._gen_kwargs(max_length, temperature, top_p, do_sample)
+            )
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+    def _prompt_inputs(self, text: str) -> dict:
+        """
+        Tokenize one prompt and attach past_key_values for all but its last
+        token, reusing the longest cached prefix and encoding only the rest.
+        The number of prompt tokens not re-encoded goes to last_prefix_stats.
+        Assisted decoding manages its own caches, so it skips the prefix cache.
+        """
+        inputs = dict(self.tokenizer(text, return_tensors="pt"))
+        ids = inputs["input_ids"][0].tolist()
+        self.last_prefix_stats = {"prompt_tokens": len(ids), "saved_tokens": 0}
+        cache = self.prefix_cache
+        # generate() needs at least one uncached token, so the last one is left out
+        prefix = ids[:-1]
+        if (cache is None or self.assisted or self.backend != "pytorch"
+                or len(prefix) < cache.min_tokens):
+            return inputs
+
+        import torch
+        from transformers import DynamicCache
+
+        past, saved = cache.lookup(prefix)
+        if saved < len(prefix):
+            with torch.no_grad():
+                out = self.model(
+                    input_ids=torch.tensor([prefix[saved:]]),
+                    attention_mask=torch.ones(1, len(prefix), dtype=torch.long),
+                    past_key_values=past if past is not None else DynamicCache(),
+                    use_cache=True,
+                )
+            past = out.past_key_values
+            cache.store(prefix, past)
+        inputs["past_key_values"] = past
+
+        self.last_prefix_stats["saved_tokens"] = saved
+        if REGISTRY.enabled:
+            REGISTRY.counter(
+                "gensumai_prefix_tokens_saved_total",
+                "Prompt tokens served from the prefix KV cache",
+                {"model": self._model_name},
+            ).inc(saved)
+        return inputs
 
     @log_action
     @measure_time
@@ -26,21 +188,93 @@ class TextGenerator(BaseNLPModel):
         max_length: int = 150,
         temperature: float = 0.7,
         top_p: float = 0.9,
+        do_sample: bool = True,
     ) -> str:
-        """Override base method: run() → text generation."""
-        inputs = self.tokenizer(text, return_tensors="pt")
+        """Override base method: run() → text generation (greedy if do_sample=False)."""
+        import torch
+
+        self.load()
+        inputs = self._prompt_inputs(text)
+        self._start_stats()
         with torch.no_grad():
             outputs = self.model.generate(
                 **inputs,
-                max_length=max_length,
-                temperature=temperature,
-                top_p=top_p,
-                do_sample=True,
-                pad_token_id=self.tokenizer.pad_token_id,
-                eos_token_id=self.tokenizer.eos_token_id,
+                **self._gen_kwargs(max_length, temperature, top_p, do_sample, self.assisted),
             )
+        self._record_stats(inputs["input_ids"].shape[-1], outputs)
         return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
 
+    def stream(self, text: str, max_length: int = 150, temperature: float = 0.7,
+               top_p: float = 0.9, do_sample: bool = True):
+        """Like run(), but yields the prompt and generated text piece by piece."""
+        self.load()
+        inputs = self._prompt_inputs(text)
+        gen_kwargs = dict(
+            **inputs, **self._gen_kwargs(max_length, temperature, top_p, do_sample, self.assisted)
+        )
+        self._start_stats()
+        outputs = yield from stream_generate(self.model, self.tokenizer, gen_kwargs)
+        self._record_stats(inputs["input_ids"].shape[-1], outputs)
+
+    # ------------------ Decoding stats ------------------
+    def _start_stats(self):
+        self._forward_calls.update(main=0, draft=0)
+        self._started = time.perf_counter()
+
+    def _record_stats(self, prompt_tokens: int, outputs):
+        """
+        Tokens/s for the last run()/stream() call. In assisted mode each main
+        forward pass is one verification step that yields the accepted draft
+        tokens plus one of its own, so accepted = new tokens - steps.
+        """
+        seconds = time.perf_counter() - self._started
+        new_tokens = max(0, outputs.shape[-1] - prompt_tokens) if outputs is not None else 0
+        last = {"new_tokens": new_tokens, "seconds": round(seconds, 4),
+                "tokens_per_s": round(new_tokens / seconds, 2) if seconds else 0.0}
+        if self.assisted:
+            proposed = self._forward_calls["draft"]
+            accepted = min(proposed, max(0, new_tokens - self._forward_calls["main"]))
+            last.update(proposed=proposed, accepted=accepted,
+                        acceptance_rate=round(accepted / proposed, 3) if proposed else 0.0)
+            if REGISTRY.enabled:
+                labels = {"model": self._model_name, "draft": self.draft_model_name}
+                REGISTRY.counter("gensumai_draft_tokens_proposed_total",
+                                 "Tokens proposed by the draft model", labels).inc(proposed)
+                REGISTRY.counter("gensumai_draft_tokens_accepted_total",
+                                 "Draft tokens accepted by the main model", labels).inc(accepted)
+
+        total = self._stats["total"]
+        for key in ("new_tokens", "proposed", "accepted"):
+            if key in last:
+                total[key] = total.get(key, 0) + last[key]
+        total["requests"] = total.get("requests", 0) + 1
+        total["seconds"] = total.get("seconds", 0.0) + seconds
+        total["tokens_per_s"] = round(total["new_tokens"] / total["seconds"], 2) if total["seconds"] else 0.0
+        if total.get("proposed"):
+            total["acceptance_rate"] = round(total["accepted"] / total["proposed"], 3)
+        self._stats["last"] = last
+
+    def generation_stats(self) -> dict:
+        """{"last": stats of the last run()/stream() call, "total": running totals}."""
+        return {"last": dict(self._stats["last"]), "total": dict(self._stats["total"])}
+
+    @measure_time
+    def run_batch(self, texts, max_length: int = 150, temperature: float = 0.7,
+                  top_p: float = 0.9, do_sample: bool = True,
+                  batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = None):
+        """Generate for many prompts in length-bucketed batches; results keep input order."""
+        self.load()
+        texts = list(texts)
+        if self.assisted:
+            # Assisted decoding works one prompt at a time
+            return [self.run(t, max_length, temperature, top_p, do_sample) for t in texts]
+        lengths = token_lengths(self.tokenizer, texts)
+        return run_bucketed(
+            texts, lengths,
+            lambda batch: self._generate(batch, max_length, temperature, top_p, do_sample),
+            batch_size=batch_size, max_tokens=max_tokens,
+        )
+
     # Friendly name for UI
     def get_model_name(self) -> str:
         return "GPT-2 Text Generator"
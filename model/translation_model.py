@@ -1,13 +1,28 @@
 # translation_model.py
 
-from transformers import pipeline
+import time
 
+from model.base_model import BATCHING, DETERMINISTIC, BaseNLPModel
+from model.batching import DEFAULT_BATCH_SIZE, run_bucketed, token_lengths
+from model.precision import apply_precision, load_kwargs, resolve_precision
+from model.onnx_backend import try_load_onnx
+from Utils.decorators import log_action, measure_time
+from Utils.text import PARAGRAPH_BREAK, split_sentences, split_words
 
-class TranslationModelAdapter:
+
+class TranslationModelAdapter(BaseNLPModel):
     """
     Adapter for Hugging Face translation models (English → target language).
     """
 
+    task = "translation"
+    capabilities = frozenset({BATCHING, DETERMINISTIC})
+
+    # Marian models take 512 tokens; sentences longer than this many words
+    # are split so nothing is truncated
+    MAX_SEGMENT_WORDS = 120
+    MAX_OUTPUT_TOKENS = 512
+
     SUPPORTED_MODELS = {
        
         "French": "Helsinki-NLP/opus-mt-en-fr",
@@ -23,26 +38,136 @@ class TranslationModelAdapter:
 }
 
 
-    def __init__(self, target_lang: str = "French"):
+    def __init__(self, target_lang: str = "French", precision: str = "fp32",
+                 backend: str = "pytorch", model_name: str = None):
         """
         Initialize translation model for the given target language (default: EN → FR).
+        precision: "fp32", "int8" (dynamic quantization) or "bf16".
+        backend: "pytorch" or "onnx" (falls back to PyTorch if export fails).
+        model_name: override the opus-mt checkpoint (e.g. a local directory).
         """
         self.target_lang = target_lang
-        self.model_name = self.SUPPORTED_MODELS.get(
+        self.model_name = model_name or self.SUPPORTED_MODELS.get(
             target_lang, "Helsinki-NLP/opus-mt-en-fr"
         )
+        super().__init__(self.model_name)
+        self.precision, self.backend = precision, backend
+        self.load()
+
+    def _load(self):
+        from transformers import AutoTokenizer, pipeline
+
         try:
-            self.pipeline = pipeline("translation", model=self.model_name)
+            ort_model = (
+                try_load_onnx(self.model_name, "seq2seq") if self.backend == "onnx" else None
+            )
+            if ort_model is not None:
+                self.backend, self.precision = "onnx", "fp32"
+                tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                self.pipeline = pipeline("translation", model=ort_model, tokenizer=tokenizer)
+            else:
+                self.backend = "pytorch"
+                self.precision = resolve_precision(self.precision)
+                self.pipeline = pipeline(
+                    "translation", model=self.model_name, **load_kwargs(self.precision)
+                )
+                self.pipeline.model = apply_precision(self.pipeline.model, self.precision)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to load model {self.model_name}. "
                 f"Make sure 'sentencepiece' is installed for opus-mt models."
             ) from e
 
+    def _unload(self):
+        self.pipeline = None
+
+    @log_action
+    @measure_time
     def run(self, text: str) -> str:
         """Translate text to the target language."""
-        result = self.pipeline(text, max_length=200)
-        return result[0]["translation_text"]
+        return self.translate_documents([text])[0][0]
+
+    @measure_time
+    def run_batch(self, texts, batch_size: int = DEFAULT_BATCH_SIZE, max_tokens: int = None):
+        """Translate many texts in length-bucketed batches; results keep input order."""
+        return self.translate_documents(texts, batch_size, max_tokens)[0]
+
+    # ------------------ Sentence-level translation ------------------
+    def _plan(self, text: str, index: dict, segments: list):
+        """
+        Turn text into a template: literal strings (paragraph breaks, line
+        breaks, spacing) and indices into segments, the unique sentences to
+        translate. index maps sentence → position, so repeats are translated
+        once.
+        """
+        template = []
+        for part in PARAGRAPH_BREAK.split(text):
+            if not part.strip():
+                template.append(part)
+                continue
+            for n, line in enumerate(part.split("\n")):
+                if n:
+                    template.append("\n")
+                indent = line[:len(line) - len(line.lstrip())]
+                if indent:
+                    template.append(indent)
+                pieces = [
+                    piece
+                    for sentence in split_sentences(line)
+                    for piece in split_words(sentence, self.MAX_SEGMENT_WORDS)
+                ]
+                for k, piece in enumerate(pieces):
+                    if k:
+                        template.append(" ")
+                    if piece not in index:
+                        index[piece] = len(segments)
+                        segments.append(piece)
+                    template.append(index[piece])
+        return template
+
+    def _translate_segments(self, segments, batch_size, max_tokens):
+        if not segments:
+            return []
+        lengths = token_lengths(self.pipeline.tokenizer, segments)
+
+        def _translate(batch):
+            result = self.pipeline(
+                batch, max_length=self.MAX_OUTPUT_TOKENS, batch_size=len(batch), truncation=True
+            )
+            return [r["translation_text"] for r in result]
+
+        return run_bucketed(
+            segments, lengths, _translate, batch_size=batch_size, max_tokens=max_tokens
+        )
+
+    def translate_documents(self, texts, batch_size: int = DEFAULT_BATCH_SIZE,
+                            max_tokens: int = None):
+        """
+        Translate texts sentence by sentence. Returns (translations, report).
+
+        Each text is split into paragraphs, lines and sentences; the unique
+        sentences of all texts are translated together in length-bucketed
+        padded batches and put back in place, so paragraph and line breaks
+        survive and a repeated sentence is translated once.
+        """
+        self.load()
+        start = time.perf_counter()
+        index, segments = {}, []
+        templates = [self._plan(text, index, segments) for text in texts]
+        translated = self._translate_segments(segments, batch_size, max_tokens)
+        outputs = [
+            "".join(translated[t] if isinstance(t, int) else t for t in template)
+            for template in templates
+        ]
+        report = {
+            "sentences": sum(isinstance(t, int) for tpl in templates for t in tpl),
+            "unique": len(segments),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+        return outputs, report
+
+    def torch_model(self):
+        return getattr(getattr(self, "pipeline", None), "model", None)
 
     def save_output(self, result: str):
         """
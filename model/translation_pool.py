@@ -0,0 +1,125 @@
+# translation_pool.py
+
+import threading
+import time
+from collections import OrderedDict
+
+from model.translation_model import TranslationModelAdapter
+
+
+class TranslationModelPool:
+    """
+    Keeps loaded opus-mt translators keyed by target language.
+
+    The pool is bounded by a model count and/or an approximate memory budget
+    (bytes of model parameters); the least recently used language is evicted
+    first. Hit/miss/load-time counters are kept so a batch can be checked to
+    load each language model only once.
+    """
+
+    def __init__(self, max_models: int = 3, max_bytes: int = None,
+                 factory=TranslationModelAdapter):
+        if max_models is not None and max_models < 1:
+            raise ValueError("max_models must be at least 1")
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self._factory = factory
+        self._adapters = OrderedDict()   # target_lang -> adapter (LRU order)
+        self._sizes = {}                 # target_lang -> bytes
+        self._lock = threading.Lock()
+        self._load_locks = {}            # target_lang -> lock held while loading
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_time = 0.0
+
+    def get(self, target_lang: str = "French") -> TranslationModelAdapter:
+        """Return a loaded translator for target_lang, loading it on a miss."""
+        with self._lock:
+            adapter = self._lookup(target_lang)
+            if adapter is not None:
+                return adapter
+            load_lock = self._load_locks.setdefault(target_lang, threading.Lock())
+
+        # Load outside the pool lock so other languages stay available.
+        with load_lock:
+            with self._lock:
+                adapter = self._lookup(target_lang)
+                if adapter is not None:
+                    return adapter
+                self.misses += 1
+
+            start = time.perf_counter()
+            adapter = self._factory(target_lang)
+            elapsed = time.perf_counter() - start
+            size = self._footprint(adapter)
+
+            with self._lock:
+                self.load_time += elapsed
+                self._adapters[target_lang] = adapter
+                self._sizes[target_lang] = size
+                self._evict(keep=target_lang)
+                self._load_locks.pop(target_lang, None)
+            return adapter
+
+    def _lookup(self, target_lang):
+        adapter = self._adapters.get(target_lang)
+        if adapter is not None:
+            self._adapters.move_to_end(target_lang)
+            self.hits += 1
+        return adapter
+
+    def _evict(self, keep):
+        """Drop least recently used languages until the pool fits its bounds."""
+        while len(self._adapters) > 1:
+            over_count = self.max_models is not None and len(self._adapters) > self.max_models
+            over_bytes = self.max_bytes is not None and self.memory_used() > self.max_bytes
+            if not (over_count or over_bytes):
+                break
+            lang = next(iter(self._adapters))
+            if lang == keep:
+                break
+            del self._adapters[lang]
+            self._sizes.pop(lang, None)
+            self.evictions += 1
+
+    @staticmethod
+    def _footprint(adapter) -> int:
+        try:
+            return adapter.memory_footprint()
+        except Exception:
+            return 0
+
+    def memory_used(self) -> int:
+        return sum(self._sizes.values())
+
+    def resident(self):
+        """Loaded languages, least recently used first."""
+        with self._lock:
+            return list(self._adapters.keys())
+
+    def clear(self):
+        with self._lock:
+            self._adapters.clear()
+            self._sizes.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "load_time_s": round(self.load_time, 3),
+                "resident": list(self._adapters.keys()),
+                "memory_bytes": self.memory_used(),
+            }
+
+    def __len__(self):
+        return len(self._adapters)
+
+    def __contains__(self, target_lang):
+        return target_lang in self._adapters
@@ -0,0 +1,372 @@
+# server.py
+"""
+Local HTTP/JSON inference server built on the model package.
+
+Concurrent requests to the same model (and parameters) are gathered into
+micro-batches that close after --window-ms or at --max-batch items.
+
+    python3 server.py --port 8765 --tasks summarization,translation --preload
+
+    POST /v1/generate   {"text": "...", "max_length": 80, "do_sample": false}
+    POST /v1/summarize  {"text": "...", "max_length": 150, "min_length": 40}
+    POST /v1/translate  {"text": "...", "lang": "German"}
+    POST /v1/classify   {"path": "/abs/image.jpg"} or {"image_base64": "..."}
+    GET  /healthz  /readyz  /metrics (Prometheus text; ?format=json for JSON)
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from model import cpu_config
+from model.loader import LazyModel, ModelState
+from model.memory_manager import MemoryManager
+from model.micro_batcher import MicroBatcher
+from model.onnx_backend import BACKENDS
+from model.precision import PRECISIONS
+from model.summary_model import DEFAULT_PRESET, PRESETS
+from model.translation_model import TranslationModelAdapter
+from model.process_model import EXECUTION_MODES
+from model.scheduler import JobScheduler, Priority
+from model.tasks import TASKS, load_model, run_batch
+from Utils.metrics import BATCH_SIZE_BUCKETS, REGISTRY
+
+
+# endpoint path → (short task name, allowed request params with defaults)
+ENDPOINTS = {
+    "/v1/generate": ("generation", {"max_length": 150, "do_sample": True}),
+    "/v1/summarize": ("summarization", {"max_length": 150, "min_length": 40, "preset": DEFAULT_PRESET}),
+    "/v1/translate": ("translation", {}),
+    "/v1/classify": ("image", {}),
+}
+
+
+# Translation targets by lower-case name ("german" → "German")
+LANGUAGES = {name.lower(): name for name in TranslationModelAdapter.SUPPORTED_MODELS}
+
+# Body keys that carry the input rather than parameters
+INPUT_KEYS = {"text", "path", "image_base64"}
+
+# Upper bound for max_length/min_length (BART's and GPT-2's position limit)
+MAX_LENGTH_LIMIT = 1024
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def resolve_lang(lang) -> str:
+    """Canonical language name; BadRequest for anything not in SUPPORTED_MODELS."""
+    name = LANGUAGES.get(str(lang).strip().lower())
+    if name is None:
+        raise BadRequest(f"lang must be one of {', '.join(LANGUAGES.values())}")
+    return name
+
+
+def parse_param(name: str, value, default):
+    """Check a body value against the type of its default; BadRequest on mismatch."""
+    if isinstance(default, bool):
+        # Only JSON true/false: bool("false") would be True
+        if not isinstance(value, bool):
+            raise BadRequest(f"{name} must be true or false")
+    elif isinstance(default, int):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise BadRequest(f"{name} must be an integer")
+        if not 0 < value <= MAX_LENGTH_LIMIT:
+            raise BadRequest(f"{name} must be between 1 and {MAX_LENGTH_LIMIT}")
+    elif not isinstance(value, type(default)):
+        raise BadRequest(f"{name} must be a {type(default).__name__}")
+    return value
+
+
+class InferenceService:
+    """
+    Owns the models, one scheduler lane per model, and one micro-batcher per
+    (model, parameters) so only requests with identical settings share a batch.
+    """
+
+    def __init__(self, tasks, max_batch: int = 8, window_ms: float = 10.0,
+                 default_lang: str = "French", precision: str = "fp32",
+                 backend: str = "pytorch", memory_budget_bytes: int = None,
+                 execution: str = "thread"):
+        self.tasks = list(tasks)
+        self.precision = precision
+        self.backend = backend
+        self.execution = execution
+        self.max_batch = max_batch
+        self.window_ms = window_ms
+        self.default_lang = default_lang
+        self.scheduler = JobScheduler()
+        self.memory = MemoryManager(
+            memory_budget_bytes, is_busy=self.scheduler.busy,
+            on_unload=lambda key, _, freed: print(
+                f"[server] unloaded {key} ({freed / 2**20:.0f} MB) for the memory budget",
+                file=sys.stderr,
+            ),
+        )
+        self.models = {}     # lane key → LazyModel
+        self.batchers = {}   # (lane key, params json) → MicroBatcher
+        self._lock = threading.Lock()
+
+        self.latency = {
+            path: REGISTRY.histogram(
+                "gensumai_request_seconds", "Request latency", {"endpoint": path}
+            )
+            for path in ENDPOINTS
+        }
+        self.batch_sizes = {
+            path: REGISTRY.histogram(
+                "gensumai_batch_size", "Items per model batch", {"endpoint": path},
+                buckets=BATCH_SIZE_BUCKETS,
+            )
+            for path in ENDPOINTS
+        }
+        for task in self.tasks:
+            self._lane(task, default_lang)
+
+    def _lane(self, task, lang):
+        key = f"translation:{lang}" if task == "translation" else task
+        with self._lock:
+            if key not in self.models:
+                handle = LazyModel(key, lambda: load_model(
+                    task, lang, self.precision, self.backend, execution=self.execution
+                ))
+                self.models[key] = handle
+                init = cpu_config.worker_init(task) if self.execution == "thread" else None
+                self.scheduler.register(key, handle, worker_init=init)
+                self.memory.register(key, handle)
+        return key
+
+    def preload(self):
+        for handle in list(self.models.values()):
+            try:
+                handle.load()
+            except Exception as e:
+                print(f"[server] failed to load {handle}: {e}", file=sys.stderr)
+
+    def readiness(self):
+        states = {key: h.state for key, h in self.models.items()}
+        return all(s == ModelState.READY for s in states.values()), states
+
+    def submit(self, path, task, item, params):
+        lang = params.pop("lang", None) or self.default_lang
+        lane = self._lane(task, lang)
+        bkey = (lane, json.dumps(params, sort_keys=True))
+        with self._lock:
+            batcher = self.batchers.get(bkey)
+            if batcher is None:
+                def _job(handle, items, params=dict(params)):
+                    return run_batch(handle.get(), task, items, params, batch_size=len(items))
+
+                batcher = MicroBatcher(
+                    lambda items, lane=lane, job=_job: self.scheduler.submit(
+                        lane, job, items, priority=Priority.INTERACTIVE
+                    ).result(),
+                    max_batch=self.max_batch,
+                    window_ms=self.window_ms,
+                    on_batch=lambda size, _, path=path: self.batch_sizes[path].observe(size),
+                    name=f"batcher-{lane}",
+                )
+                self.batchers[bkey] = batcher
+        return batcher.submit(item)
+
+    def _update_gauges(self):
+        """Copy scheduler lane state into the registry before an export."""
+        for lane, m in self.scheduler.metrics().items():
+            labels = {"lane": lane}
+            REGISTRY.gauge("gensumai_queue_depth", "Jobs waiting per lane", labels).set(m["queue_depth"])
+            REGISTRY.gauge("gensumai_jobs_running", "Jobs running per lane", labels).set(m["running"])
+        resident = {row["key"]: row["bytes"] for row in self.memory.usage()}
+        for key in list(self.models):
+            REGISTRY.gauge(
+                "gensumai_model_bytes", "Weights held per loaded model", {"lane": key}
+            ).set(resident.get(key, 0))
+
+    def metrics_json(self):
+        self._update_gauges()
+        return {
+            "latency_seconds": {p: h.snapshot() for p, h in self.latency.items()},
+            "batch_size": {p: h.snapshot() for p, h in self.batch_sizes.items()},
+            "queues": self.scheduler.metrics(),
+            "models": {key: h.state for key, h in self.models.items()},
+            "resident": self.memory.usage(),
+            "metrics": REGISTRY.snapshot(),
+        }
+
+    def metrics_prometheus(self):
+        self._update_gauges()
+        return REGISTRY.prometheus()
+
+    def close(self):
+        for batcher in self.batchers.values():
+            batcher.close()
+        self.scheduler.shutdown(wait=False)
+
+
+def parse_request(path, body: dict):
+    """Validate a request body; return (task, item, params)."""
+    task, allowed = ENDPOINTS[path]
+    # Parameters become part of the micro-batcher key, so only known ones get through
+    known = INPUT_KEYS | set(allowed) | ({"lang"} if task == "translation" else set())
+    unknown = sorted(set(body) - known)
+    if unknown:
+        raise BadRequest(f"unknown field(s): {', '.join(unknown)}")
+    if task == "image":
+        if "image_base64" in body:
+            try:
+                item = io.BytesIO(base64.b64decode(body["image_base64"], validate=True))
+            except Exception:
+                raise BadRequest("image_base64 is not valid base64")
+        elif isinstance(body.get("path"), str):
+            item = body["path"]
+        else:
+            raise BadRequest("expected 'path' or 'image_base64'")
+    else:
+        item = body.get("text")
+        if not isinstance(item, str) or not item.strip():
+            raise BadRequest("expected a non-empty 'text' string")
+    params = {k: parse_param(k, body[k], v) if k in body else v for k, v in allowed.items()}
+    if params.get("preset", DEFAULT_PRESET) not in PRESETS:
+        raise BadRequest(f"preset must be one of {', '.join(PRESETS)}")
+    # The default min_length is clamped to a smaller max_length; an explicit one is not
+    if "min_length" in body and params["min_length"] > params["max_length"]:
+        raise BadRequest("min_length must not exceed max_length")
+    if task == "translation" and body.get("lang"):
+        params["lang"] = resolve_lang(body["lang"])
+    return task, item, params
+
+
+def make_handler(service: InferenceService, timeout: float):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "GenSumAI"
+
+        def _send(self, status, payload, content_type="application/json"):
+            data = payload if isinstance(payload, bytes) else (
+                json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                if content_type == "application/json" else payload.encode("utf-8")
+            )
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/healthz":
+                self._send(200, {"status": "ok"})
+            elif url.path == "/readyz":
+                ready, states = service.readiness()
+                self._send(200 if ready else 503, {"ready": ready, "models": states})
+            elif url.path == "/metrics":
+                if parse_qs(url.query).get("format") == ["json"]:
+                    self._send(200, service.metrics_json())
+                else:
+                    self._send(200, service.metrics_prometheus(), "text/plain; version=0.0.4")
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            path = urlparse(self.path).path
+            if path not in ENDPOINTS:
+                self._send(404, {"error": "not found"})
+                return
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(body, dict):
+                    raise BadRequest("expected a JSON object")
+                task, item, params = parse_request(path, body)
+                if task not in service.tasks:
+                    self._send(404, {"error": f"task '{task}' is not served"})
+                    return
+                result = service.submit(path, task, item, params).result(timeout=timeout)
+                self._send(200, {"result": result})
+            except (BadRequest, ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+            except FutureTimeout:
+                self._send(504, {"error": "timed out"})
+            except Exception as e:
+                self._send(500, {"error": str(e)})
+            finally:
+                service.latency[path].observe(time.perf_counter() - start)
+
+        def log_message(self, fmt, *args):
+            print(f"[server] {self.address_string()} {fmt % args}", file=sys.stderr)
+
+    return Handler
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="server.py", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tasks", default=",".join(TASKS),
+                        help=f"comma-separated tasks to serve ({', '.join(TASKS)})")
+    parser.add_argument("--lang", default="French", choices=list(LANGUAGES.values()),
+                        help="default translation language")
+    parser.add_argument("--max-batch", type=int, default=8)
+    parser.add_argument("--window-ms", type=float, default=10.0,
+                        help="how long a batch stays open for more requests")
+    parser.add_argument("--timeout", type=float, default=300.0, help="per-request timeout (s)")
+    parser.add_argument("--precision", default="fp32", choices=PRECISIONS)
+    parser.add_argument("--backend", default="pytorch", choices=BACKENDS)
+    parser.add_argument("--preload", action="store_true", help="load models before serving")
+    parser.add_argument("--execution", default="thread", choices=EXECUTION_MODES,
+                        help="process = each model in its own worker process (restarted if it crashes)")
+    parser.add_argument("--memory-budget-mb", type=int, default=0,
+                        help="unload least recently used idle models above this (0 = no limit)")
+    parser.add_argument("--threads", type=int, help="torch intra-op threads per model")
+    parser.add_argument("--interop-threads", type=int, help="torch inter-op threads")
+    parser.add_argument("--cpus", help="pin the server to these CPUs, e.g. 0-3")
+    parser.add_argument("--log-level", default="WARNING",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="level for gensumai log messages (warnings go to stderr)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(format="[%(levelname)s] %(message)s")
+    logging.getLogger("gensumai").setLevel(args.log_level)
+
+    tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+    unknown = [t for t in tasks if t not in TASKS]
+    if unknown:
+        parser.error(f"unknown task(s): {', '.join(unknown)}")
+
+    cpu_config.load_file()
+    cpu_config.configure(inter_op=args.interop_threads)
+    if args.threads:
+        cpu_config.configure(models={t: args.threads for t in tasks})
+    if args.cpus:
+        cpu_config.set_affinity(cpu_config.parse_cpus(args.cpus))
+
+    service = InferenceService(
+        tasks, args.max_batch, args.window_ms, args.lang, args.precision, args.backend,
+        memory_budget_bytes=args.memory_budget_mb * 2**20 or None, execution=args.execution,
+    )
+    httpd = ThreadingHTTPServer((args.host, args.port), make_handler(service, args.timeout))
+    # Progress printed while models load goes to stderr, next to the server's own messages
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.preload:
+            service.preload()
+        print(f"[server] listening on http://{args.host}:{args.port}", file=sys.stderr)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+            service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
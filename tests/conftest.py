@@ -0,0 +1,19 @@
+# conftest.py
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "gui: needs customtkinter; skipped where it is not installed"
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_workdir(tmp_path_factory):
+    """Tiny benchmark models, built once and shared by the bench/autotune smoke tests."""
+    from benchmarks.suite import prepare
+
+    workdir = tmp_path_factory.mktemp("bench")
+    prepare(str(workdir), samples=2)
+    return str(workdir)
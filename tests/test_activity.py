@@ -0,0 +1,47 @@
+# test_activity.py
+
+import pytest
+
+# gui.activity (and the gui package) import customtkinter at module level
+pytestmark = pytest.mark.gui
+pytest.importorskip("customtkinter", reason="GUI-only tests need customtkinter")
+
+from gui import activity  # noqa: E402
+from gui.activity import ActivityLog  # noqa: E402
+
+
+def test_capacity_drops_oldest():
+    log = ActivityLog(capacity=3)
+    for text in "abcde":
+        log.add(text)
+    assert [text for _, text, _ in log.window(0, 10)] == ["c", "d", "e"]
+    assert log.dropped == 2
+
+
+def test_repeats_are_coalesced():
+    log = ActivityLog(capacity=10)
+    for text in ["saved", "saved", "saved", "loaded", "saved"]:
+        log.add(text)
+    assert [(text, n) for _, text, n in log.window(0, 10)] == [
+        ("saved", 3), ("loaded", 1), ("saved", 1),
+    ]
+
+
+def test_repeats_outside_window_are_separate(monkeypatch):
+    log = ActivityLog(capacity=10)
+    clock = iter([0.0, activity.COALESCE_S + 1])
+    monkeypatch.setattr(activity.time, "time", lambda: next(clock))
+    log.add("tick")
+    log.add("tick")
+    assert len(log) == 2
+
+
+def test_export(tmp_path):
+    log = ActivityLog(capacity=2)
+    for text in ["one", "two", "two", "three"]:
+        log.add(text)
+    path = tmp_path / "activity.log"
+    log.export(str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("# 1 older events were dropped")
+    assert lines[1].endswith("two (×2)") and lines[2].endswith("three")
@@ -0,0 +1,34 @@
+# test_autotune.py
+
+import json
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+import cli  # noqa: E402
+from benchmarks.autotune import candidate_threads  # noqa: E402
+
+
+def test_candidate_threads():
+    assert candidate_threads(6) == [1, 2, 4, 6]
+    assert candidate_threads(4) == [1, 2, 4]
+    assert candidate_threads(1) == [1]
+
+
+def test_autotune_picks_and_saves_settings(bench_workdir, tmp_path, capsys):
+    out, saved = tmp_path / "sweep.json", tmp_path / "cpu.json"
+    argv = ["autotune", "--tasks", "generation,image", "--max-threads", "2",
+            "--samples", "2", "--repeats", "1", "--batch-size", "2",
+            "--workdir", bench_workdir, "--output", str(out), "--save", str(saved)]
+    assert cli.main(argv) == 0
+
+    result = json.loads(out.read_text())
+    for task in ("generation", "image"):
+        assert [r["threads"] for r in result["sweeps"][task]] == [1, 2]
+        assert result["best_alone"][task] in (1, 2)
+        assert result["models"][task] in (1, 2)
+    settings = json.loads(saved.read_text())
+    assert settings["models"] == result["models"]
+    assert settings["intra_op"] == max(result["best_alone"].values())
@@ -0,0 +1,39 @@
+# test_batching.py
+
+from model.batching import length_buckets, run_bucketed
+
+
+def test_buckets_group_similar_lengths():
+    lengths = [30, 5, 28, 6, 7, 31]
+    batches = list(length_buckets(lengths, batch_size=3))
+    assert batches == [[1, 3, 4], [2, 0, 5]]
+
+
+def test_token_budget_closes_batch_early():
+    lengths = [10, 10, 10, 40]
+    batches = list(length_buckets(lengths, batch_size=8, max_tokens=40))
+    # 3 × 10 fits; adding the 40-token item would need 4 × 40
+    assert batches == [[0, 1, 2], [3]]
+
+
+def test_every_index_once():
+    lengths = [3, 1, 4, 1, 5, 9, 2, 6]
+    seen = [i for batch in length_buckets(lengths, batch_size=3) for i in batch]
+    assert sorted(seen) == list(range(len(lengths)))
+
+
+def test_run_bucketed_keeps_input_order():
+    items = ["ccc", "a", "bb", "dddd"]
+    calls = []
+
+    def run(batch):
+        calls.append(batch)
+        return [s.upper() for s in batch]
+
+    out = run_bucketed(items, [len(s) for s in items], run, batch_size=2)
+    assert out == ["CCC", "A", "BB", "DDDD"]
+    assert calls == [["a", "bb"], ["ccc", "dddd"]]
+
+
+def test_run_bucketed_empty():
+    assert run_bucketed([], [], lambda batch: batch) == []
@@ -0,0 +1,32 @@
+# test_bench.py
+
+import json
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+import cli  # noqa: E402
+from model.summary_model import PRESETS  # noqa: E402
+from model.tasks import TASKS  # noqa: E402
+
+
+@pytest.mark.parametrize("task", TASKS)
+def test_bench_runs_each_task(task, bench_workdir, tmp_path, capsys):
+    out = tmp_path / "report.json"
+    argv = ["bench", "--tasks", task, "--samples", "2", "--repeats", "1",
+            "--batch-size", "2", "--workdir", bench_workdir, "--output", str(out)]
+    assert cli.main(argv) == 0
+    results = json.loads(out.read_text())["results"]
+    assert task in results
+    if task == "summarization":
+        # One extra run per preset, so latency can be compared across presets
+        assert set(results) == {task, *(f"summarization[{p}]" for p in PRESETS)}
+    for r in results.values():
+        assert r["latency_p50_ms"] > 0 and r["throughput_items_s"] > 0 and r["peak_rss_mb"] > 0
+
+    # The baseline comparison runs (timings are too noisy here to assert on)
+    baseline = tmp_path / "baseline.json"
+    out.rename(baseline)
+    assert cli.main(argv + ["--baseline", str(baseline), "--threshold", "1000"]) == 0
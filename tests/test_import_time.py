@@ -0,0 +1,12 @@
+# test_import_time.py
+
+import pytest
+
+from benchmarks.import_time import DEFAULT_TARGETS, check
+
+
+@pytest.mark.parametrize("target", DEFAULT_TARGETS)
+def test_entry_point_imports_stay_light(target):
+    (result,) = check([target])
+    assert result["ok"], result
+    assert result["heavy"] == []
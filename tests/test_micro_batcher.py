@@ -0,0 +1,64 @@
+# test_micro_batcher.py
+
+import threading
+
+import pytest
+
+from model.micro_batcher import MicroBatcher
+
+
+def _batcher(sizes, **kwargs):
+    def run_batch(items):
+        sizes.append(len(items))
+        return [x * 2 for x in items]
+    return MicroBatcher(run_batch, **kwargs)
+
+
+def test_requests_inside_window_share_a_batch():
+    sizes = []
+    batcher = _batcher(sizes, max_batch=8, window_ms=200)
+    futures = [batcher.submit(i) for i in range(3)]
+    assert [f.result(timeout=5) for f in futures] == [0, 2, 4]
+    assert sizes == [3]
+    batcher.close()
+
+
+def test_batch_closes_at_max_batch():
+    sizes, gate = [], threading.Event()
+
+    def run_batch(items):
+        gate.wait(5)
+        sizes.append(len(items))
+        return items
+
+    batcher = MicroBatcher(run_batch, max_batch=2, window_ms=1000)
+    futures = [batcher.submit(i) for i in range(5)]
+    gate.set()
+    assert [f.result(timeout=5) for f in futures] == list(range(5))
+    assert sizes == [2, 2, 1]
+    batcher.close()
+
+
+def test_window_expires_without_more_requests():
+    sizes = []
+    batcher = _batcher(sizes, max_batch=8, window_ms=10)
+    assert batcher.submit(1).result(timeout=5) == 2
+    assert batcher.submit(2).result(timeout=5) == 4
+    assert sizes == [1, 1]
+    batcher.close()
+
+
+def test_wrong_output_count_fails_every_request():
+    batcher = MicroBatcher(lambda items: [], max_batch=4, window_ms=50)
+    futures = [batcher.submit(i) for i in range(2)]
+    for f in futures:
+        with pytest.raises(RuntimeError):
+            f.result(timeout=5)
+    batcher.close()
+
+
+def test_closed_batcher_rejects_requests():
+    batcher = _batcher([], window_ms=1)
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(1)
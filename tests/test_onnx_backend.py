@@ -0,0 +1,57 @@
+# test_onnx_backend.py
+
+import os
+
+import pytest
+
+from model.onnx_backend import _publish, export_dir, onnx_bytes
+
+
+def _export(directory, size=10):
+    os.makedirs(directory)
+    with open(os.path.join(directory, "config.json"), "w") as f:
+        f.write("{}")
+    with open(os.path.join(directory, "model.onnx"), "wb") as f:
+        f.write(b"x" * size)
+
+
+def test_export_dir_is_filesystem_safe(tmp_path):
+    path = export_dir("facebook/bart-large-cnn", "abc-optimum1.0", str(tmp_path))
+    assert path == os.path.join(str(tmp_path), "facebook--bart-large-cnn", "abc-optimum1.0")
+
+
+def test_publish_moves_export(tmp_path):
+    tmp, path = str(tmp_path / "v1.tmp"), str(tmp_path / "v1")
+    _export(tmp)
+    _publish(tmp, path)
+    assert os.path.isfile(os.path.join(path, "config.json")) and not os.path.exists(tmp)
+
+
+def test_publish_keeps_concurrent_export(tmp_path):
+    tmp, path = str(tmp_path / "v1.tmp"), str(tmp_path / "v1")
+    _export(path, size=10)     # another process finished first
+    _export(tmp, size=20)
+    _publish(tmp, path)
+    assert os.path.getsize(os.path.join(path, "model.onnx")) == 10
+    assert not os.path.exists(tmp)
+
+
+def test_publish_raises_over_incomplete_export(tmp_path):
+    tmp, path = str(tmp_path / "v1.tmp"), str(tmp_path / "v1")
+    os.makedirs(path)
+    with open(os.path.join(path, "stray"), "w") as f:
+        f.write("x")
+    _export(tmp)
+    with pytest.raises(OSError):
+        _publish(tmp, path)
+
+
+def test_onnx_bytes_counts_graph_files(tmp_path):
+    _export(str(tmp_path / "m"), size=100)
+    with open(tmp_path / "m" / "model.onnx_data", "wb") as f:
+        f.write(b"x" * 50)
+
+    class Model:
+        onnx_export_dir = str(tmp_path / "m")
+
+    assert onnx_bytes(Model()) == 150
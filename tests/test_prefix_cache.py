@@ -0,0 +1,78 @@
+# test_prefix_cache.py
+
+from model.prefix_cache import PrefixKVCache, cache_bytes
+
+
+class FakeTensor:
+    """Stands in for a (batch, heads, seq, dim) key/value tensor."""
+
+    def __init__(self, seq):
+        self.seq = seq
+
+    def nelement(self):
+        return self.seq * 8
+
+    def element_size(self):
+        return 4
+
+    def __getitem__(self, index):   # t[..., :length, :]
+        return FakeTensor(index[-2].stop)
+
+
+def past(seq, layers=2):
+    return tuple((FakeTensor(seq), FakeTensor(seq)) for _ in range(layers))
+
+
+def test_cache_bytes():
+    assert cache_bytes(past(10)) == 2 * 2 * 10 * 8 * 4
+
+
+def test_longest_common_prefix_is_cropped():
+    cache = PrefixKVCache(min_tokens=3)
+    cache.store(range(10), past(10))
+    states, n = cache.lookup([0, 1, 2, 3, 4, 99, 98])
+    assert n == 5
+    assert all(t.seq == 5 for layer in states for t in layer)
+    assert cache.saved_tokens == 5 and cache.hits == 1
+
+
+def test_lookup_picks_longest_entry_and_respects_limit():
+    cache = PrefixKVCache(min_tokens=2)
+    cache.store([1, 2, 3], past(3))
+    cache.store([1, 2, 3, 4, 5, 6], past(6))
+    assert cache.lookup([1, 2, 3, 4, 5, 6, 7])[1] == 6
+    assert cache.lookup([1, 2, 3, 4, 5, 6], limit=5)[1] == 5
+
+
+def test_short_prefix_is_a_miss():
+    cache = PrefixKVCache(min_tokens=4)
+    cache.store(range(10), past(10))
+    assert cache.lookup([0, 1, 2, 50]) == (None, 0)
+    assert cache.misses == 1
+
+
+def test_lookup_returns_a_copy():
+    cache = PrefixKVCache(min_tokens=2)
+    cache.store(range(6), past(6))
+    states, _ = cache.lookup([0, 1, 2, 9])
+    states[0][0].seq = 999
+    again, n = cache.lookup(range(6), limit=6)
+    assert n == 6 and again[0][0].seq == 6
+
+
+def test_lru_eviction_by_bytes():
+    one = cache_bytes(past(10))
+    cache = PrefixKVCache(max_bytes=2 * one, min_tokens=2)
+    cache.store(range(10), past(10))
+    cache.store(range(100, 110), past(10))
+    cache.lookup(range(10))                     # first entry is now most recent
+    cache.store(range(200, 210), past(10))      # evicts the second
+    assert len(cache) == 2 and cache.bytes == 2 * one and cache.evictions == 1
+    assert cache.lookup(range(100, 110))[1] == 0
+    assert cache.lookup(range(10))[1] == 10
+
+
+def test_entries_over_budget_are_not_stored():
+    cache = PrefixKVCache(max_bytes=10, min_tokens=2)
+    cache.store(range(10), past(10))
+    assert len(cache) == 0
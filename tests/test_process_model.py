@@ -0,0 +1,103 @@
+# test_process_model.py
+
+import io
+import os
+import time
+
+import pytest
+
+from model.base_model import DETERMINISTIC, STREAMING, ModelAdapter
+from model.process_model import ProcessModel, RemoteError, WorkerCrashed
+
+
+class FakeAdapter(ModelAdapter):
+    task = "fake"
+    capabilities = frozenset({STREAMING, DETERMINISTIC})
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.load()
+
+    def _load(self):
+        pass
+
+    def _unload(self):
+        pass
+
+    def run(self, item, **params):
+        if item == "crash":
+            os._exit(3)
+        if item == "boom":
+            raise ValueError("bad input")
+        if isinstance(item, io.BytesIO):
+            return f"bytes:{len(item.getvalue())}"
+        return item.upper()
+
+    def stream(self, item, delay: float = 0.0, **params):
+        for word in item.split():
+            time.sleep(delay)
+            yield word + " "
+
+    def get_model_name(self):
+        return "Fake"
+
+
+def fake_loader(task, lang, precision, backend, model_name, options=None):
+    return FakeAdapter()
+
+
+@pytest.fixture
+def proxy():
+    pm = ProcessModel("fake", loader=fake_loader)
+    yield pm
+    pm.unload()
+
+
+def test_run_in_worker(proxy):
+    assert proxy.run("hello") == "HELLO"
+    assert proxy.run(io.BytesIO(b"x" * 1000)) == "bytes:1000"   # via shared memory
+    assert proxy.pid != os.getpid()
+    assert proxy.supports(STREAMING) and proxy.get_model_name() == "Fake"
+
+
+def test_remote_errors(proxy):
+    with pytest.raises(RemoteError, match="bad input"):
+        proxy.run("boom")
+    assert proxy.run("ok") == "OK"
+
+
+def test_crash_restarts_worker(proxy):
+    with pytest.raises(WorkerCrashed):
+        proxy.run("crash")
+    assert proxy.run("again") == "AGAIN"
+    assert proxy.restarts == 1
+
+
+def test_stream(proxy):
+    assert "".join(proxy.stream("a b c")) == "a b c "
+
+
+def test_closing_stream_stops_worker(proxy):
+    words = " ".join(str(i) for i in range(200))
+    pieces = proxy.stream(words, delay=0.02)   # ~4 s if it ran to the end
+    assert next(pieces) == "0 "
+    pieces.close()
+    start = time.perf_counter()
+    assert proxy.run("next") == "NEXT"
+    assert time.perf_counter() - start < 2
+
+
+def test_stale_cancel_does_not_break_other_streams(proxy):
+    pieces = proxy.stream("a b c d e", delay=0.05)
+    assert next(pieces) == "a "
+    # A cancel tagged with another request's id is dropped by the worker
+    with proxy._send_lock:
+        proxy._conn.send(("cancel", 12345))
+    assert "".join(pieces) == "b c d e "
+
+
+def test_cancel_after_request_ends_sends_nothing(proxy):
+    sent = []
+    proxy._request("run", ("x",), {}, on_sent=sent.append)
+    proxy._cancel(sent[0])       # request already returned: must be a no-op
+    assert "".join(proxy.stream("a b")) == "a b "
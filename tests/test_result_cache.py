@@ -0,0 +1,78 @@
+# test_result_cache.py
+
+import os
+
+from model.result_cache import ResultCache
+
+
+def _key(n):
+    return ResultCache.make_key("model", "task", {}, payload=f"input {n}")
+
+
+def _disk_size(cache):
+    return sum(size for _, size, _ in cache._disk_files())
+
+
+def test_memory_tier_lru():
+    cache = ResultCache(max_items=2, disk_dir=None)
+    cache.put(_key(1), "one")
+    cache.put(_key(2), "two")
+    cache.get(_key(1))              # 1 is now most recent
+    cache.put(_key(3), "three")     # evicts 2
+    assert cache.get(_key(1)) == (True, "one")
+    assert cache.get(_key(2)) == (False, None)
+    assert cache.memory_hits == 1 + 1 and cache.misses == 1
+
+
+def test_key_covers_params_and_input():
+    base = ResultCache.make_key("m", "t", {"max_length": 10}, payload="x")
+    assert base == ResultCache.make_key("m", "t", {"max_length": 10}, payload="x")
+    assert base != ResultCache.make_key("m", "t", {"max_length": 11}, payload="x")
+    assert base != ResultCache.make_key("m", "t", {"max_length": 10}, payload="y")
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    ResultCache(disk_dir=str(tmp_path)).put(_key(1), {"label": "cat"})
+    fresh = ResultCache(disk_dir=str(tmp_path))
+    assert fresh.get(_key(1)) == (True, {"label": "cat"})
+    assert fresh.disk_hits == 1
+
+
+def test_overwrite_does_not_inflate_disk_bytes(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path))
+    cache.put(_key(1), "short")
+    for _ in range(20):
+        cache.put(_key(1), "a longer value " * 10)
+    assert cache._disk_bytes == _disk_size(cache)
+    assert not [f for _, _, files in os.walk(tmp_path) for f in files if f.endswith(".tmp")]
+
+
+def test_disk_tier_trims_oldest(tmp_path):
+    cache = ResultCache(max_items=1, disk_dir=str(tmp_path), max_disk_bytes=600)
+    for n in range(20):
+        cache.put(_key(n), "x" * 50)
+    assert _disk_size(cache) <= 600
+    assert cache._disk_bytes == _disk_size(cache)
+    assert cache.get(_key(19))[0]
+
+
+def test_run_batch_only_computes_misses():
+    cache = ResultCache(disk_dir=None)
+    cache.put("k2", "cached")
+    seen = []
+
+    def batch_fn(items):
+        seen.extend(items)
+        return [i * 10 for i in items]
+
+    out = cache.run_batch([1, 2, 3], key_fn=lambda i: f"k{i}", batch_fn=batch_fn)
+    assert out == [10, "cached", 30]
+    assert seen == [1, 3]
+
+
+def test_non_json_results_stay_in_memory(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path))
+    value = object()
+    cache.put(_key(1), value)
+    assert cache.get(_key(1)) == (True, value)
+    assert _disk_size(cache) == 0
@@ -0,0 +1,59 @@
+# test_scheduler.py
+
+import threading
+
+import pytest
+
+from model.scheduler import JobScheduler, Priority
+
+
+@pytest.fixture
+def scheduler():
+    s = JobScheduler()
+    yield s
+    s.shutdown(wait=False)
+
+
+def test_job_gets_lane_instance(scheduler):
+    scheduler.register("m", instance="model-a")
+    assert scheduler.submit("m", lambda model, x: f"{model}:{x}", 1).result(timeout=5) == "model-a:1"
+
+
+def test_interactive_jobs_run_before_queued_batch_jobs(scheduler):
+    scheduler.register("m", instance=object())
+    gate, order = threading.Event(), []
+
+    # Occupy the only worker so the next jobs queue up
+    blocker = scheduler.submit("m", lambda model: gate.wait(5))
+    batch = [scheduler.submit("m", lambda model, i=i: order.append(f"batch{i}"),
+                              priority=Priority.BATCH) for i in range(2)]
+    interactive = scheduler.submit("m", lambda model: order.append("interactive"))
+    gate.set()
+    for f in [blocker, *batch, interactive]:
+        f.result(timeout=5)
+    assert order == ["interactive", "batch0", "batch1"]
+
+
+def test_lanes_run_in_parallel(scheduler):
+    scheduler.register("slow", instance=object())
+    scheduler.register("fast", instance=object())
+    gate = threading.Event()
+    slow = scheduler.submit("slow", lambda model: gate.wait(5))
+    assert scheduler.submit("fast", lambda model: "done").result(timeout=5) == "done"
+    gate.set()
+    assert slow.result(timeout=5) is True
+
+
+def test_errors_reach_the_future(scheduler):
+    scheduler.register("m", instance=object())
+
+    def fail(model):
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError, match="bad input"):
+        scheduler.submit("m", fail).result(timeout=5)
+
+
+def test_concurrency_needs_replicas_or_factory(scheduler):
+    with pytest.raises(ValueError):
+        scheduler.register("m", instance=object(), concurrency=2)
@@ -0,0 +1,55 @@
+# test_server.py
+
+import pytest
+
+from server import DEFAULT_PRESET, BadRequest, parse_request, resolve_lang
+
+
+def test_defaults_fill_missing_params():
+    task, item, params = parse_request("/v1/summarize", {"text": "Some text."})
+    assert (task, item) == ("summarization", "Some text.")
+    assert params == {"max_length": 150, "min_length": 40, "preset": DEFAULT_PRESET}
+
+
+def test_valid_params_pass_through():
+    _, _, params = parse_request("/v1/generate", {"text": "Hi", "max_length": 80, "do_sample": False})
+    assert params == {"max_length": 80, "do_sample": False}
+
+
+@pytest.mark.parametrize("value", ["false", "0", 0, 1, None])
+def test_booleans_must_be_json_booleans(value):
+    with pytest.raises(BadRequest, match="do_sample"):
+        parse_request("/v1/generate", {"text": "Hi", "do_sample": value})
+
+
+@pytest.mark.parametrize("value", [0, -5, 5000, "80", 8.5, True])
+def test_lengths_must_be_positive_integers(value):
+    with pytest.raises(BadRequest, match="max_length"):
+        parse_request("/v1/generate", {"text": "Hi", "max_length": value})
+
+
+def test_min_length_must_not_exceed_max_length():
+    with pytest.raises(BadRequest, match="min_length"):
+        parse_request("/v1/summarize", {"text": "x", "max_length": 20, "min_length": 30})
+    # The default min_length is left for the summarizer to clamp
+    assert parse_request("/v1/summarize", {"text": "x", "max_length": 20})[2]["max_length"] == 20
+
+
+def test_unknown_fields_and_presets_are_rejected():
+    with pytest.raises(BadRequest, match="temperature"):
+        parse_request("/v1/generate", {"text": "Hi", "temperature": 2})
+    with pytest.raises(BadRequest, match="preset"):
+        parse_request("/v1/summarize", {"text": "Hi", "preset": "turbo"})
+
+
+def test_inputs_are_required():
+    with pytest.raises(BadRequest):
+        parse_request("/v1/summarize", {"text": "   "})
+    with pytest.raises(BadRequest):
+        parse_request("/v1/classify", {"image_base64": "not base64!"})
+
+
+def test_lang_is_validated():
+    assert parse_request("/v1/translate", {"text": "Hi", "lang": "german"})[2] == {"lang": "German"}
+    with pytest.raises(BadRequest):
+        resolve_lang("Klingon")
@@ -0,0 +1,57 @@
+# test_text.py
+
+from model.translation_model import TranslationModelAdapter
+from Utils.text import split_sentences, split_words
+
+
+def test_split_sentences():
+    text = 'Dr. Smith went home. He said "Hi." Then he left! Was it 5 p.m.? Yes, e.g. Fine.'
+    assert split_sentences(text) == [
+        "Dr. Smith went home.", 'He said "Hi."', "Then he left!", "Was it 5 p.m.?",
+        "Yes, e.g. Fine.",
+    ]
+
+
+def test_initials_do_not_end_a_sentence():
+    assert split_sentences("J. Doe agreed. It rained.") == ["J. Doe agreed.", "It rained."]
+
+
+def test_lowercase_after_period_is_not_a_boundary():
+    assert split_sentences("Version 2.0 is out. see notes.") == ["Version 2.0 is out. see notes."]
+
+
+def test_split_words():
+    assert split_words("a b c d e", 2) == ["a b", "c d", "e"]
+    assert split_words("a b", 5) == ["a b"]
+
+
+def _plan(text, max_words=120):
+    adapter = TranslationModelAdapter.__new__(TranslationModelAdapter)
+    adapter.MAX_SEGMENT_WORDS = max_words
+    index, segments = {}, []
+    template = adapter._plan(text, index, segments)
+    return template, segments
+
+
+def _render(template, segments, translate=lambda s: s):
+    return "".join(translate(segments[t]) if isinstance(t, int) else t for t in template)
+
+
+def test_plan_round_trip_keeps_layout():
+    text = "First one. Second one.\n  Indented line.\n\n\nNew paragraph here."
+    template, segments = _plan(text)
+    assert _render(template, segments) == text
+    assert _render(template, segments, str.upper) == text.upper()
+
+
+def test_plan_translates_repeats_once():
+    template, segments = _plan("Hello there. Hello there.\n\nHello there.")
+    assert segments == ["Hello there."]
+    assert sum(isinstance(t, int) for t in template) == 3
+
+
+def test_plan_splits_long_sentences():
+    sentence = " ".join(f"w{i}" for i in range(10))
+    template, segments = _plan(sentence, max_words=4)
+    assert [len(s.split()) for s in segments] == [4, 4, 2]
+    assert _render(template, segments) == sentence